@@ -15,87 +15,239 @@ Enhanced with retry logic, audio export, and OCM cultural classifications.
 
 import streamlit as st
 import json
+import bisect
+import hashlib
+import importlib.util
+import io
 import os
 import sys
+import tempfile
 import time
 import random
+import re
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime, timedelta
+from functools import cached_property
+from itertools import accumulate, chain
 
 # Add parent directory to path to import shared utilities
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.retry import RetryConfig
+from utils.media_cache import LRUMediaCache
+from utils.precache import PrecacheManager, PrecacheConfig
+from utils.word_bitset import WordBitset
+from utils.tts_session import new_tts_session, stream_tts
+from static_content import (
+    BIRDS,
+    QUIZ_QUESTIONS,
+    QUIZ_ANSWERS,
+    FEED_ENTRIES,
+    PDF_RESOURCES,
+    AUDIO_RESOURCES,
+    TEXT_RESOURCES,
+    SPECIAL_LETTERS,
+    ALPHABET_REFERENCE,
+    RELATION_LABELS,
+    REVIEW_REFLECTION_PROMPTS,
+    INDEPENDENCE_INTRO_HTML,
+    KIERKEGAARD_CATEGORIES_HTML,
+    WITTGENSTEIN_LIMIT_HTML,
+)
+from content_models import Station, Reason, GeographyOverview, City, Landmark, Fact, SpecialLetter
+from html_templates import (
+    CULTURAL_FACT_CARD_TPL,
+    FACT_CARD_TPL,
+    FEED_CARD_TPL,
+    PROVERB_CARD_TPL,
+    TIMELINE_EVENT_TPL,
+    render_legacy_proverb_html,
+    render_epic_proverb_html,
+    render_alphabet_grid_html,
+    render_tv_guide_html,
+    render_sample_videos_html,
+    render_vocab_row_html,
+    render_stat_row_html,
+    render_category_row_html,
+    render_station_card_html,
+    render_reason_card_html,
+)
 
 # --- Audio Setup with Retry Logic ---
+# Heavy optional dependencies are only probed here; they are imported on first use.
+AUDIO_AVAILABLE = importlib.util.find_spec("gtts") is not None
+
+# BLAKE3 is optional; hashlib.blake2b is the fallback
 try:
-    from gtts import gTTS
-    import hashlib
-    AUDIO_AVAILABLE = True
+    import blake3
+    BLAKE3_AVAILABLE = True
 except ImportError:
-    AUDIO_AVAILABLE = False
+    BLAKE3_AVAILABLE = False
 
-# --- Translation Setup ---
+# --- Fast JSON parsing (orjson optional, stdlib fallback) ---
 try:
-    from deep_translator import GoogleTranslator
-    TRANSLATION_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
+    json_loads = orjson.loads
 except ImportError:
-    TRANSLATION_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+    json_loads = json.loads
+
 
-# --- Speech Recognition Setup (Whisper) ---
+def json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes with stable key order."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NAIVE_UTC)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True).encode('utf-8')
+
+# --- Multi-keyword matching (pyahocorasick optional, compiled-regex fallback) ---
 try:
-    import whisper
-    WHISPER_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    WHISPER_AVAILABLE = False
+    AHOCORASICK_AVAILABLE = False
+
+# --- Translation Setup ---
+TRANSLATION_AVAILABLE = importlib.util.find_spec("deep_translator") is not None
+
+# --- Speech Recognition Setup (faster-whisper, CTranslate2 int8) ---
+WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
+
+# --- Map data (pandas, imported when the Geography map is first built) ---
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+
+def retry_delay_schedule(config: RetryConfig) -> tuple:
+    """
+    Precompute the backoff delays for a retry loop.
+
+    The trailing None marks the final attempt, after which callers give up.
+    """
+    return tuple(
+        config.base_delay * (config.exponential_base ** attempt)
+        for attempt in range(config.max_retries)
+    ) + (None,)
+
+
+# 2s, 4s, 8s, 16s for network calls; 4s, 8s, 16s, 32s for model downloads
+AUDIO_RETRY_DELAYS = retry_delay_schedule(RetryConfig(max_retries=4, base_delay=2.0, exponential_base=2.0))
+MODEL_RETRY_DELAYS = retry_delay_schedule(RetryConfig(max_retries=4, base_delay=4.0, exponential_base=2.0))
 
 # Create audio cache directory
 AUDIO_CACHE_DIR = Path(__file__).parent / "audio_cache"
 AUDIO_CACHE_DIR.mkdir(exist_ok=True)
+AUDIO_CACHE_MAX_BYTES = 100 * 1024 * 1024  # 100 MB
+AUDIO_STREAM_THRESHOLD = 1024 * 1024  # Larger cached files are streamed by path
 
 
-def generate_audio_with_retry(text: str, slow: bool = True, language: str = 'ru') -> bytes:
+@st.cache_resource
+def get_audio_cache() -> LRUMediaCache:
+    """Shared size-capped LRU cache over AUDIO_CACHE_DIR."""
+    return LRUMediaCache(AUDIO_CACHE_DIR, max_bytes=AUDIO_CACHE_MAX_BYTES)
+
+
+def audio_cache_key(text: str, slow: bool = True, language: str = 'ru') -> str:
     """
-    Generate audio for Bashkir text with retry logic and caching.
+    Build the audio cache key for a TTS request.
 
-    Uses exponential backoff: 2s, 4s, 8s, 16s delays between retries.
-    Returns audio bytes or None if generation fails.
+    Text is normalized (whitespace collapsed, lowercased) so equivalent
+    prompts share a file; speed and language are part of the key so variants don't collide.
     """
-    if not AUDIO_AVAILABLE:
-        return None
+    norm = " ".join(text.split()).lower()
+    h = blake3.blake3() if BLAKE3_AVAILABLE else hashlib.blake2b(digest_size=16)
+    h.update(f"{language}:{int(slow)}:{norm}".encode('utf-8'))
+    return h.hexdigest(16) if BLAKE3_AVAILABLE else h.hexdigest()
 
-    config = RetryConfig(
-        max_retries=4,
-        base_delay=2.0,
-        exponential_base=2.0,
-    )
 
+def _synthesize_to_cache(text: str, slow: bool, language: str, audio_cache: LRUMediaCache, tts_session) -> bytes:
+    """
+    Return audio for text from the disk cache, synthesizing it on a miss.
+
+    Makes no Streamlit calls, so it is safe to run on background threads.
+    Raises on final failure.
+    """
     # Create a cached filename based on text hash
-    text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
-    cache_file = AUDIO_CACHE_DIR / f"{text_hash}.mp3"
+    text_hash = audio_cache_key(text, slow, language)
 
     # Return cached version if available
-    if cache_file.exists():
-        with open(cache_file, 'rb') as f:
-            return f.read()
+    cached = audio_cache.get(text_hash)
+    if cached is not None:
+        return cached
+
+    from gtts import gTTS
 
     # Generate with retry logic
-    for attempt in range(config.max_retries + 1):
+    for delay in AUDIO_RETRY_DELAYS:
         try:
             tts = gTTS(text=text, lang=language, slow=slow)
-            tts.save(str(cache_file))
-
-            with open(cache_file, 'rb') as f:
-                return f.read()
+            data = b"".join(stream_tts(tts, tts_session))
+            audio_cache[text_hash] = data
+            return data
 
-        except Exception as e:
-            if attempt >= config.max_retries:
-                return None
+        except Exception:
+            if delay is None:
+                raise
 
-            delay = config.base_delay * (config.exponential_base ** attempt)
             time.sleep(delay)
 
-    return None
+
+@st.cache_resource(max_entries=2048, show_spinner=False)
+def _generate_audio_cached(text: str, slow: bool, language: str) -> bytes:
+    """
+    In-memory memo over the disk cache, keyed by (text, slow, language).
+
+    Raises on final failure so failed generations are not memoized.
+    """
+    return _synthesize_to_cache(text, slow, language, get_audio_cache(), get_tts_session())
+
+
+@st.cache_resource(show_spinner=False)
+def get_tts_session():
+    """Keep-alive HTTP session shared by every gTTS request, foreground and background."""
+    return new_tts_session(pool_maxsize=16)
+
+
+@st.cache_resource(show_spinner=False)
+def get_audio_precacher() -> PrecacheManager:
+    """Background worker pool that warms the disk cache ahead of playback."""
+    audio_cache = get_audio_cache()
+    tts_session = get_tts_session()
+    manager = PrecacheManager(PrecacheConfig(max_workers=8))
+    manager.set_audio_generator(
+        lambda text, language: _synthesize_to_cache(text, True, language, audio_cache, tts_session)
+    )
+    manager.start()
+    return manager
+
+
+def prefetch_audio(texts, language: str = 'ru'):
+    """Queue slow-speed audio for texts not yet on disk (fire-and-forget)."""
+    if not AUDIO_AVAILABLE:
+        return
+
+    audio_cache = get_audio_cache()
+    pending = [t for t in texts if t and audio_cache_key(t, True, language) not in audio_cache]
+    if pending:
+        get_audio_precacher().add_batch_audio_tasks(pending, language=language)
+
+
+def generate_audio_with_retry(text: str, slow: bool = True, language: str = 'ru') -> bytes:
+    """
+    Generate audio for Bashkir text with retry logic and caching.
+
+    Uses exponential backoff: 2s, 4s, 8s, 16s delays between retries.
+    Returns audio bytes or None if generation fails.
+    """
+    text = " ".join(text.split())
+    if not AUDIO_AVAILABLE or not text:
+        return None
+
+    try:
+        return _generate_audio_cached(text, slow, language)
+    except Exception:
+        return None
 
 
 def play_audio(text: str, slow: bool = True, language: str = 'ru'):
@@ -104,6 +256,16 @@ def play_audio(text: str, slow: bool = True, language: str = 'ru'):
         st.warning("🔇 Audio unavailable. Install with: `pip install gTTS`")
         return
 
+    text = " ".join(text.split())
+    if not text:
+        return
+
+    # Long cached passages are served from disk by Streamlit, not read into memory
+    cache_file = get_audio_cache().path_for(audio_cache_key(text, slow, language))
+    if cache_file.exists() and cache_file.stat().st_size > AUDIO_STREAM_THRESHOLD:
+        st.audio(str(cache_file), format='audio/mp3')
+        return
+
     audio_bytes = generate_audio_with_retry(text, slow, language)
 
     if audio_bytes:
@@ -112,74 +274,174 @@ def play_audio(text: str, slow: bool = True, language: str = 'ru'):
         st.error("🔇 Audio generation failed after multiple attempts.")
 
 
-def translate_text(text: str, source: str = 'en', target: str = 'ru') -> str:
+def listen_player(text: str, key: str, slow: bool = True, label: str = "🔊 Listen"):
     """
-    Translate text with retry logic.
+    Collapsible audio player for a fixed word.
 
-    Uses exponential backoff: 2s, 4s, 8s, 16s delays between retries.
+    Clips already on disk are embedded as st.audio, so listening needs no
+    button-triggered rerun. Uncached clips are queued for background
+    generation and fall back to a Hear button until they are ready.
     """
-    if not TRANSLATION_AVAILABLE:
-        return text
+    text = " ".join(text.split())
+    if not text:
+        return
+
+    with st.expander(label, expanded=False):
+        if AUDIO_AVAILABLE and audio_cache_key(text, slow) in get_audio_cache():
+            audio_bytes = generate_audio_with_retry(text, slow)
+            if audio_bytes:
+                st.audio(audio_bytes, format='audio/mp3')
+                return
+
+        if slow:
+            prefetch_audio([text])
+        if st.button("🔊 Hear", key=key):
+            play_audio(text, slow)
+
 
-    config = RetryConfig(
-        max_retries=4,
-        base_delay=2.0,
-        exponential_base=2.0,
+def audio_download_button(text: str, file_name: str, label: str, key=None, slow: bool = True):
+    """
+    MP3 download button whose audio is produced only when it is clicked.
+
+    Rendering a page of these makes no gTTS requests; the clip is queued for
+    background generation so the click is usually served from the cache.
+    """
+    text = " ".join(text.split())
+    if not AUDIO_AVAILABLE or not text:
+        return
+
+    if slow:
+        prefetch_audio([text])
+    st.download_button(
+        label=label,
+        data=lambda: generate_audio_with_retry(text, slow) or b"",
+        file_name=file_name,
+        mime="audio/mp3",
+        key=key,
     )
 
-    for attempt in range(config.max_retries + 1):
+
+@st.cache_resource(show_spinner=False)
+def get_translator(source: str = 'en', target: str = 'ru'):
+    """Reuse one GoogleTranslator (and its HTTP session) per language pair."""
+    from deep_translator import GoogleTranslator
+    return GoogleTranslator(source=source, target=target)
+
+
+@st.cache_data(max_entries=4096, show_spinner=False)
+def _translate_cached(text: str, source: str, target: str) -> str:
+    """
+    Translate with retry logic; results are memoized per (text, source, target).
+
+    Raises on final failure so failed lookups are not cached.
+    """
+    for delay in AUDIO_RETRY_DELAYS:
         try:
-            translator = GoogleTranslator(source=source, target=target)
-            return translator.translate(text)
-        except Exception as e:
-            if attempt >= config.max_retries:
-                return text  # Return original on failure
+            return get_translator(source, target).translate(text)
+        except Exception:
+            if delay is None:
+                raise
 
-            delay = config.base_delay * (config.exponential_base ** attempt)
             time.sleep(delay)
 
-    return text
 
+def translate_text(text: str, source: str = 'en', target: str = 'ru') -> str:
+    """
+    Translate text with retry logic.
+
+    Uses exponential backoff: 2s, 4s, 8s, 16s delays between retries.
+    """
+    stripped = text.strip()
+    if not TRANSLATION_AVAILABLE or not stripped:
+        return text
 
-@st.cache_resource
+    try:
+        return _translate_cached(stripped, source, target)
+    except Exception:
+        return text  # Return original on failure
+
+
+@st.cache_resource(show_spinner=False)
 def load_whisper_model():
-    """Load Whisper model with caching for speech recognition."""
+    """Load the int8-quantized faster-whisper model with caching for speech recognition."""
     if not WHISPER_AVAILABLE:
         return None
 
-    config = RetryConfig(
-        max_retries=4,
-        base_delay=4.0,
-        exponential_base=2.0,
-    )
+    from faster_whisper import WhisperModel
 
-    for attempt in range(config.max_retries + 1):
+    for delay in MODEL_RETRY_DELAYS:
         try:
-            return whisper.load_model("base")
+            return WhisperModel("base", device="cpu", compute_type="int8")
         except Exception as e:
-            if attempt >= config.max_retries:
+            if delay is None:
                 return None
 
-            delay = config.base_delay * (config.exponential_base ** attempt)
             time.sleep(delay)
 
     return None
 
 
-def transcribe_audio(audio_path: str) -> str:
-    """Transcribe audio file using Whisper."""
-    if not WHISPER_AVAILABLE:
-        return ""
+def transcribe_segments(audio_path: str, language=None) -> tuple:
+    """
+    Transcribe an audio file with faster-whisper.
+
+    Returns a tuple of (start_seconds, end_seconds, text) segments; empty
+    when Whisper is unavailable. ``language`` is a Whisper language code, or
+    None to auto-detect. Raises if the model cannot be loaded or the file
+    cannot be transcribed.
+    """
+    if not WHISPER_AVAILABLE or not audio_path:
+        return ()
 
     model = load_whisper_model()
     if model is None:
-        return ""
+        raise RuntimeError("the Whisper model could not be loaded")
+
+    segments, _ = model.transcribe(audio_path, language=language)
+    return tuple((segment.start, segment.end, segment.text.strip()) for segment in segments)
+
+
+def transcribe_audio(audio_path: str) -> str:
+    """Transcribe audio file using faster-whisper."""
+    return " ".join(text for _, _, text in transcribe_segments(audio_path))
 
+
+@st.cache_resource(show_spinner=False)
+def get_transcription_executor() -> ThreadPoolExecutor:
+    """Worker pool running uploaded-media transcriptions off the script thread."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="transcribe")
+
+
+def _transcribe_upload(data: bytes, suffix: str, language=None) -> tuple:
+    """Worker job: spool an uploaded file to disk and transcribe it; errors surface via the future."""
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        tmp.write(data)
     try:
-        result = model.transcribe(audio_path)
-        return result.get('text', '')
-    except Exception as e:
-        return ""
+        return transcribe_segments(tmp.name, language)
+    finally:
+        os.unlink(tmp.name)
+
+
+def _timestamp(seconds: float, srt: bool = False) -> str:
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    if srt:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def format_transcript(segments, output_format: str) -> str:
+    """Render transcription segments as plain text, timestamped lines or SRT."""
+    if output_format == "With Timestamps":
+        return "\n".join(f"[{_timestamp(start)}] {text}" for start, _, text in segments)
+    if output_format == "SRT Subtitles":
+        return "\n\n".join(
+            f"{n}\n{_timestamp(start, srt=True)} --> {_timestamp(end, srt=True)}\n{text}"
+            for n, (start, end, text) in enumerate(segments, 1)
+        )
+    return " ".join(text for _, _, text in segments)
 
 # Page configuration
 st.set_page_config(
@@ -190,563 +452,1164 @@ st.set_page_config(
 )
 
 # --- Data Loading ---
-@st.cache_data
+def _normalize_relation_target(target) -> dict:
+    """BashkortNet relation target as a dict with 'target', 'gloss' and 'note' keys."""
+    if isinstance(target, dict):
+        return {
+            **target,
+            'target': target.get('target', target.get('gloss', str(target))),
+            'gloss': target.get('gloss', ''),
+            'note': target.get('note', ''),
+        }
+    return {'target': str(target), 'gloss': '', 'note': ''}
+
+@st.cache_data(persist="disk", show_spinner=False)
 def load_words():
     """Load vocabulary data."""
     data_path = Path(__file__).parent / "data" / "words.json"
-    with open(data_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(data_path, 'rb') as f:
+        words = json_loads(f.read())
+    for word_id, word in enumerate(words):
+        # Positional id used by the learned-word bitset
+        word['word_id'] = word_id
+        # Relation targets are plain headwords or dicts; give them one shape
+        relations = word.get('bashkortnet', {}).get('relations')
+        if relations:
+            for rel_type, targets in relations.items():
+                relations[rel_type] = [_normalize_relation_target(t) for t in targets]
+    return words
+
+@st.cache_resource(show_spinner=False)
+def load_words_by_bashkir():
+    """
+    Index vocabulary by Bashkir headword for O(1) lookups (shared, read-only).
+
+    A repeated headword keeps its first record, matching load_word_positions,
+    so a record's word_id is always the bit learned_words sets for it.
+    """
+    index = {}
+    for w in load_words():
+        index.setdefault(w['bashkir'], w)
+    return index
+
+@st.cache_resource(show_spinner=False)
+def load_word_positions():
+    """Map Bashkir headword -> word_id (bit position in learned_words); a repeated headword keeps its first id."""
+    positions = {}
+    for w in load_words():
+        positions.setdefault(w['bashkir'], w['word_id'])
+    return positions
+
+@st.cache_resource(show_spinner=False)
+def load_word_headwords():
+    """Bashkir headword for each word_id, indexed by id (shared, read-only)."""
+    words = load_words()
+    headwords = [None] * (max((w['word_id'] for w in words), default=-1) + 1)
+    for w in words:
+        headwords[w['word_id']] = w['bashkir']
+    return tuple(headwords)
+
+@st.cache_resource(show_spinner=False)
+def load_words_by_ocm_code():
+    """Index vocabulary by OCM code (as str), codes in sorted order (shared, read-only)."""
+    index = {}
+    for w in load_words():
+        for code in dict.fromkeys(str(c) for c in w.get('cultural_context', {}).get('ocm_codes', [])):
+            index.setdefault(code, []).append(w)
+    return MappingProxyType({code: tuple(index[code]) for code in sorted(index)})
+
+@st.cache_resource(show_spinner=False)
+def load_word_select_options():
+    """
+    Headwords in dictionary order and their "bashkir (english)" labels, for
+    word pickers; built once so a selectbox formats each option by lookup.
+    """
+    labels = MappingProxyType({b: f"{b} ({w.get('english', '?')})" for b, w in load_words_by_bashkir().items()})
+    return tuple(labels), labels
+
+@st.cache_resource(show_spinner=False)
+def load_search_index():
+    """
+    Lowercased (word, bashkir, english, russian) rows for dictionary search.
+
+    Returns the rows and the longest lowercased field, so a query longer than
+    every field can be rejected without scanning.
+    """
+    rows = tuple(
+        (w, w['bashkir'].lower(), w.get('english', '').lower(), w.get('russian', '').lower())
+        for w in load_words()
+    )
+    longest = max((len(field) for row in rows for field in row[1:]), default=0)
+    return rows, longest
+
+# Escape quotes, backslashes and newlines in Cypher string literals in one
+# C-level pass per string (an unescaped trailing backslash would eat the quote)
+_CYPHER_ESCAPE = str.maketrans({"'": "\\'", "\\": "\\\\", "\n": "\\n"})
+
+@st.cache_data(show_spinner=False)
+def build_cypher_export() -> str:
+    """Neo4j Cypher export of every word and its BashkortNet relations."""
+    out = io.StringIO()
+    out.write("// Neo4j Cypher statements for BashkortNet\n")
+    out.write("// Run these in Neo4j Browser or neo4j-admin\n\n")
+    for word in load_words():
+        bashkir = word['bashkir'].translate(_CYPHER_ESCAPE)
+        english = word.get('english', '').translate(_CYPHER_ESCAPE)
+        out.write(f"CREATE (w:Word {{bashkir: '{bashkir}', english: '{english}', pos: '{word.get('pos', 'noun').translate(_CYPHER_ESCAPE)}'}})\n")
+
+        # Add relations
+        relations = word.get('bashkortnet', {}).get('relations', {})
+        for rel_type, targets in relations.items():
+            for target in targets:
+                target_word = target['target'].translate(_CYPHER_ESCAPE)
+                if target_word:
+                    out.write(f"// {bashkir} -{rel_type}-> {target_word}\n")
+    return out.getvalue()
+
+# OCM codes and keywords sorting nouns into Sentence Builder word-bank categories
+_NATURE_OCM = frozenset(['131', '132', '133', '134', '137', '138', '139', '221', '222', '231', '232', '233', '234', '235', '241', '242', '243', '244', '245', '246', '251', '252', '253', '254', '255', '256', '257', '258', '259'])
+_CULTURE_OCM = frozenset(['530', '531', '532', '533', '534', '535', '536', '537', '538', '539', '541', '542', '543', '544', '545', '551', '552', '553', '554', '561', '562', '563', '564', '565', '566', '571', '572', '573', '574', '575', '576', '577', '578', '579', '581', '582', '583', '584', '585', '586', '587'])
+_PEOPLE_OCM = frozenset(['591', '592', '593', '594', '595', '596', '597', '598', '599', '601', '602', '603', '604', '605', '606', '607', '608', '609', '610', '611', '612', '621', '622', '623', '624', '625', '626', '627', '628', '629'])
+_PLACES_OCM = frozenset(['361', '362', '363', '364', '365', '366', '367', '368', '369', '481', '482', '483', '484', '485', '486', '487', '488', '489', '131', '784'])
+
+# OCM code -> noun category id (0 nature .. 3 places); reversed so the
+# first set listing a code wins, as the keyword matchers do
+_OCM_CATEGORY = {
+    code: idx
+    for idx, codes in reversed(tuple(enumerate((_NATURE_OCM, _CULTURE_OCM, _PEOPLE_OCM, _PLACES_OCM))))
+    for code in codes
+}
+
+_NATURE_KW = frozenset(['тау', 'ҡояш', 'ай', 'йондоҙ', 'һыу', 'йылға', 'күл', 'диÒ£геҙ', 'урман', 'ағас', 'сәскә', 'үлән', 'ҡош', 'айыу', 'бүре', 'ҡуй', 'ат', 'һыйыр', 'балыҡ', 'йылан', 'ел', 'ҡар', 'боҙ', 'ямғыр', 'болот', 'көн', 'төн', 'яҙ', 'йәй', 'көҙ', 'ҡыш', 'таш', 'туфраҡ', 'ер', 'нур'])
+_CULTURE_KW = frozenset(['байрам', 'сабантуй', 'туй', 'йола', 'әкиәт', 'риүәйәт', 'йыр', 'моÒ£', 'бейеү', 'ҡурай', 'думбыра', 'ҡубыҙ', 'бал', 'ҡымыҙ', 'буҙа', 'икмәк', 'ит', 'аш', 'сәй', 'тирмә', 'биҙәк', 'ойма', 'көрәш', 'уйын', 'дин', 'мәсьет', 'театр'])
+_PEOPLE_KW = frozenset(['ата', 'әсә', 'бала', 'ҡыҙ', 'егет', 'бабай', 'өләсәй', 'туғандар', 'ғаилә', 'халыҡ', 'милләт', 'дуҫ', 'ҡунаҡ', 'уҡытыусы', 'эшсе', 'оҫта', 'батыр', 'граждан', 'президент'])
+_PLACES_KW = frozenset(['Өфө', 'Башҡортостан', 'ҡала', 'урам', 'мәйҙан', 'өй', 'йорт', 'мәктәп', 'завод', 'магазин', 'банк', 'поÑ‡та', 'ил', 'дәүләт', 'республика', 'Ағиҙел', 'Шүлгәнташ', 'Ямантау', 'Ð˜ремәл', 'Бижбуляк', 'Белорет'])
+_NATURE_EN_KW = frozenset(['sun', 'moon', 'star', 'water', 'river', 'lake', 'tree', 'forest', 'bird', 'animal', 'wolf', 'bear', 'fish', 'horse', 'cow', 'sheep', 'snow', 'rain', 'wind', 'day', 'night', 'spring', 'summer', 'autumn', 'winter', 'flower', 'grass', 'mountain', 'stone', 'earth', 'sky'])
+_CULTURE_EN_KW = frozenset(['festival', 'wedding', 'song', 'dance', 'music', 'honey', 'kumis', 'bread', 'meat', 'tea', 'food', 'tradition', 'legend', 'tale', 'story', 'holiday', 'craft', 'art', 'ornament', 'religion'])
+_PEOPLE_EN_KW = frozenset(['father', 'mother', 'child', 'girl', 'boy', 'grandfather', 'grandmother', 'family', 'relative', 'people', 'nation', 'friend', 'guest', 'teacher', 'worker', 'hero', 'citizen', 'president'])
+_PLACES_EN_KW = frozenset(['city', 'street', 'square', 'house', 'home', 'school', 'factory', 'shop', 'bank', 'post', 'country', 'state', 'republic', 'capital', 'village', 'ufa', 'bashkortostan'])
+
+
+def build_keyword_matcher(keyword_sets):
+    """
+    Build a matcher over keyword sets given in priority order.
+
+    The matcher returns the index of the first set with a keyword occurring
+    in the text, or None. With pyahocorasick the text is scanned once by a
+    single automaton; otherwise each set is one compiled alternation.
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for idx, keywords in enumerate(keyword_sets):
+            for kw in keywords:
+                if kw not in automaton:
+                    automaton.add_word(kw, idx)
+        automaton.make_automaton()
+
+        def match(text):
+            return min((idx for _, idx in automaton.iter(text)), default=None)
+        return match
+
+    patterns = tuple(
+        re.compile("|".join(map(re.escape, sorted(keywords, key=len, reverse=True))))
+        for keywords in keyword_sets
+    )
+
+    def match(text):
+        for idx, pattern in enumerate(patterns):
+            if pattern.search(text):
+                return idx
+        return None
+    return match
+
+_match_bashkir_keyword = build_keyword_matcher((_NATURE_KW, _CULTURE_KW, _PEOPLE_KW, _PLACES_KW))
+_match_english_keyword = build_keyword_matcher((_NATURE_EN_KW, _CULTURE_EN_KW, _PEOPLE_EN_KW, _PLACES_EN_KW))
+
+@st.cache_resource(show_spinner=False)
+def load_word_bank_categories():
+    """
+    Sort the dictionary into Sentence Builder word-bank categories
+    (by part of speech, then OCM code, then keyword), once per process.
+    Returns a read-only {category label: tuple of unique Bashkir headwords},
+    shared by every session without copying.
+    """
+    # Noun category ids from _OCM_CATEGORY and the keyword matchers
+    noun_labels = ("🌿 Nature", "🎭 Culture", "👨â€👩â€👧 People", "🛕️ Places")
 
-@st.cache_data
+    # Expanded word categories; dicts act as insertion-ordered sets, so a
+    # headword listed more than once is kept once, at its first position
+    word_categories = {
+        "👥 Pronouns": {},
+        "🌿 Nature": {},
+        "🎭 Culture": {},
+        "👨â€👩â€👧 People": {},
+        "🛕️ Places": {},
+        "💭 Concepts": {},
+        "🎬 Verbs": {},
+        "📍 Adjectives": {},
+        "🔢 Numbers": {}
+    }
+
+    for word in load_words():
+        pos = word.get('pos', 'noun').lower()
+        bashkir = word['bashkir']
+        english = word.get('english', '').lower()
+
+        # Get OCM codes from word data
+        ocm_codes = []
+        if 'cultural_context' in word and 'ocm_codes' in word['cultural_context']:
+            ocm_codes = word['cultural_context']['ocm_codes']
+
+        if pos == 'pronoun':
+            label = "👥 Pronouns"
+        elif pos == 'verb':
+            label = "🎬 Verbs"
+        elif pos in ['adjective', 'adj']:
+            label = "📍 Adjectives"
+        elif pos in ['number', 'numeral']:
+            label = "🔢 Numbers"
+        elif pos == 'noun':
+            # Categorize nouns by their first mapped OCM code, else by keywords;
+            # the C-level disjointness test skips the scan for unmapped codes
+            category = None
+            if not _OCM_CATEGORY.keys().isdisjoint(ocm_codes):
+                category = next(_OCM_CATEGORY[code] for code in ocm_codes if code in _OCM_CATEGORY)
+            if category is None:
+                matches = [idx for idx in (_match_bashkir_keyword(bashkir), _match_english_keyword(english))
+                           if idx is not None]
+                category = min(matches) if matches else None
+            label = noun_labels[category] if category is not None else "💭 Concepts"
+        else:
+            label = "💭 Concepts"
+        word_categories[label][bashkir] = None
+
+    # Remove empty categories
+    return MappingProxyType({k: tuple(v) for k, v in word_categories.items() if v})
+
+def new_learned_words(items=()) -> WordBitset:
+    """Create an empty (or pre-filled) learned-word bitset."""
+    return WordBitset(load_word_positions(), load_word_headwords(), items)
+
+@st.cache_data(persist="disk", show_spinner=False)
 def load_loci():
     """Load memory palace locations."""
     data_path = Path(__file__).parent / "data" / "loci.json"
-    with open(data_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(data_path, 'rb') as f:
+        return json_loads(f.read())
 
-@st.cache_data
+@st.cache_data(persist="disk", show_spinner=False)
 def load_patterns():
     """Load sentence patterns."""
     data_path = Path(__file__).parent / "data" / "patterns.json"
-    with open(data_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(data_path, 'rb') as f:
+        return json_loads(f.read())
 
-@st.cache_data
+@st.cache_data(persist="disk", show_spinner=False)
 def load_ocm_mapping():
     """Load OCM mapping data."""
     data_path = Path(__file__).parent / "data" / "ocm_mapping.json"
     try:
-        with open(data_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(data_path, 'rb') as f:
+            return json_loads(f.read())
     except FileNotFoundError:
         return {}
 
-@st.cache_data
+@st.cache_data(persist="disk", show_spinner=False)
 def load_ural_batyr_epic():
     """Load the Ural-Batyr epic data - the Golden Light."""
     data_path = Path(__file__).parent / "data" / "ural_batyr_epic.json"
     try:
-        with open(data_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(data_path, 'rb') as f:
+            epic = json_loads(f.read())
     except FileNotFoundError:
         return {}
+    # Split chapter text into paragraphs once per load rather than per rerun
+    for chapter in epic.get('chapters', []):
+        chapter['_paragraphs'] = tuple(
+            p.strip() for p in chapter.get('text', '').split('\n\n') if p.strip()
+        )
+    return epic
 
-@st.cache_data
+@st.cache_data(persist="disk", show_spinner=False)
 def load_golden_light_data():
     """Load the comprehensive Golden Light data - independence, geography, alphabet, proverbs."""
     data_path = Path(__file__).parent / "data" / "golden_light_data.json"
     try:
-        with open(data_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(data_path, 'rb') as f:
+            return json_loads(f.read())
     except FileNotFoundError:
         return {}
 
+
+class _GoldenLightData:
+    """
+    Read-only Golden Light / Independence / Geography / alphabet / epic views.
+
+    Each section is parsed into records on first access, so a page only pays
+    for the data it shows (the Geography page never loads the epic).
+    Callers must not mutate the returned objects.
+    """
+
+    @cached_property
+    def gl_info(self) -> dict:
+        return load_golden_light_data().get('golden_light', {})
+
+    @cached_property
+    def stations(self):
+        return tuple(Station.from_dict(s) for s in self.gl_info.get('memory_palace_stations', []))
+
+    @cached_property
+    def independence(self) -> dict:
+        return load_golden_light_data().get('independence', {})
+
+    @cached_property
+    def reasons(self):
+        return tuple(Reason.from_dict(r) for r in self.independence.get('reasons', []))
+
+    @cached_property
+    def reason_pages(self):
+        reasons = self.reasons
+        return tuple(
+            reasons[i:i + REASONS_PER_PAGE] for i in range(0, len(reasons), REASONS_PER_PAGE)
+        ) or ((),)
+
+    @cached_property
+    def geography(self) -> dict:
+        return load_golden_light_data().get('geography', {})
+
+    @cached_property
+    def overview(self):
+        return GeographyOverview.from_dict(self.geography.get('overview', {}))
+
+    @cached_property
+    def cities(self):
+        return tuple(
+            City.from_dict(c, key=f"c{i}") for i, c in enumerate(self.geography.get('cities', []))
+        )
+
+    @cached_property
+    def landmarks(self):
+        return tuple(Landmark.from_dict(l) for l in self.geography.get('landmarks', []))
+
+    @cached_property
+    def map_frame(self):
+        """Cities and landmarks as one DataFrame for st.map; needs pandas."""
+        import pandas as pd
+
+        # Combine cities and landmarks for mapping, built column-wise
+        cities, landmarks = self.cities, self.landmarks
+        places = cities + landmarks
+        return pd.DataFrame({
+            'lat': [place.lat for place in places],
+            'lon': [place.lon for place in places],
+            'name': [f"🏙️ {c.name} ({c.bashkir})" for c in cities]
+                    + [f"{l.icon} {l.name} ({l.bashkir})" for l in landmarks],
+            'type': ['city'] * len(cities) + ['landmark'] * len(landmarks),
+        })
+
+    @cached_property
+    def facts(self):
+        return tuple(Fact.from_dict(f) for f in self.geography.get('facts', []))
+
+    @cached_property
+    def facts_by_category(self):
+        grouped = {}
+        for fact in self.facts:
+            grouped.setdefault(fact.category, []).append(fact)
+        return {category: tuple(facts) for category, facts in grouped.items()}
+
+    @cached_property
+    def fact_categories(self):
+        return tuple(self.facts_by_category)
+
+    @cached_property
+    def alphabet(self) -> dict:
+        return load_golden_light_data().get('alphabet', {})
+
+    @cached_property
+    def full_alphabet(self):
+        return tuple(self.alphabet.get('full_alphabet', []))
+
+    @cached_property
+    def special_letters(self):
+        return tuple(SpecialLetter.from_dict(l) for l in self.alphabet.get('special_letters', []))
+
+    @cached_property
+    def epic(self) -> dict:
+        return load_ural_batyr_epic()
+
+    @cached_property
+    def chapters(self):
+        return tuple(self.epic.get('chapters', []))
+
+    # Truth Unveiled prefers golden_light_data.json and falls back to the epic
+    @cached_property
+    def proverbs(self):
+        data = load_golden_light_data()
+        return tuple(data['proverbs'] if 'proverbs' in data else self.epic.get('proverbs', []))
+
+    @cached_property
+    def timeline(self):
+        data = load_golden_light_data()
+        return tuple(data['timeline'] if 'timeline' in data else self.epic.get('timeline', []))
+
+    @cached_property
+    def proverbs_by_category(self):
+        grouped = {}
+        for proverb in self.proverbs:
+            grouped.setdefault(proverb.get('category', 'General'), []).append(proverb)
+        return {category: tuple(proverbs) for category, proverbs in grouped.items()}
+
+    @cached_property
+    def proverb_categories(self):
+        return tuple(self.proverbs_by_category)
+
+    @cached_property
+    def cultural_facts(self):
+        return tuple(self.epic.get('cultural_facts', []))
+
+    @cached_property
+    def cultural_facts_by_category(self):
+        grouped = {}
+        for fact in self.cultural_facts:
+            grouped.setdefault(fact.get('category', 'general'), []).append(fact)
+        return {category: tuple(facts) for category, facts in grouped.items()}
+
+    @cached_property
+    def cultural_fact_categories(self):
+        return tuple(self.cultural_facts_by_category)
+
+    @cached_property
+    def legacy_proverb(self) -> dict:
+        if 'legacy_proverb' in self.gl_info:
+            return self.gl_info['legacy_proverb']
+        return self.epic.get('legacy_proverb', {})
+
+
+@st.cache_resource(show_spinner=False)
+def get_golden_light() -> _GoldenLightData:
+    """Golden Light views shared by every session; sections load on first use."""
+    return _GoldenLightData()
+
+
+class _OCMIndex:
+    """
+    Read-only OCM views: code labels and pre-formatted code titles, thematic
+    groups and headword codes, plus each thematic group's codes and headwords
+    as frozensets for the Audio Dictionary's membership tests.
+
+    Callers must not mutate the returned objects.
+    """
+
+    def __init__(self, mapping: dict):
+        self.labels = mapping.get('ocm_labels', {})
+        self.groups = mapping.get('thematic_groups', {})
+        self.bashkir_to_ocm = mapping.get('bashkir_to_ocm', {})
+
+    @cached_property
+    def code_titles(self):
+        return MappingProxyType({code: f"{code}: {label}" for code, label in self.labels.items()})
+
+    def code_title(self, code: str) -> str:
+        """'<code>: <label>' for an OCM code, with 'Unknown' for unlabelled codes."""
+        return self.code_titles.get(code) or f"{code}: Unknown"
+
+    @cached_property
+    def group_code_sets(self):
+        return MappingProxyType({k: frozenset(g.get('ocm_codes', ())) for k, g in self.groups.items()})
+
+    @cached_property
+    def group_word_sets(self):
+        return MappingProxyType({k: frozenset(g.get('words', ())) for k, g in self.groups.items()})
+
+
+@st.cache_resource(show_spinner=False)
+def get_ocm_index() -> _OCMIndex:
+    """OCM mapping views shared by every session."""
+    return _OCMIndex(load_ocm_mapping())
+
+# --- Progress Persistence ---
+USER_STATE_DIR = Path(__file__).parent / ".user_state"
+# Progress is only written under a named profile: BASHKIR_PALACE_USER for a
+# single-user install, or the ?profile= a visitor picks in Settings. Visitors
+# to a shared deployment never read or overwrite one common file.
+USER_ID = os.environ.get("BASHKIR_PALACE_USER", "")
+
+# Session keys that survive a browser reload
+PERSISTED_KEYS = (
+    'learned_words',
+    'srs_data',
+    'saved_sentences',
+    'total_reviews_completed',
+    'first_visit_date',
+    'milestones',
+)
+
+
+def _profile_id(name: str) -> str:
+    """A profile name reduced to filesystem-safe characters ('' if none remain)."""
+    return "".join(c for c in name.strip() if c.isalnum() or c in "-_")
+
+
+def _user_state_path(user_id: str) -> Path:
+    """Path of the progress file for a profile id."""
+    return USER_STATE_DIR / f"{_profile_id(user_id)}.json"
+
+
+def save_session(user_id: str = None):
+    """
+    Write persisted progress for a profile (the session's by default).
+
+    Skips the write when no profile is set or nothing changed. Called right
+    after each change to progress, so a later failure in the run loses nothing.
+    """
+    user_id = user_id or st.session_state.get('profile')
+    if not user_id:
+        return
+
+    payload = {key: st.session_state[key] for key in PERSISTED_KEYS if key in st.session_state}
+    payload['learned_words'] = sorted(payload.get('learned_words', ()))
+    data = json_dumps(payload)
+
+    if st.session_state.get('_saved_session') == data:
+        return
+
+    try:
+        USER_STATE_DIR.mkdir(exist_ok=True)
+        _user_state_path(user_id).write_bytes(data)
+        st.session_state._saved_session = data
+    except OSError:
+        pass
+
+
+def load_session(user_id: str):
+    """Restore a profile's persisted progress from disk into session state."""
+    if not user_id:
+        return
+
+    path = _user_state_path(user_id)
+    try:
+        data = path.read_bytes()
+        payload = json_loads(data)
+    except (OSError, ValueError):
+        return
+
+    for key in PERSISTED_KEYS:
+        if key in payload:
+            st.session_state[key] = payload[key]
+    st.session_state.learned_words = new_learned_words(st.session_state.get('learned_words', ()))
+    # The queue is per session; a returning learner starts on all their words
+    st.session_state.review_queue = deque(st.session_state.learned_words)
+    st.session_state.reviews_this_session = 0
+    st.session_state._saved_session = data
+
 # --- Initialize Session State ---
-def init_session_state():
-    """Initialize session state variables."""
-    if 'current_locus' not in st.session_state:
-        st.session_state.current_locus = None
-    if 'current_station' not in st.session_state:
-        st.session_state.current_station = None
-    if 'learned_words' not in st.session_state:
-        st.session_state.learned_words = set()
-    if 'review_queue' not in st.session_state:
-        st.session_state.review_queue = []
-    if 'saved_sentences' not in st.session_state:
-        st.session_state.saved_sentences = []
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = "Palace"
-    if 'truth_unveiled' not in st.session_state:
-        st.session_state.truth_unveiled = False
-    if 'srs_data' not in st.session_state:
-        st.session_state.srs_data = {}
-    if 'builder_sentence' not in st.session_state:
-        st.session_state.builder_sentence = []
-    if 'epic_chapter' not in st.session_state:
-        st.session_state.epic_chapter = 0
-    
+# Callables are factories so every browser session gets fresh mutable values.
+SESSION_DEFAULTS = {
+    'current_locus': None,
+    'current_station': None,
+    'learned_words': new_learned_words,
+    'review_queue': deque,  # Cards still to review this session, front is current
+    'reviews_this_session': 0,
+    'saved_sentences': list,
+    'current_page': "Palace",
+    'truth_unveiled': False,
+    'srs_data': dict,
+    'builder_sentence': list,
+    'prefetched_stations': set,
+    '_pending_learns': list,  # Learn clicks buffered until the next run
+
     # === NEW: Theological Framework Variables ===
-    if 'breathing_completed' not in st.session_state:
-        st.session_state.breathing_completed = False
-    if 'logismoi_journal' not in st.session_state:
-        st.session_state.logismoi_journal = []  # Distraction tracking
-    if 'sacred_practice_count' not in st.session_state:
-        st.session_state.sacred_practice_count = 0
-    
+    'breathing_completed': False,
+    'logismoi_journal': list,  # Distraction tracking
+    '_logismoi_counts': Counter,  # Distraction tallies of the journal's first
+    '_logismoi_counted': 0,  # _logismoi_counted entries
+    'sacred_practice_count': 0,
+
     # === NEW: Pedagogical Framework Variables (Kierkegaard) ===
-    if 'learning_stage' not in st.session_state:
-        st.session_state.learning_stage = "aesthetic"  # aesthetic/ethical/religious
-    if 'reflection_journal' not in st.session_state:
-        st.session_state.reflection_journal = []
-    if 'days_active' not in st.session_state:
-        st.session_state.days_active = 0
-    if 'first_visit_date' not in st.session_state:
-        st.session_state.first_visit_date = datetime.now().isoformat()
-    if 'total_reviews_completed' not in st.session_state:
-        st.session_state.total_reviews_completed = 0
-    
+    'learning_stage': "aesthetic",  # aesthetic/ethical/religious
+    'reflection_journal': list,
+    'days_active': 0,
+    'first_visit_date': lambda: datetime.now().isoformat(),
+    'total_reviews_completed': 0,
+
     # === NEW: Epistemological Framework Variables ===
-    if 'eye_mode' not in st.session_state:
-        st.session_state.eye_mode = "reason"  # senses/reason/contemplation
-    if 'inquiry_mode' not in st.session_state:
-        st.session_state.inquiry_mode = False  # Dialogical inquiry (Plato)
-    
+    'eye_mode': "reason",  # senses/reason/contemplation
+    'inquiry_mode': False,  # Dialogical inquiry (Plato)
+
     # === NEW: Milestone Tracking ===
-    if 'milestones' not in st.session_state:
-        st.session_state.milestones = {
-            'first_word': None,
-            'first_sentence': None,
-            'truth_unveiled_date': None,
-            'fifty_words': None,
-            'hundred_words': None,
-            'two_hundred_words': None,
-            'five_hundred_words': None,
-            'thirty_day_streak': None
-        }
-    
+    'milestones': lambda: {
+        'first_word': None,
+        'first_sentence': None,
+        'truth_unveiled_date': None,
+        'fifty_words': None,
+        'hundred_words': None,
+        'two_hundred_words': None,
+        'five_hundred_words': None,
+        'thirty_day_streak': None
+    },
+
     # === NEW: Station depth for choice gates ===
-    if 'station_depth' not in st.session_state:
-        st.session_state.station_depth = 0
+    'station_depth': 0,
+}
+
+
+def init_session_state():
+    """Initialize session state variables."""
+    # One key diff per rerun; defaults are only materialized when missing
+    missing = SESSION_DEFAULTS.keys() - set(st.session_state.keys())
+    for key in missing:
+        default = SESSION_DEFAULTS[key]
+        st.session_state[key] = default() if callable(default) else default
+
+    # Restore saved progress once per browser session
+    if 'session_loaded' not in st.session_state:
+        st.session_state.profile = _profile_id(st.query_params.get("profile", USER_ID))
+        load_session(st.session_state.profile)
+        st.session_state.session_loaded = True
+
+
+def switch_profile(key: str):
+    """Profile-name callback: remember it in the URL and load its saved progress, if any."""
+    profile = _profile_id(st.session_state[key])
+    st.session_state.profile = profile
+    if profile:
+        st.query_params["profile"] = profile
+        # A new profile keeps the current progress and saves it under the new name
+        load_session(profile)
+        save_session()
+    else:
+        st.query_params.pop("profile", None)
+
+
+def queue_learned_word(bashkir: str):
+    """Learn-button callback: buffer the word; Streamlit reruns once afterwards."""
+    st.session_state._pending_learns.append(bashkir)
+
+
+def flush_pending_learns():
+    """Apply buffered Learn clicks to learned_words and the review queue in one pass."""
+    pending = st.session_state._pending_learns
+    if not pending:
+        return
+
+    learned_words = st.session_state.learned_words
+    review_queue = st.session_state.review_queue
+    for bashkir in dict.fromkeys(pending):
+        if bashkir not in learned_words:
+            learned_words.add(bashkir)
+            review_queue.append(bashkir)
+    pending.clear()
+    save_session()
 
 init_session_state()
+flush_pending_learns()
 
 # --- CSS Styling v3 - Bashkortostan Flag Colors ---
-# Flag: Blue (#0066B3), White (#FFFFFF), Green (#00AF66)
-# Fixes: Light blue background, visible expanders, readable headers
-st.markdown("""
-<style>
-    /* ===== MAIN BACKGROUND - Light Blue ===== */
-    .stApp {
-        background-color: #cce5ff !important;
-        background: linear-gradient(180deg, #cce5ff 0%, #d9ecff 50%, #e6f2ff 100%) !important;
-    }
+# Stylesheet lives in static/palace.css; it is read once per server process.
+@st.cache_resource(show_spinner=False)
+def load_css() -> str:
+    """Load the app stylesheet as a ready-to-inject <style> block."""
+    css_path = Path(__file__).parent / "static" / "palace.css"
+    return f"<style>\n{css_path.read_text(encoding='utf-8')}</style>"
+
+st.markdown(load_css(), unsafe_allow_html=True)
+
+# --- Practice Timers ---
+def start_practice_timer(key: str):
+    """Start (or restart) the practice timer named ``key``."""
+    st.session_state[f"_{key}_started"] = time.monotonic()
+    st.session_state.pop(f"_{key}_finished", None)
+
+
+@st.fragment(run_every=1.0)
+def _practice_timer_tick(key: str, phase_ends: tuple, labels: tuple):
+    """Redraw a running practice timer; rerun the page once it has finished."""
+    elapsed = time.monotonic() - st.session_state[f"_{key}_started"]
+    total = phase_ends[-1]
+    if elapsed >= total:
+        del st.session_state[f"_{key}_started"]
+        st.session_state[f"_{key}_finished"] = True
+        st.rerun()
+
+    # Phase from precomputed end offsets: one bisect per tick
+    st.markdown(labels[bisect.bisect_right(phase_ends, elapsed)])
+    st.progress(elapsed / total)
+
+
+def practice_timer(key: str, phases, cycles: int = 1) -> bool:
+    """
+    Show the practice timer named ``key`` while it runs.
 
-    /* ===== SIDEBAR STYLING ===== */
-    section[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #0066B3 0%, #004080 100%) !important;
-    }
-    section[data-testid="stSidebar"] * {
-        color: white !important;
-    }
-    section[data-testid="stSidebar"] .stMarkdown h1,
-    section[data-testid="stSidebar"] .stMarkdown h2,
-    section[data-testid="stSidebar"] .stMarkdown h3 {
-        color: white !important;
-    }
+    ``phases`` is a list of (markdown label, seconds) pairs repeated
+    ``cycles`` times. The timer ticks once a second on the server's
+    monotonic clock, so only this fragment reruns while the learner
+    practises. Returns True on the one run after the timer finishes, so the
+    caller records the practice only when it was completed.
+    """
+    if st.session_state.pop(f"_{key}_finished", False):
+        return True
+    if f"_{key}_started" in st.session_state:
+        schedule = list(phases) * cycles
+        _practice_timer_tick(
+            key,
+            tuple(accumulate(seconds for _, seconds in schedule)),
+            tuple(label for label, _ in schedule),
+        )
+    return False
 
-    /* ===== ALL HEADERS - Green & Readable ===== */
-    h1 {
-        color: #00AF66 !important;
-        font-size: 2.5rem !important;
-        font-weight: 700 !important;
-    }
-    h2 {
-        color: #00AF66 !important;
-        font-size: 2rem !important;
-        font-weight: 600 !important;
-    }
-    h3 {
-        color: #00AF66 !important;
-        font-size: 1.5rem !important;
-        font-weight: 600 !important;
-    }
-    h4 {
-        color: #00AF66 !important;
-        font-size: 1.25rem !important;
-        font-weight: 600 !important;
-    }
-    /* Markdown headers too */
-    .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, .stMarkdown h4 {
-        color: #00AF66 !important;
-    }
+# --- Sidebar Navigation ---
+st.sidebar.title("🏰 Memory Palace")
 
-    /* ===== EXPANDERS - Always Visible ===== */
-    .streamlit-expanderHeader {
-        background-color: #e6f2ff !important;
-        border: 2px solid #0066B3 !important;
-        border-radius: 8px !important;
-        color: #004d00 !important;
-        font-weight: 600 !important;
-        font-size: 1.1rem !important;
-    }
-    .streamlit-expanderHeader:hover {
-        background-color: #d9ecff !important;
-        border-color: #00AF66 !important;
-    }
-    .streamlit-expanderContent {
-        background-color: #f0f8ff !important;
-        border: 1px solid #0066B3 !important;
-        border-top: none !important;
-        border-radius: 0 0 8px 8px !important;
-    }
-    /* Expander icon always visible */
-    .streamlit-expanderHeader svg {
-        color: #0066B3 !important;
-        opacity: 1 !important;
-    }
+# Sidebar toggle hint for mobile users
+st.sidebar.caption("📱 *Tap âœ• to collapse sidebar*")
+st.sidebar.markdown("---")
 
-    /* Alternative expander styling for newer Streamlit */
-    [data-testid="stExpander"] {
-        border: 2px solid #0066B3 !important;
-        border-radius: 10px !important;
-        background-color: #e6f2ff !important;
-    }
-    [data-testid="stExpander"]:hover {
-        background-color: #d9ecff !important;
-        border-color: #00AF66 !important;
-    }
-    [data-testid="stExpander"] summary {
-        color: #004d00 !important;
-        font-weight: 600 !important;
-        font-size: 1.1rem !important;
-        padding: 12px !important;
-    }
-    [data-testid="stExpander"] summary:hover {
-        background-color: #d9ecff !important;
-    }
-    [data-testid="stExpander"] svg {
-        color: #0066B3 !important;
-        opacity: 1 !important;
-        visibility: visible !important;
-    }
+# Navigation - Radio buttons for individual tabs
+# Tab order: Palace, Golden Light, Independence, Four Birds, Ural-Batyr Epic, Geography, Alphabet...
+pages = [
+    "🗺️ Palace",
+    "✨ Golden Light",
+    "⚖️ Independence",
+    "📚 Four Birds",
+    "⚔️ Ural-Batyr Epic",
+    "🗺️ Geography",
+    "📺 Media",
+    "🔤 Alphabet",
+    "âœ️ Sentence Builder",
+    "🔊 Audio Dictionary",
+    "🔄 Review",
+    "🕸️ BashkortNet Explorer",
+    "📖 Cultural Context",
+    "🌟 Truth Unveiled",
+    "🧘 Sacred Practice",
+    "📈 Your Journey",
+    "📚 The Eleven Pillars",
+    "⚙️ Settings"
+]
 
-    /* ===== POPOVER BUTTONS - Always Visible ===== */
-    [data-testid="stPopover"] > button,
-    .stPopover > button {
-        background-color: #e6f2ff !important;
-        border: 2px solid #0066B3 !important;
-        color: #004d00 !important;
-        opacity: 1 !important;
-        visibility: visible !important;
-    }
-    [data-testid="stPopover"] > button:hover,
-    .stPopover > button:hover {
-        background-color: #d9ecff !important;
-        border-color: #00AF66 !important;
-    }
+selected_page = st.sidebar.radio("Navigate", pages, label_visibility="collapsed")
 
-    /* ===== BIRD CARDS ===== */
-    .bird-card {
-        padding: 20px;
-        border-radius: 12px;
-        margin: 10px 0;
-        border-left: 5px solid;
-        color: #004d00;
-    }
-    .eagle-card { background: linear-gradient(135deg, #cce5ff 0%, #e6f2ff 100%); border-color: #0066B3; }
-    .crow-card { background: linear-gradient(135deg, #f0f0f0 0%, #e8e8e8 100%); border-color: #333333; }
-    .anqa-card { background: linear-gradient(135deg, #ffe6e6 0%, #fff0f0 100%); border-color: #cc3333; }
-    .ringdove-card { background: linear-gradient(135deg, #e6ffe6 0%, #f0fff0 100%); border-color: #00AF66; }
-
-    /* ===== WORD CARDS ===== */
-    .word-card {
-        background: #ffffff;
-        padding: 20px;
-        border-radius: 12px;
-        box-shadow: 0 4px 8px rgba(0, 102, 179, 0.15);
-        margin: 10px 0;
-        border: 2px solid #0066B3;
-    }
+# Progress indicator
+words_data = load_words()
+words_by_bashkir = load_words_by_bashkir()
+learned_count = len(st.session_state.learned_words)
+# Vocabulary size never changes within a session
+if '_total_word_count' not in st.session_state:
+    st.session_state._total_word_count = len(words_data)
+total_count = st.session_state._total_word_count
+progress = learned_count / total_count if total_count > 0 else 0
 
-    /* Bashkir text - GREEN from flag */
-    .bashkir-text {
-        font-size: 1.8em;
-        font-weight: bold;
-        color: #00AF66 !important;
-        display: block;
-        margin-bottom: 8px;
-    }
+st.sidebar.markdown("---")
+st.sidebar.markdown("### 📊 Progress")
+# Label rides on the progress element so only one sidebar node changes per learn
+st.sidebar.progress(progress, text=f"**{learned_count}** / {total_count} words learned")
 
-    /* IPA text - blue */
-    .ipa-text {
-        color: #0066B3;
-        font-size: 1em;
-        font-style: italic;
-    }
+# Quick stats
+st.sidebar.markdown("---")
+st.sidebar.markdown("### 🎯 Today")
+st.sidebar.metric("Words to Review", len(st.session_state.review_queue))
+st.sidebar.metric("Sentences Created", len(st.session_state.saved_sentences))
 
-    /* English translation - dark green */
-    .english-text {
-        color: #004d00;
-        font-size: 1.2em;
-        font-weight: bold;
-        margin: 8px 0;
-    }
+# --- Page Fragments ---
+# Interactive panels rerun on their own, so navigating stations or checking a
+# quiz answer does not re-execute the whole page.
+REASONS_PER_PAGE = 4
+VOCAB_PAGE_SIZE = 6
+WORD_PICKER_LIMIT = 200  # Options sent to a word selectbox per render
 
-    /* Russian - muted */
-    .russian-text {
-        color: #666666;
-        font-size: 0.95em;
-    }
 
-    /* ===== MEDITATION BOXES ===== */
-    .meditation-box {
-        background: linear-gradient(135deg, #e6fff0 0%, #ccffe6 100%);
-        padding: 20px;
-        border-radius: 12px;
-        border-left: 5px solid #00AF66;
-        font-style: italic;
-        margin: 15px 0;
-        color: #004d00;
-    }
+def shift_session_index(key: str, step: int):
+    """Button callback: move a station/chapter index before the fragment reruns."""
+    st.session_state[key] += step
 
-    /* ===== STATS BOXES ===== */
-    .stat-box {
-        background: linear-gradient(135deg, #e6f2ff 0%, #cce5ff 100%);
-        padding: 15px;
-        border-radius: 10px;
-        text-align: center;
-        border: 2px solid #0066B3;
-        color: #004d00;
-    }
 
-    /* ===== MNEMONIC BOXES ===== */
-    .mnemonic-text {
-        background: linear-gradient(135deg, #fffff5 0%, #ffffd0 100%);
-        padding: 15px;
-        border-radius: 10px;
-        border-left: 5px solid #00AF66;
-        color: #004d00;
-        line-height: 1.6;
-    }
+def toast_selected_char(key: str):
+    """Pills callback: confirm a Quick Insert character once, when picked."""
+    char = st.session_state[key]
+    if char:
+        st.toast(f"Copied: {char}")
 
-    /* ===== BUTTONS ===== */
-    .stButton > button {
-        background-color: #00AF66 !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 8px !important;
-        font-weight: 600 !important;
-    }
-    .stButton > button:hover {
-        background-color: #008f55 !important;
-        color: white !important;
-    }
 
-    /* ===== PROGRESS BAR ===== */
-    .stProgress > div > div {
-        background-color: #00AF66 !important;
-    }
+# SM-2 grades offered on the Review page
+SRS_RATINGS = {1: "😞 Forgot", 3: "😕 Hard", 4: "🏙‚ Good", 5: "😄 Easy"}
 
-    /* ===== GENERAL TEXT ===== */
-    .stMarkdown, .stMarkdown p, .stText {
-        color: #004d00;
-    }
 
-    /* ===== SELECTBOX & DROPDOWNS - Dark Text ===== */
-    .stSelectbox > div > div {
-        background-color: white !important;
-        border: 2px solid #0066B3 !important;
-        border-radius: 8px !important;
-    }
-    .stSelectbox label {
-        color: #004d00 !important;
-        font-weight: 600 !important;
-    }
-    /* Dropdown text - DARK */
-    .stSelectbox [data-baseweb="select"] > div {
-        color: #1a1a1a !important;
-        font-weight: 500 !important;
-    }
-    .stSelectbox span {
-        color: #1a1a1a !important;
-    }
-    /* Dropdown options */
-    [data-baseweb="menu"] {
-        background-color: white !important;
-    }
-    [data-baseweb="menu"] li {
-        color: #1a1a1a !important;
-    }
-    [data-baseweb="menu"] li:hover {
-        background-color: #e6f2ff !important;
-    }
-    /* Selected option text */
-    [data-baseweb="select"] [data-testid="stMarkdownContainer"] {
-        color: #1a1a1a !important;
-    }
-    /* All input text dark */
-    input, textarea, [contenteditable] {
-        color: #1a1a1a !important;
-    }
-    /* Radio buttons */
-    .stRadio label {
-        color: #004d00 !important;
-    }
-    .stRadio label span {
-        color: #1a1a1a !important;
-    }
+def update_srs(srs: dict, rating: int) -> None:
+    """Apply one SM-2 grade to a card's ease, interval and repetition count in place."""
+    if rating >= 3:
+        if srs['reps'] == 0:
+            srs['interval'] = 1
+        elif srs['reps'] == 1:
+            srs['interval'] = 6
+        else:
+            srs['interval'] = int(srs['interval'] * srs['ease'])
+        srs['reps'] += 1
+    else:
+        srs['interval'] = 1
+        srs['reps'] = 0
 
-    /* ===== TABS ===== */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        background-color: #e6f2ff !important;
-        border-radius: 8px 8px 0 0 !important;
-        color: #004d00 !important;
-        font-weight: 600 !important;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: #00AF66 !important;
-        color: white !important;
-    }
+    srs['ease'] = max(1.3, srs['ease'] + (0.1 - (5 - rating) * 0.08))
 
-    /* ===== METRICS ===== */
-    [data-testid="stMetricValue"] {
-        color: #00AF66 !important;
-        font-weight: 700 !important;
-    }
-    [data-testid="stMetricLabel"] {
-        color: #004d00 !important;
-    }
 
-    /* ===== CAPTIONS ===== */
-    .stCaption, small {
-        color: #0066B3 !important;
-    }
+def rate_review_card(key: str, word: str):
+    """Segmented-control callback: grade the front card, advance the queue, clear the pick."""
+    rating = st.session_state[key]
+    if rating is None:
+        return
 
-    /* ===== INPUT FIELDS - Lighter background, better contrast ===== */
-    .stTextInput input {
-        background-color: #ffffff !important;
-        color: #1a1a1a !important;
-        font-size: 1.2em !important;
-        padding: 12px 15px !important;
-        border: 2px solid #0066B3 !important;
-        border-radius: 8px !important;
-    }
-    .stTextInput input::placeholder {
-        color: #666666 !important;
-        font-size: 1.1em !important;
-    }
-    .stTextInput input:focus {
-        border-color: #00AF66 !important;
-        box-shadow: 0 0 5px rgba(0, 175, 102, 0.3) !important;
-    }
-    .stTextInput > label {
-        color: #004d00 !important;
-        font-size: 1.1em !important;
-        font-weight: 600 !important;
-    }
-    /* SelectBox styling */
-    .stSelectbox > div > div {
-        background-color: #ffffff !important;
-        color: #1a1a1a !important;
-        font-size: 1.1em !important;
-    }
+    srs = st.session_state.srs_data.setdefault(word, {'ease': 2.5, 'interval': 0, 'reps': 0})
+    update_srs(srs, rating)
+    st.session_state.total_reviews_completed += 1
+
+    # Advance; a forgotten card goes to the back to be seen again this session
+    queue = st.session_state.review_queue
+    if queue and queue[0] == word:
+        queue.popleft()
+        if rating < 3:
+            queue.append(word)
+    st.session_state.reviews_this_session += 1
+    st.session_state.show_answer = False
+    st.session_state[key] = None
+    save_session()
+
+
+def add_word_bank_pick(key: str):
+    """Pills callback: append the picked Word Bank word to the sentence, then clear the pick."""
+    word = st.session_state[key]
+    if word:
+        word_data = words_by_bashkir.get(word)
+        st.session_state.builder_sentence.append({
+            'word': word,
+            'english': word_data.get('english', '?') if word_data else '?'
+        })
+        st.session_state[key] = None
+
+
+def render_resource_table(resources, detail_key: str, detail_label: str):
+    """Media Downloads listing as one read-only table rather than a widget row per file."""
+    st.dataframe(
+        {
+            "Resource": [r['name'] for r in resources],
+            "Description": [r['desc'] for r in resources],
+            detail_label: [r[detail_key] for r in resources],
+        },
+        hide_index=True,
+        width="stretch",
+    )
 
-    /* ===== RADIO BUTTONS - Green text for quizzes ===== */
-    .stRadio > label {
-        color: #00AF66 !important;
-        font-weight: 600 !important;
-    }
-    .stRadio > div[role="radiogroup"] label {
-        color: #004d00 !important;
-        font-size: 1.1em !important;
-    }
-    .stRadio > div[role="radiogroup"] label:hover {
-        color: #00AF66 !important;
-    }
-    /* Radio button option text */
-    div[data-testid="stRadio"] label span {
-        color: #004d00 !important;
-    }
-    div[data-testid="stRadio"] label:hover span {
-        color: #00AF66 !important;
-    }
 
-    /* ===== STREAMLIT TABS - Better spacing and centering ===== */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 20px !important;
-        justify-content: center !important;
-    }
-    .stTabs [data-baseweb="tab"] {
-        padding: 15px 25px !important;
-        font-size: 1.1em !important;
-        font-weight: 600 !important;
-        color: #004d00 !important;
-        border-radius: 10px 10px 0 0 !important;
-    }
-    .stTabs [data-baseweb="tab"]:hover {
-        color: #00AF66 !important;
-        background-color: rgba(0, 175, 102, 0.1) !important;
-    }
-    .stTabs [aria-selected="true"] {
-        color: #00AF66 !important;
-        border-bottom: 3px solid #00AF66 !important;
-    }
+def index_selector(label: str, icons, key: str):
+    """
+    Single segmented control choosing a station/chapter index.
 
-    /* ===== NAVIGATION BUTTONS - Centered with spacing ===== */
-    .nav-button-container {
-        display: flex;
-        justify-content: center;
-        gap: 30px;
-        margin: 25px 0;
-    }
-    .nav-button-center {
-        display: flex;
-        justify-content: center;
-        margin: 20px auto;
-    }
+    Bound to ``st.session_state[key]`` so Previous/Next callbacks move it
+    too; clicking the selected segment again keeps the current item.
+    """
+    if st.session_state.get(key) is None:
+        st.session_state[key] = st.session_state.get(f"_{key}_last", 0)
+    st.session_state[f"_{key}_last"] = st.session_state[key]
+    st.segmented_control(
+        label,
+        options=range(len(icons)),
+        format_func=lambda i: icons[i],
+        key=key,
+        label_visibility="collapsed",
+    )
+
+
+def last_rendered_html(slot: str, cache_key, build) -> str:
+    """
+    Return the HTML this slot rendered on the previous run if ``cache_key``
+    is unchanged (e.g. the same station index), else build and remember it.
+    """
+    last = st.session_state.setdefault('_last_html', {})
+    hit = last.get(slot)
+    if hit is not None and hit[0] == cache_key:
+        return hit[1]
+    html = build()
+    last[slot] = (cache_key, html)
+    return html
+
+
+def vocab_window(vocab, key: str, page_size: int = VOCAB_PAGE_SIZE):
+    """
+    Return (offset, visible words) for a vocabulary list.
+
+    Short lists are shown whole; longer ones get a picker so only one slice
+    of cards is emitted per render.
+    """
+    if len(vocab) <= page_size:
+        return 0, vocab
+
+    starts = list(range(0, len(vocab), page_size))
+    offset = st.selectbox(
+        "Words",
+        starts,
+        format_func=lambda start: f"{start + 1}–{min(start + page_size, len(vocab))} of {len(vocab)}",
+        key=key,
+    )
+    return offset, vocab[offset:offset + page_size]
+
+
+def word_picker(label: str, key: str):
+    """
+    Word selectbox narrowed by a filter box and capped at WORD_PICKER_LIMIT
+    options, so a large vocabulary is not sent to the browser on every rerun.
+    """
+    headwords, word_labels = load_word_select_options()
+    query = st.text_input(
+        "Filter words", key=f"{key}_filter", placeholder="Bashkir, English or Russian..."
+    ).strip().lower()
+    if query:
+        search_index, _ = load_search_index()
+        options = [w['bashkir'] for w, b, e, r in search_index if query in b or query in e or query in r]
+    else:
+        options = headwords
+    if len(options) > WORD_PICKER_LIMIT:
+        st.caption(f"Showing the first {WORD_PICKER_LIMIT} of {len(options)} words; type to narrow.")
+        options = options[:WORD_PICKER_LIMIT]
+    return st.selectbox(label, options, format_func=word_labels.__getitem__, key=key)
+
+
+@st.fragment
+def render_gl_station(stations):
+    """Golden Light station selector, card, vocabulary and Previous/Next navigation."""
+    index_selector("Station", tuple(station.icon for station in stations), key='gl_station')
+
+    # Current station display
+    if stations:
+        current_station = stations[st.session_state.gl_station]
+
+        station_key = ("gl", st.session_state.gl_station)
+        st.markdown(last_rendered_html("gl_station", station_key, lambda: render_station_card_html(
+            current_station.id,
+            current_station.title,
+            current_station.bashkir,
+            current_station.summary,
+            current_station.hex_color,
+            current_station.icon,
+        )), unsafe_allow_html=True)
+
+        # Memory techniques
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown(f"""
+            <div class="stat-box" style="text-align: left;">
+                <h4>🔑 Memory Peg</h4>
+                <p style="font-size: 1.1em; font-family: monospace; color: #0066B3;">
+                    {current_station.memory_peg}
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            st.markdown(f"""
+            <div class="mnemonic-text">
+                <h4>🎨 Visualization</h4>
+                <p>{current_station.memory_image}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Vocabulary at this station
+        st.markdown("### 📚 Station Vocabulary")
+        vocab = current_station.vocab
+
+        if vocab:
+            offset, visible = vocab_window(vocab, key=f"gl_vocab_page_{current_station.id}")
+            st.markdown(last_rendered_html("gl_vocab", station_key + (offset,), lambda: render_vocab_row_html(tuple(
+                (word.bashkir, word.phonetic, word.english) for word in visible
+            ))), unsafe_allow_html=True)
+            listen_cols = st.columns(len(visible))
+            for idx, word in enumerate(visible, start=offset):
+                with listen_cols[idx - offset]:
+                    listen_player(word.bashkir, key=f"ga{current_station.id}.{idx}")
+
+    # Navigation buttons
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        if st.session_state.gl_station > 0:
+            st.button("â† Previous Station", on_click=shift_session_index, args=('gl_station', -1))
+    with col3:
+        if st.session_state.gl_station < len(stations) - 1:
+            st.button("Next Station â†’", on_click=shift_session_index, args=('gl_station', 1))
+
+
+def _reason_card_html(reason: Reason) -> str:
+    """One Independence reason card (HTML cached on the reason's content)."""
+    return render_reason_card_html(
+        reason.id, reason.title, reason.description, reason.icon, reason.bashkir_term,
+    )
+
+
+@st.fragment
+def render_reasons_grid(reasons, reason_pages):
+    """Independence page: the Twelve Reasons, a page of four at a time."""
+    n_pages = len(reason_pages)
+    page = min(st.session_state.setdefault('reasons_page', 0), n_pages - 1)
+    visible = reason_pages[page]
+
+    # Display reasons in a 2-column CSS grid, emitted as one element
+    cards_html = "".join(_reason_card_html(reason) for reason in visible)
+    st.markdown(f'<div class="reason-grid">{cards_html}</div>', unsafe_allow_html=True)
+
+    if n_pages > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            st.button("◀ Previous", key="reasons_prev", disabled=page == 0,
+                      on_click=shift_session_index, args=('reasons_page', -1))
+        with col2:
+            st.caption(f"Reasons {page * REASONS_PER_PAGE + 1}–{page * REASONS_PER_PAGE + len(visible)} of {len(reasons)}")
+        with col3:
+            st.button("Next ▶", key="reasons_next", disabled=page >= n_pages - 1,
+                      on_click=shift_session_index, args=('reasons_page', 1))
+
+
+@st.fragment
+def birds_quiz():
+    """Four Birds quiz: all questions in one form, checked in a single submit."""
+    with st.form("birds_quiz"):
+        answers = [
+            st.radio(q["question"], q["options"], key=f"quiz_{i}")
+            for i, q in enumerate(QUIZ_QUESTIONS)
+        ]
+        submitted = st.form_submit_button("Check all")
+
+    if submitted:
+        for n, (answer, correct) in enumerate(zip(answers, QUIZ_ANSWERS), start=1):
+            if answer == correct:
+                st.success(f"{n}. âœ… Correct!")
+            else:
+                st.error(f"{n}. âŒ The correct answer is: {correct}")
+
+
+@st.fragment
+def render_geography_facts(golden):
+    """Geography Facts tab; changing the filter reruns only this tab."""
+    st.markdown("### 📚 Geographic & Natural Facts")
+
+    # Filter by category
+    selected_cat = st.selectbox("Filter by category:", ('All',) + golden.fact_categories)
+    filtered_facts = golden.facts_by_category.get(selected_cat, golden.facts)
+
+    if filtered_facts:
+        st.html("".join(
+            FACT_CARD_TPL % dict(
+                color=fact.category_color, category=fact.category.upper(),
+                title=fact.title, content=fact.content,
+            )
+            for fact in filtered_facts
+        ))
+
+
+@st.fragment
+def render_epic_chapter(chapters):
+    """Ural-Batyr chapter selector, card, tabs and Previous/Next navigation."""
+    index_selector("Chapter", tuple(ch.get('icon', '📖') for ch in chapters), key='epic_chapter')
+
+    # Current chapter display
+    if chapters:
+        current_ch = chapters[st.session_state.epic_chapter]
+
+        # Chapter header
+        with st.container(border=True):
+            st.subheader(f"{current_ch.get('icon', '')} Chapter {current_ch.get('id', '')}: {current_ch.get('title', '')}")
+            st.markdown(
+                f"*{current_ch.get('bashkir', '')}*  \n"
+                f"**Bird Guide:** {current_ch.get('bird', '')} | **Theme:** {current_ch.get('summary', '')}"
+            )
+
+        # Create tabs for chapter content
+        tab1, tab2, tab3, tab4 = st.tabs(["📜 Story", "🧠 Memory Palace", "📚 Vocabulary", "🌟 Unveiling"])
+
+        with tab1:
+            st.markdown("### The Tale")
+            paragraphs = current_ch.get('_paragraphs', ())
+            if paragraphs:
+                st.markdown("\n\n".join(f"_{para}_" for para in paragraphs))
+
+        with tab2:
+            st.markdown("### 🧠 Method of Loci — Memory Palace Technique")
+            memory = current_ch.get('memory_palace', {})
+
+            st.markdown(f"""
+            <div class="stat-box" style="text-align: left;">
+                <h4>🔑 Memory Peg</h4>
+                <p style="font-size: 1.3em; font-family: monospace; color: #0066B3;">{memory.get('peg', '')}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+            st.markdown(f"""
+            <div class="mnemonic-text">
+                <h4>🎨 Visualization</h4>
+                <p>{memory.get('image', '')}</p>
+            </div>
+            """, unsafe_allow_html=True)
 
-    /* ===== MOBILE RESPONSIVENESS ===== */
-    @media (max-width: 768px) {
-        h1 { font-size: 1.8rem !important; }
-        h2 { font-size: 1.5rem !important; }
-        h3 { font-size: 1.25rem !important; }
-        .word-card { padding: 12px !important; }
-        .bashkir-text { font-size: 1.5em !important; }
-    }
-</style>
-""", unsafe_allow_html=True)
+            st.info(f"**Technique:** {memory.get('technique', '')}")
 
-# --- Sidebar Navigation ---
-st.sidebar.title("🏰 Memory Palace")
+        with tab3:
+            st.markdown("### 📚 Chapter Vocabulary")
+            vocab = current_ch.get('vocabulary', [])
+            if vocab:
+                offset, visible = vocab_window(vocab, key=f"epic_vocab_page_{current_ch['id']}")
+                chapter_key = ("epic", st.session_state.epic_chapter, offset)
+                st.markdown(last_rendered_html("epic_vocab", chapter_key, lambda: render_vocab_row_html(tuple(
+                    (word.get('bashkir', ''), word.get('phonetic', ''), word.get('english', ''))
+                    for word in visible
+                ))), unsafe_allow_html=True)
+                listen_cols = st.columns(len(visible))
+                for idx, word in enumerate(visible, start=offset):
+                    with listen_cols[idx - offset]:
+                        listen_player(word.get('bashkir', ''), key=f"ea{current_ch['id']}.{idx}")
 
-# Sidebar toggle hint for mobile users
-st.sidebar.caption("📱 *Tap âœ• to collapse sidebar*")
-st.sidebar.markdown("---")
+        with tab4:
+            st.markdown("### 🌟 The Unveiling")
+            unveiling = current_ch.get('unveiling', '')
+            st.markdown(f"""
+            <div class="meditation-box">
+                <p style="font-size: 1.1em; line-height: 1.8;">{unveiling}</p>
+            </div>
+            """, unsafe_allow_html=True)
 
-# Navigation - Radio buttons for individual tabs
-# Tab order: Palace, Golden Light, Independence, Four Birds, Ural-Batyr Epic, Geography, Alphabet...
-pages = [
-    "🗺️ Palace",
-    "✨ Golden Light",
-    "⚖️ Independence",
-    "📚 Four Birds",
-    "⚔️ Ural-Batyr Epic",
-    "🗺️ Geography",
-    "📺 Media",
-    "🔤 Alphabet",
-    "âœ️ Sentence Builder",
-    "🔊 Audio Dictionary",
-    "🔄 Review",
-    "🕸️ BashkortNet Explorer",
-    "📖 Cultural Context",
-    "🌟 Truth Unveiled",
-    "🧘 Sacred Practice",
-    "📈 Your Journey",
-    "📚 The Eleven Pillars",
-    "⚙️ Settings"
-]
+            # Connection to the user's twin mythology
+            if current_ch.get('id') == 1:
+                st.markdown("""
+                **The Duality of Twins:** Like Ural and Shulgen, twins carry the potential for both paths.
+                One may seek the light, another may guard the depths. Both are necessary—the hero who
+                sacrifices and the guardian who preserves memory in darkness.
+                """)
 
-selected_page = st.sidebar.radio("Navigate", pages, label_visibility="collapsed")
+    # Navigation buttons - centered with better spacing
+    st.markdown("---")
+    nav_col1, nav_col2, nav_col3 = st.columns([1, 1, 1])
+    with nav_col1:
+        if st.session_state.epic_chapter > 0:
+            st.button("â† Previous Chapter", key="prev_chapter", width="stretch",
+                      on_click=shift_session_index, args=('epic_chapter', -1))
+    with nav_col2:
+        # Center indicator
+        st.markdown(f"""
+        <div style="text-align: center; padding: 10px;">
+            <span style="color: #00AF66; font-weight: bold; font-size: 1.2em;">
+                Chapter {st.session_state.epic_chapter + 1} of {len(chapters)}
+            </span>
+        </div>
+        """, unsafe_allow_html=True)
+    with nav_col3:
+        if st.session_state.epic_chapter < len(chapters) - 1:
+            st.button("Next Chapter â†’", key="next_chapter", width="stretch",
+                      on_click=shift_session_index, args=('epic_chapter', 1))
 
-# Progress indicator
-words_data = load_words()
-learned_count = len(st.session_state.learned_words)
-total_count = len(words_data)
-progress = learned_count / total_count if total_count > 0 else 0
 
-st.sidebar.markdown("---")
-st.sidebar.markdown("### 📊 Progress")
-st.sidebar.progress(progress)
-st.sidebar.markdown(f"**{learned_count}** / {total_count} words learned")
+@st.fragment(run_every=1.0)
+def await_transcription(job):
+    """Poll a running transcription job and rerun the page once it finishes."""
+    if job.done():
+        st.rerun()
+    st.info("⏳ Transcribing audio... This may take a moment.")
 
-# Quick stats
-st.sidebar.markdown("---")
-st.sidebar.markdown("### 🎯 Today")
-st.sidebar.metric("Words to Review", len(st.session_state.review_queue))
-st.sidebar.metric("Sentences Created", len(st.session_state.saved_sentences))
 
 # === PAGE: PALACE ===
 if "Palace" in selected_page:
@@ -766,27 +1629,15 @@ if "Palace" in selected_page:
         """)
         
         if st.button("Begin 30-second centering practice", key="palace_breathing"):
-            progress_bar = st.progress(0)
-            status = st.empty()
-            
-            phases = [
-                ("🌬️ Breathe in... draw your attention inward", 5),
-                ("💫 Hold... feel the stillness", 3),
-                ("🌊 Breathe out... release distractions", 5),
-                ("🏔️ Rest... you are ready to enter", 2)
-            ]
-            
-            total_time = sum(p[1] for p in phases) * 2  # 2 cycles
-            elapsed = 0
-            
-            for cycle in range(2):
-                for phase_name, duration in phases:
-                    status.markdown(f"**{phase_name}**")
-                    for i in range(duration):
-                        time.sleep(1)
-                        elapsed += 1
-                        progress_bar.progress(elapsed / total_time)
-            
+            start_practice_timer("palace_breathing")
+
+        phases = [
+            ("**🌬️ Breathe in... draw your attention inward**", 5),
+            ("**💫 Hold... feel the stillness**", 3),
+            ("**🌊 Breathe out... release distractions**", 5),
+            ("**🏔️ Rest... you are ready to enter**", 2)
+        ]
+        if practice_timer("palace_breathing", phases, cycles=2):
             st.session_state.breathing_completed = True
             st.success("✨ You are centered. Enter the Palace with presence.")
     
@@ -881,7 +1732,7 @@ if "Palace" in selected_page:
         # Station walkthrough
         st.markdown("### 🚶 Station Walkthrough")
 
-        for station in locus.get('stations', []):
+        for station_idx, station in enumerate(locus.get('stations', [])):
             station_name = station.get('display_name', station.get('name', 'Station'))
             station_words = station.get('words', [])
 
@@ -900,48 +1751,62 @@ if "Palace" in selected_page:
                 st.markdown("#### Words at this Station:")
 
                 # Create word cards - FIXED: properly filter words by station
-                words_at_station = [w for w in words_data if w['bashkir'] in station_words]
+                words_at_station = [words_by_bashkir[b] for b in station_words if b in words_by_bashkir]
+
+                # Warm the audio cache for this station once per session
+                prefetch_key = (selected_locus, station_name)
+                if prefetch_key not in st.session_state.prefetched_stations:
+                    st.session_state.prefetched_stations.add(prefetch_key)
+                    prefetch_audio([w['bashkir'] for w in words_at_station])
 
                 if words_at_station:
-                    cols = st.columns(min(3, len(words_at_station)))
-                    for idx, word in enumerate(words_at_station):
-                        with cols[idx % 3]:
-                            is_learned = word['bashkir'] in st.session_state.learned_words
+                    n_cols = min(3, len(words_at_station))
+                    learned_words = st.session_state.learned_words
+
+                    for row_start in range(0, len(words_at_station), n_cols):
+                        row_words = words_at_station[row_start:row_start + n_cols]
 
-                            # Using proper HTML structure with CSS classes
-                            card_html = f'''
+                        # One markdown element per row of cards
+                        cards_html = "".join(f'''
                             <div class="word-card">
-                                <span class="bashkir-text">{word['bashkir']} {"âœ…" if is_learned else ""}</span>
+                                <span class="bashkir-text">{word['bashkir']} {"âœ…" if learned_words.is_learned(word['word_id']) else ""}</span>
                                 <span class="ipa-text">{word.get('ipa', '')}</span>
                                 <div class="english-text">{word['english']}</div>
                                 <span class="russian-text">🇷🇺 {word.get('russian', '')}</span>
-                            </div>
-                            '''
-                            st.markdown(card_html, unsafe_allow_html=True)
-
-                            # Audio and Mnemonic buttons in a row
-                            btn_col1, btn_col2 = st.columns(2)
-                            with btn_col1:
-                                if st.button("🔊 Hear", key=f"audio_{station_name}_{word['bashkir']}_{idx}"):
-                                    play_audio(word['bashkir'])
-
-                            with btn_col2:
-                                # Mnemonic
-                                mnemonic = word.get('memory_palace', {}).get('mnemonic', '')
-                                if mnemonic:
-                                    with st.popover("💡 Hint"):
-                                        st.markdown(f"""
-                                        <div class="mnemonic-text">
-                                        {mnemonic}
-                                        </div>
-                                        """, unsafe_allow_html=True)
-
-                            # Learn button
-                            if not is_learned:
-                                if st.button(f"Learn '{word['bashkir']}'", key=f"learn_{station_name}_{word['bashkir']}_{idx}"):
-                                    st.session_state.learned_words.add(word['bashkir'])
-                                    st.session_state.review_queue.append(word['bashkir'])
-                                    st.rerun()
+                            </div>''' for word in row_words)
+                        st.markdown(
+                            f'<div class="word-card-row" style="grid-template-columns: repeat({n_cols}, 1fr);">{cards_html}</div>',
+                            unsafe_allow_html=True
+                        )
+
+                        # Controls for the row, one column under each card
+                        cols = st.columns(n_cols)
+                        for offset, word in enumerate(row_words):
+                            idx = row_start + offset
+                            with cols[offset]:
+                                is_learned = learned_words.is_learned(word['word_id'])
+
+                                # Audio and Mnemonic buttons in a row
+                                btn_col1, btn_col2 = st.columns(2)
+                                with btn_col1:
+                                    if st.button("🔊 Hear", key=f"pa{station_idx}.{word['word_id']}"):
+                                        play_audio(word['bashkir'])
+
+                                with btn_col2:
+                                    # Mnemonic
+                                    mnemonic = word.get('memory_palace', {}).get('mnemonic', '')
+                                    if mnemonic:
+                                        with st.popover("💡 Hint"):
+                                            st.markdown(f"""
+                                            <div class="mnemonic-text">
+                                            {mnemonic}
+                                            </div>
+                                            """, unsafe_allow_html=True)
+
+                                # Learn button
+                                if not is_learned:
+                                    st.button(f"Learn '{word['bashkir']}'", key=f"pl{station_idx}.{word['word_id']}",
+                                              on_click=queue_learned_word, args=(word['bashkir'],))
                 else:
                     st.info("No vocabulary words assigned to this station yet.")
 
@@ -958,36 +1823,21 @@ if "Palace" in selected_page:
 # === PAGE: GOLDEN LIGHT (Алтын Яҡты) ===
 elif "Golden Light" in selected_page:
     # Load data
-    golden_data = load_golden_light_data()
-    gl_info = golden_data.get('golden_light', {})
+    golden = get_golden_light()
+    gl_info = golden.gl_info
     gl_title = gl_info.get('title', {})
     legacy_proverb = gl_info.get('legacy_proverb', {})
-    stations = gl_info.get('memory_palace_stations', [])
+    stations = golden.stations
 
     st.title("✨ Алтын Яҡты — Golden Light")
     st.markdown(f"*{gl_title.get('subtitle_bashkir', '')}*")
     st.markdown(f"*{gl_title.get('subtitle_english', '')}*")
 
     # Central bilingual motto - THE KEY QUOTE
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, #d4af37 0%, #f4e4bc 50%, #d4af37 100%);
-                padding: 30px; border-radius: 15px; text-align: center; margin: 20px 0;
-                border: 3px solid #8B7355; box-shadow: 0 8px 32px rgba(212,175,55,0.3);">
-        <h2 style="color: #2d1f10; margin-bottom: 15px; font-size: 1.8em;">🌟 The Legacy Proverb 🌟</h2>
-        <p style="font-size: 1.5em; color: #2d1f10; font-weight: bold; margin: 15px 0;">
-            "{legacy_proverb.get('bashkir', '')}"
-        </p>
-        <p style="font-size: 1.2em; color: #4a3728; font-style: italic; margin: 15px 0;">
-            "{legacy_proverb.get('english', '')}"
-        </p>
-        <p style="font-size: 0.95em; color: #5a4738;">
-            🇷🇺 {legacy_proverb.get('russian', '')}
-        </p>
-        <p style="font-size: 0.9em; color: #6a5748; margin-top: 10px;">
-            [{legacy_proverb.get('phonetic', '')}]
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(render_legacy_proverb_html(
+        legacy_proverb.get('bashkir', ''), legacy_proverb.get('english', ''),
+        legacy_proverb.get('russian', ''), legacy_proverb.get('phonetic', ''),
+    ), unsafe_allow_html=True)
 
     st.markdown("""
     *This proverb anchors the Ural-Batyr mythology. When the hero Ural poured the waters of life
@@ -1001,174 +1851,28 @@ elif "Golden Light" in selected_page:
     st.markdown("### 🏰 The Memory Palace of the Ural-Batyr Epic")
     st.markdown("*Walk through the 10 stations of the hero's journey. Each station holds vocabulary and wisdom.*")
 
-    # Station navigation buttons
-    if 'gl_station' not in st.session_state:
-        st.session_state.gl_station = 0
-
-    # Display station buttons in a row
-    cols = st.columns(10)
-    for idx, station in enumerate(stations):
-        with cols[idx]:
-            btn_style = "primary" if idx == st.session_state.gl_station else "secondary"
-            if st.button(station.get('icon', '📍'), key=f"gl_station_{idx}", help=station.get('title', '')):
-                st.session_state.gl_station = idx
-
-    # Current station display
-    if stations:
-        current_station = stations[st.session_state.gl_station]
-
-        # Station color mapping
-        color_map = {
-            'emerald': '#00AF66', 'sky': '#0066B3', 'blue': '#0044AA',
-            'amber': '#d4af37', 'red': '#cc3333', 'purple': '#8B5CF6',
-            'orange': '#F97316', 'cyan': '#06B6D4', 'slate': '#64748B'
-        }
-        station_color = color_map.get(current_station.get('color', 'emerald'), '#00AF66')
-
-        st.markdown(f"""
-        <div class="word-card" style="border-left: 5px solid {station_color}; background: linear-gradient(135deg, #ffffff 0%, #f0f8ff 100%);">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <span style="font-size: 2em;">{current_station.get('icon', '📍')}</span>
-                <span style="background: {station_color}; color: white; padding: 5px 15px; border-radius: 20px;">
-                    Station {current_station.get('id', '?')}
-                </span>
-            </div>
-            <h2 style="color: {station_color}; margin: 10px 0;">{current_station.get('title', '')}</h2>
-            <p style="font-size: 1.2em; font-style: italic; color: #00AF66;">
-                {current_station.get('bashkir', '')}
-            </p>
-            <p style="color: #333; margin: 10px 0;">{current_station.get('summary', '')}</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Memory techniques
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown(f"""
-            <div class="stat-box" style="text-align: left;">
-                <h4>🔑 Memory Peg</h4>
-                <p style="font-size: 1.1em; font-family: monospace; color: #0066B3;">
-                    {current_station.get('memory_peg', '')}
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown(f"""
-            <div class="mnemonic-text">
-                <h4>🎨 Visualization</h4>
-                <p>{current_station.get('memory_image', '')}</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Vocabulary at this station
-        st.markdown("### 📚 Station Vocabulary")
-        vocab = current_station.get('vocab', [])
-
-        if vocab:
-            vocab_cols = st.columns(len(vocab))
-            for idx, word in enumerate(vocab):
-                with vocab_cols[idx]:
-                    st.markdown(f"""
-                    <div class="word-card" style="text-align: center;">
-                        <span class="bashkir-text">{word.get('bashkir', '')}</span>
-                        <span class="ipa-text">[{word.get('phonetic', '')}]</span>
-                        <div class="english-text">{word.get('english', '')}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    if st.button(f"🔊", key=f"gl_audio_{current_station['id']}_{idx}"):
-                        play_audio(word.get('bashkir', ''), slow=True)
-
-    # Navigation buttons
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col1:
-        if st.session_state.gl_station > 0:
-            if st.button("â† Previous Station"):
-                st.session_state.gl_station -= 1
-                st.rerun()
-    with col3:
-        if st.session_state.gl_station < len(stations) - 1:
-            if st.button("Next Station â†’"):
-                st.session_state.gl_station += 1
-                st.rerun()
+    render_gl_station(stations)
 
 # === PAGE: INDEPENDENCE (12 Reasons) ===
 elif "Independence" in selected_page:
-    golden_data = load_golden_light_data()
-    independence = golden_data.get('independence', {})
+    golden = get_golden_light()
+    independence = golden.independence
     title_info = independence.get('title', {})
-    reasons = independence.get('reasons', [])
+    reasons = golden.reasons
 
     st.title("⚖️ Бәйһеҙлек — Independence")
     st.markdown(f"### {title_info.get('subtitle', '')}")
     st.markdown(f"*By {independence.get('author', '')} — {independence.get('organization', '')}*")
 
     # Introduction with scroll/legal theme
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, #f5f5dc 0%, #ede6cc 100%);
-                padding: 25px; border-radius: 15px; margin: 20px 0;
-                border: 2px solid #8B7355; box-shadow: 0 4px 15px rgba(139,115,85,0.2);">
-        <div style="text-align: center;">
-            <span style="font-size: 3em;">📜⚖️📜</span>
-            <h3 style="color: #4a3728; margin: 15px 0;">A Declaration of Rights</h3>
-            <p style="color: #5a4738; font-style: italic;">
-                "International law supports self-determination for peoples under colonial rule."
-            </p>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(INDEPENDENCE_INTRO_HTML, unsafe_allow_html=True)
 
     st.markdown("---")
 
     # Display the 12 Reasons in a grid layout
     st.markdown("### The Twelve Reasons")
 
-    # Display reasons in a 2-column grid
-    for i in range(0, len(reasons), 2):
-        col1, col2 = st.columns(2)
-
-        with col1:
-            if i < len(reasons):
-                reason = reasons[i]
-                st.markdown(f"""
-                <div class="word-card" style="border-left: 5px solid #8B7355; min-height: 180px;">
-                    <div style="display: flex; align-items: center; gap: 15px; margin-bottom: 10px;">
-                        <span style="font-size: 2em;">{reason.get('icon', '📜')}</span>
-                        <div>
-                            <span style="background: #8B7355; color: white; padding: 2px 10px; border-radius: 10px; font-size: 0.8em;">
-                                Reason {reason.get('id', '')}
-                            </span>
-                            <h4 style="color: #00AF66; margin: 5px 0;">{reason.get('title', '')}</h4>
-                        </div>
-                    </div>
-                    <p style="color: #333; font-size: 0.95em;">{reason.get('description', '')}</p>
-                    <p style="color: #0066B3; font-style: italic; margin-top: 10px;">
-                        🏷️ {reason.get('bashkir_term', '')}
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
-
-        with col2:
-            if i + 1 < len(reasons):
-                reason = reasons[i + 1]
-                st.markdown(f"""
-                <div class="word-card" style="border-left: 5px solid #8B7355; min-height: 180px;">
-                    <div style="display: flex; align-items: center; gap: 15px; margin-bottom: 10px;">
-                        <span style="font-size: 2em;">{reason.get('icon', '📜')}</span>
-                        <div>
-                            <span style="background: #8B7355; color: white; padding: 2px 10px; border-radius: 10px; font-size: 0.8em;">
-                                Reason {reason.get('id', '')}
-                            </span>
-                            <h4 style="color: #00AF66; margin: 5px 0;">{reason.get('title', '')}</h4>
-                        </div>
-                    </div>
-                    <p style="color: #333; font-size: 0.95em;">{reason.get('description', '')}</p>
-                    <p style="color: #0066B3; font-style: italic; margin-top: 10px;">
-                        🏷️ {reason.get('bashkir_term', '')}
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+    render_reasons_grid(reasons, golden.reason_pages)
 
     # Closing statement
     st.markdown("---")
@@ -1187,118 +1891,29 @@ elif "Four Birds" in selected_page:
     st.title("📚 The Four Birds of Ibn Arabi")
     st.markdown("*Understanding the cosmological framework of your learning journey.*")
 
-    birds = [
-        {
-            "name": "Eagle",
-            "arabic": "العقل الأول",
-            "english": "First Intellect",
-            "symbol": "🦅",
-            "color": "eagle",
-            "locus": "Ufa",
-            "domain": "Civic & Legal Knowledge",
-            "description": """The Eagle represents the First Intellect (al-'Aql al-Awwal) —
-            the primordial light of knowledge from which all understanding flows.
-            At Ufa, we encounter constitutional knowledge, legal rights, and civic identity.
-            The Eagle sees the whole landscape from above; it knows the law that governs.""",
-            "vocabulary": ["Башҡортостан", "халыҡ", "иркенлек", "тел", "конституция"]
-        },
-        {
-            "name": "Crow",
-            "arabic": "الجسم الكلي",
-            "english": "Universal Body",
-            "symbol": "🐦‍⬛",
-            "color": "crow",
-            "locus": "Shulgan-Tash",
-            "domain": "Ancestral Memory & Nature",
-            "description": """The Crow represents Universal Body (al-Jism al-Kulli) —
-            matter infused with spirit, darkness containing light. In the cave's depths,
-            we find manifestation: the physical traces of spiritual vision painted on stone.
-            The Crow guards what was; it remembers what others forget.""",
-            "vocabulary": ["ҡояш", "ай", "таш", "һыу", "йылға", "Ағиҙел"]
-        },
-        {
-            "name": "Anqa",
-            "arabic": "الهيولى",
-            "english": "Prime Matter",
-            "symbol": "🔥🕊️",
-            "color": "anqa",
-            "locus": "Yamantau",
-            "domain": "Potential & Transformation",
-            "description": """The Anqa represents Prime Matter (al-HayÅ«lÄ) —
-            pure potentiality, the 'name without a body.' Like the mythical phoenix,
-            it exists in the realm of possibility. At Yamantau ('Bad Mountain'),
-            danger and transformation intertwine. From difficulty comes growth.""",
-            "vocabulary": ["тау", "ел", "урман", "ҡурҡыныс", "күл", "яман", "ҙур"]
-        },
-        {
-            "name": "Ringdove",
-            "arabic": "النفس الكلية",
-            "english": "Universal Soul",
-            "symbol": "🕊️",
-            "color": "ringdove",
-            "locus": "Beloretsk & Bizhbulyak",
-            "domain": "Daily Life & Community",
-            "description": """The Ringdove represents Universal Soul (al-Nafs al-Kulliyya) —
-            the receptive, nurturing principle that brings potential into form.
-            At Beloretsk, raw ore becomes steel through patient work.
-            At Bizhbulyak, family, food, and music create the texture of daily life.""",
-            "vocabulary": ["эш", "болат", "оҫта", "бал", "ата", "әсә", "өй", "ҡурай", "ат"]
-        }
-    ]
 
-    for bird in birds:
-        st.markdown(f"""
-        <div class="bird-card {bird['color']}-card">
-            <h3>{bird['symbol']} {bird['name']} — {bird['english']}</h3>
-            <p><em>Arabic: {bird['arabic']}</em></p>
-            <p><strong>Domain:</strong> {bird['domain']}</p>
-            <p><strong>Location:</strong> {bird['locus']}</p>
-            <p>{bird['description']}</p>
-            <p><strong>Key Vocabulary:</strong> {', '.join(bird['vocabulary'])}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    for bird in BIRDS:
+        with st.container(border=True):
+            st.subheader(f"{bird['symbol']} {bird['name']} — {bird['english']}")
+            st.caption(f"Arabic: {bird['arabic']}")
+            st.markdown(
+                f"**Domain:** {bird['domain']}  \n**Location:** {bird['locus']}\n\n"
+                f"{bird['description']}\n\n"
+                f"**Key Vocabulary:** {', '.join(bird['vocabulary'])}"
+            )
 
     # Quiz section
     st.markdown("---")
     st.markdown("### 🎯 Test Your Understanding")
 
-    quiz_questions = [
-        {
-            "question": "Which bird represents civic knowledge and legal rights?",
-            "options": ["Crow", "Eagle", "Anqa", "Ringdove"],
-            "correct": "Eagle"
-        },
-        {
-            "question": "At which location would you find the Crow?",
-            "options": ["Ufa", "Shulgan-Tash", "Yamantau", "Beloretsk"],
-            "correct": "Shulgan-Tash"
-        },
-        {
-            "question": "Which bird represents transformation and potential?",
-            "options": ["Eagle", "Crow", "Anqa", "Ringdove"],
-            "correct": "Anqa"
-        }
-    ]
 
-    for i, q in enumerate(quiz_questions):
-        answer = st.radio(q["question"], q["options"], key=f"quiz_{i}")
-        if st.button("Check", key=f"check_{i}"):
-            if answer == q["correct"]:
-                st.success("âœ… Correct!")
-            else:
-                st.error(f"âŒ The correct answer is: {q['correct']}")
+    birds_quiz()
 
     # === NEW: Kierkegaard's Stages Parallel (Theological-Pedagogical Integration) ===
     st.markdown("---")
     st.markdown("### 🔄 Parallel Frameworks: Ibn Arabi & Kierkegaard")
     
-    st.markdown("""
-    <div class="meditation-box">
-        <em>"The question is, under what categories one wants to contemplate 
-        the entire world and would oneself live."</em>
-        <br>— Kierkegaard, Either/Or
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(KIERKEGAARD_CATEGORIES_HTML, unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
     
@@ -1332,166 +1947,37 @@ elif "Four Birds" in selected_page:
     | 🕊️ Ringdove | Religious | Union with language | Become a Bashkir speaker |
     """)
     
-    st.markdown("""
-    <div class="meditation-box" style="border-color: #cc3333;">
-        <h4>🔇 The Limit of Language (Wittgenstein)</h4>
-        <p><em>"There are indeed, things that are inexpressible. 
-        They show themselves. That is the mystical."</em> — Tractatus 6.522</p>
-        
-        <p>The Anqa's transformation cannot be fully described. 
-        It can only be <strong>undergone</strong>. 
-        No words in this app will make you a Bashkir speaker. 
-        Only practice, commitment, and the leap.</p>
-        
-        <p style="text-align: center; font-size: 1.5em;">🔥🕊️</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(WITTGENSTEIN_LIMIT_HTML, unsafe_allow_html=True)
 
 
 # === PAGE: URAL-BATYR EPIC ===
 elif "Ural-Batyr" in selected_page:
-    st.title("⚔️ Урал-Батыр / Ural-Batyr")
-    st.markdown("*The foundational myth of the Bashkir people — 4,576 lines of heroic legend*")
-
-    # Load epic data
-    epic_data = load_ural_batyr_epic()
-    chapters = epic_data.get('chapters', [])
-    legacy_proverb = epic_data.get('legacy_proverb', {})
-
-    # Legacy proverb banner
-    st.markdown(f"""
-    <div class="meditation-box" style="text-align: center; border-left: none; border: 3px solid #d4af37;">
-        <p style="font-size: 1.3em; margin-bottom: 10px;">✨ <strong>{legacy_proverb.get('bashkir', '')}</strong></p>
-        <p style="font-size: 1.1em; color: #004d00;">{legacy_proverb.get('english', '')}</p>
-        <p style="font-size: 0.9em; color: #666;">[{legacy_proverb.get('phonetic', '')}]</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    # Chapter navigation
-    st.markdown("### 📖 The Ten Chapters")
-    chapter_cols = st.columns(10)
-    for idx, ch in enumerate(chapters):
-        with chapter_cols[idx]:
-            bird_colors = {'Eagle': '#0066B3', 'Crow': '#333333', 'Anqa': '#cc3333', 'Ringdove': '#00AF66'}
-            color = bird_colors.get(ch.get('bird', 'Ringdove'), '#00AF66')
-            if st.button(f"{ch.get('icon', '📖')}", key=f"ch_{idx}", help=ch.get('title', '')):
-                st.session_state.epic_chapter = idx
-
-    # Current chapter display
-    if chapters:
-        current_ch = chapters[st.session_state.epic_chapter]
-
-        # Chapter header
-        bird_colors = {'Eagle': 'eagle', 'Crow': 'crow', 'Anqa': 'anqa', 'Ringdove': 'ringdove'}
-        card_class = bird_colors.get(current_ch.get('bird', 'Ringdove'), 'ringdove')
-
-        st.markdown(f"""
-        <div class="bird-card {card_class}-card">
-            <h2>{current_ch.get('icon', '')} Chapter {current_ch.get('id', '')}: {current_ch.get('title', '')}</h2>
-            <p style="font-size: 1.2em;"><em>{current_ch.get('bashkir', '')}</em></p>
-            <p><strong>Bird Guide:</strong> {current_ch.get('bird', '')} | <strong>Theme:</strong> {current_ch.get('summary', '')}</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Create tabs for chapter content
-        tab1, tab2, tab3, tab4 = st.tabs(["📜 Story", "🧠 Memory Palace", "📚 Vocabulary", "🌟 Unveiling"])
-
-        with tab1:
-            st.markdown("### The Tale")
-            # Split text into paragraphs
-            story_text = current_ch.get('text', '')
-            paragraphs = story_text.split('\n\n')
-            for para in paragraphs:
-                if para.strip():
-                    st.markdown(f"_{para.strip()}_")
-                    st.markdown("")
-
-        with tab2:
-            st.markdown("### 🧠 Method of Loci — Memory Palace Technique")
-            memory = current_ch.get('memory_palace', {})
-
-            st.markdown(f"""
-            <div class="stat-box" style="text-align: left;">
-                <h4>🔑 Memory Peg</h4>
-                <p style="font-size: 1.3em; font-family: monospace; color: #0066B3;">{memory.get('peg', '')}</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-            st.markdown(f"""
-            <div class="mnemonic-text">
-                <h4>🎨 Visualization</h4>
-                <p>{memory.get('image', '')}</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-            st.info(f"**Technique:** {memory.get('technique', '')}")
-
-        with tab3:
-            st.markdown("### 📚 Chapter Vocabulary")
-            vocab = current_ch.get('vocabulary', [])
-            if vocab:
-                vocab_cols = st.columns(len(vocab))
-                for idx, word in enumerate(vocab):
-                    with vocab_cols[idx]:
-                        st.markdown(f"""
-                        <div class="word-card" style="text-align: center;">
-                            <span class="bashkir-text">{word.get('bashkir', '')}</span>
-                            <span class="ipa-text">[{word.get('phonetic', '')}]</span>
-                            <div class="english-text">{word.get('english', '')}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        if st.button(f"🔊 Hear", key=f"epic_audio_{current_ch['id']}_{idx}"):
-                            play_audio(word.get('bashkir', ''), slow=True)
+    st.title("⚔️ Урал-Батыр / Ural-Batyr")
+    st.markdown("*The foundational myth of the Bashkir people — 4,576 lines of heroic legend*")
 
-        with tab4:
-            st.markdown("### 🌟 The Unveiling")
-            unveiling = current_ch.get('unveiling', '')
-            st.markdown(f"""
-            <div class="meditation-box">
-                <p style="font-size: 1.1em; line-height: 1.8;">{unveiling}</p>
-            </div>
-            """, unsafe_allow_html=True)
+    # Load epic data
+    golden = get_golden_light()
+    chapters = golden.chapters
+    legacy_proverb = golden.epic.get('legacy_proverb', {})
 
-            # Connection to the user's twin mythology
-            if current_ch.get('id') == 1:
-                st.markdown("""
-                **The Duality of Twins:** Like Ural and Shulgen, twins carry the potential for both paths.
-                One may seek the light, another may guard the depths. Both are necessary—the hero who
-                sacrifices and the guardian who preserves memory in darkness.
-                """)
+    # Legacy proverb banner
+    st.markdown(render_epic_proverb_html(
+        legacy_proverb.get('bashkir', ''), legacy_proverb.get('english', ''),
+        legacy_proverb.get('phonetic', ''),
+    ), unsafe_allow_html=True)
 
-    # Navigation buttons - centered with better spacing
-    st.markdown("---")
-    nav_col1, nav_col2, nav_col3 = st.columns([1, 1, 1])
-    with nav_col1:
-        if st.session_state.epic_chapter > 0:
-            if st.button("â† Previous Chapter", key="prev_chapter", use_container_width=True):
-                st.session_state.epic_chapter -= 1
-                st.rerun()
-    with nav_col2:
-        # Center indicator
-        st.markdown(f"""
-        <div style="text-align: center; padding: 10px;">
-            <span style="color: #00AF66; font-weight: bold; font-size: 1.2em;">
-                Chapter {st.session_state.epic_chapter + 1} of {len(chapters)}
-            </span>
-        </div>
-        """, unsafe_allow_html=True)
-    with nav_col3:
-        if st.session_state.epic_chapter < len(chapters) - 1:
-            if st.button("Next Chapter â†’", key="next_chapter", use_container_width=True):
-                st.session_state.epic_chapter += 1
-                st.rerun()
+    # Chapter navigation
+    st.markdown("### 📖 The Ten Chapters")
+    render_epic_chapter(chapters)
 
 # === PAGE: GEOGRAPHY ===
 elif "Geography" in selected_page:
-    golden_data = load_golden_light_data()
-    geography = golden_data.get('geography', {})
+    golden = get_golden_light()
+    geography = golden.geography
     geo_title = geography.get('title', {})
-    overview = geography.get('overview', {})
-    cities = geography.get('cities', [])
-    landmarks = geography.get('landmarks', [])
-    facts = geography.get('facts', [])
+    overview = golden.overview
+    cities = golden.cities
+    landmarks = golden.landmarks
     map_bounds = geography.get('map_bounds', {})
 
     st.title("🗺️ Географиә — Geography of Bashkortostan")
@@ -1501,41 +1987,17 @@ elif "Geography" in selected_page:
     st.markdown("### 📊 Republic Overview")
     col1, col2, col3, col4 = st.columns(4)
 
-    with col1:
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3>🛕️</h3>
-            <p style="font-size: 1.1em; font-weight: bold;">{overview.get('capital', '')}</p>
-            <small>Capital</small>
-        </div>
-        """, unsafe_allow_html=True)
+    with col1.container(border=True):
+        st.metric("🛕️ Capital", overview.capital)
 
-    with col2:
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3>📍</h3>
-            <p style="font-size: 1.1em; font-weight: bold;">{overview.get('area_km2', ''):,} kmÂ²</p>
-            <small>Area</small>
-        </div>
-        """, unsafe_allow_html=True)
+    with col2.container(border=True):
+        st.metric("📍 Area", f"{overview.area_km2_str} km²")
 
-    with col3:
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3>👥</h3>
-            <p style="font-size: 1.1em; font-weight: bold;">{overview.get('population', ''):,}</p>
-            <small>Population</small>
-        </div>
-        """, unsafe_allow_html=True)
+    with col3.container(border=True):
+        st.metric("👥 Population", overview.population_str)
 
-    with col4:
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3>🏷️</h3>
-            <p style="font-size: 0.9em; font-weight: bold;">{overview.get('bashkir_name', '')}</p>
-            <small>Official Name</small>
-        </div>
-        """, unsafe_allow_html=True)
+    with col4.container(border=True):
+        st.metric("🏷️ Official Name", overview.bashkir_name)
 
     st.markdown("---")
 
@@ -1544,7 +2006,7 @@ elif "Geography" in selected_page:
 
     with tab1:
         st.markdown("### 🏙️ Major Cities")
-        st.markdown("*Click on a city to hear its Bashkir name*")
+        st.markdown("*Open 🔊 Listen under a city to hear its Bashkir name*")
 
         # Display cities in a grid
         for i in range(0, len(cities), 3):
@@ -1553,22 +2015,20 @@ elif "Geography" in selected_page:
                 if i + j < len(cities):
                     city = cities[i + j]
                     with cols[j]:
-                        city_type_colors = {'capital': '#d4af37', 'major': '#0066B3', 'city': '#00AF66'}
-                        color = city_type_colors.get(city.get('type', 'city'), '#00AF66')
+                        color = city.type_color
 
                         st.markdown(f"""
                         <div class="word-card" style="text-align: center; border-left: 4px solid {color};">
                             <span style="background: {color}; color: white; padding: 2px 8px; border-radius: 4px; font-size: 0.7em;">
-                                {city.get('type', 'city').upper()}
+                                {city.type.upper()}
                             </span>
-                            <h4 style="color: #00AF66; margin: 10px 0;">{city.get('name', '')}</h4>
-                            <p class="bashkir-text" style="font-size: 1.3em;">{city.get('bashkir', '')}</p>
-                            <small>Pop: {city.get('population', '')}</small>
+                            <h4 style="color: #00AF66; margin: 10px 0;">{city.name}</h4>
+                            <p class="bashkir-text" style="font-size: 1.3em;">{city.bashkir}</p>
+                            <small>Pop: {city.population}</small>
                         </div>
                         """, unsafe_allow_html=True)
 
-                        if st.button(f"🔊 Hear", key=f"city_{city.get('name', '')}"):
-                            play_audio(city.get('bashkir', ''), slow=True)
+                        listen_player(city.bashkir, key=city.key)
 
     with tab2:
         st.markdown("### â›°️ Notable Landmarks")
@@ -1578,13 +2038,13 @@ elif "Geography" in selected_page:
             st.markdown(f"""
             <div class="word-card" style="border-left: 5px solid #d4af37;">
                 <div style="display: flex; align-items: flex-start; gap: 15px;">
-                    <span style="font-size: 2.5em;">{landmark.get('icon', '📍️')}</span>
+                    <span style="font-size: 2.5em;">{landmark.icon}</span>
                     <div style="flex: 1;">
-                        <h4 style="color: #00AF66; margin: 0;">{landmark.get('name', '')}</h4>
-                        <p class="bashkir-text" style="font-size: 1.2em; margin: 5px 0;">{landmark.get('bashkir', '')}</p>
-                        <p style="color: #333;">{landmark.get('description', '')}</p>
+                        <h4 style="color: #00AF66; margin: 0;">{landmark.name}</h4>
+                        <p class="bashkir-text" style="font-size: 1.2em; margin: 5px 0;">{landmark.bashkir}</p>
+                        <p style="color: #333;">{landmark.description}</p>
                         <p style="color: #0066B3; font-style: italic; margin-top: 8px;">
-                            🌟 <em>{landmark.get('significance', '')}</em>
+                            🌟 <em>{landmark.significance}</em>
                         </p>
                     </div>
                 </div>
@@ -1592,59 +2052,15 @@ elif "Geography" in selected_page:
             """, unsafe_allow_html=True)
 
     with tab3:
-        st.markdown("### 📚 Geographic & Natural Facts")
-
-        # Filter by category
-        fact_categories = list(set([f.get('category', 'general') for f in facts]))
-        selected_cat = st.selectbox("Filter by category:", ['All'] + fact_categories)
-
-        filtered_facts = facts if selected_cat == 'All' else [f for f in facts if f.get('category') == selected_cat]
-
-        for fact in filtered_facts:
-            cat_colors = {'geography': '#0066B3', 'nature': '#00AF66', 'resources': '#d4af37'}
-            color = cat_colors.get(fact.get('category', ''), '#666')
-
-            st.markdown(f"""
-            <div class="word-card">
-                <span style="background: {color}; color: white; padding: 2px 8px; border-radius: 4px; font-size: 0.8em;">
-                    {fact.get('category', 'general').upper()}
-                </span>
-                <h4 style="color: #00AF66; margin: 10px 0;">{fact.get('title', '')}</h4>
-                <p style="color: #333;">{fact.get('content', '')}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        render_geography_facts(golden)
 
     with tab4:
         st.markdown("### 🗺️ Map of Bashkortostan")
         st.markdown("*Interactive map showing cities and landmarks*")
 
-        # Create map data for Streamlit
-        try:
-            import pandas as pd
-
-            # Combine cities and landmarks for mapping
-            map_data = []
-
-            for city in cities:
-                map_data.append({
-                    'lat': city.get('lat', 54.0),
-                    'lon': city.get('lon', 56.0),
-                    'name': f"🏙️ {city.get('name', '')} ({city.get('bashkir', '')})",
-                    'type': 'city'
-                })
-
-            for landmark in landmarks:
-                map_data.append({
-                    'lat': landmark.get('lat', 54.0),
-                    'lon': landmark.get('lon', 56.0),
-                    'name': f"{landmark.get('icon', 'â›°️')} {landmark.get('name', '')} ({landmark.get('bashkir', '')})",
-                    'type': 'landmark'
-                })
-
-            df = pd.DataFrame(map_data)
-
+        if PANDAS_AVAILABLE:
             # Display the map
-            st.map(df, latitude='lat', longitude='lon', zoom=6)
+            st.map(golden.map_frame, latitude='lat', longitude='lon', zoom=6)
 
             # Legend
             st.markdown("""
@@ -1657,7 +2073,7 @@ elif "Geography" in selected_page:
             *Map data: OpenStreetMap contributors*
             """)
 
-        except ImportError:
+        else:
             st.warning("Install pandas for map functionality: `pip install pandas`")
             st.info(f"Map would show area from {map_bounds.get('south')}Â° to {map_bounds.get('north')}Â° N, "
                     f"{map_bounds.get('west')}Â° to {map_bounds.get('east')}Â° E")
@@ -1680,82 +2096,8 @@ elif "Media" in selected_page:
         st.markdown("### 📺 Bashkir Television")
         st.markdown("*Live and recorded content from Bashkir TV channels*")
 
-        # Dimmed viewing container
-        st.markdown("""
-        <style>
-        .tv-container {
-            background: linear-gradient(180deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%);
-            padding: 30px;
-            border-radius: 20px;
-            box-shadow: 0 0 40px rgba(0,0,0,0.5);
-        }
-        .channel-card {
-            background: rgba(255,255,255,0.1);
-            padding: 15px;
-            border-radius: 10px;
-            margin: 10px 0;
-            border: 1px solid rgba(255,255,255,0.2);
-        }
-        .channel-card:hover {
-            background: rgba(255,255,255,0.2);
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # TV Channels
-        st.markdown('<div class="tv-container">', unsafe_allow_html=True)
-
-        tv_channels = [
-            {
-                "name": "БСТ (Bashkir Satellite Television)",
-                "description": "Main Bashkir language broadcaster - news, culture, entertainment",
-                "stream_url": "https://bst.tv/live",
-                "icon": "📡"
-            },
-            {
-                "name": "Ðšурай ТВ (Kuray TV)",
-                "description": "Music and cultural programs featuring traditional Bashkir arts",
-                "stream_url": "https://kuray.tv",
-                "icon": "🎵"
-            },
-            {
-                "name": "Салават Юлаев ТВ",
-                "description": "Sports channel - hockey and regional sports coverage",
-                "stream_url": "#",
-                "icon": "💬"
-            },
-            {
-                "name": "Тамыр (Tamyr)",
-                "description": "Children's programming in Bashkir language",
-                "stream_url": "#",
-                "icon": "👶"
-            }
-        ]
-
-        col1, col2 = st.columns([2, 1])
-
-        with col1:
-            st.markdown("#### 📺 Available Channels")
-            for channel in tv_channels:
-                st.markdown(f"""
-                <div class="channel-card">
-                    <h4 style="color: #00AF66; margin: 0;">{channel['icon']} {channel['name']}</h4>
-                    <p style="color: #aaa; margin: 5px 0;">{channel['description']}</p>
-                    <small style="color: #666;">Stream: {channel['stream_url']}</small>
-                </div>
-                """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown("#### 🕐 TV Schedule (Sample)")
-            st.markdown("""
-            **БСТ Tonight:**
-            - 18:00 — Хәбәрҙәр (News)
-            - 19:00 — Йырҙар (Songs)
-            - 20:00 — Ó˜киәт (Folk Tales)
-            - 21:00 — Документаль (Documentary)
-            """)
-
-        st.markdown('</div>', unsafe_allow_html=True)
+        # TV Channels and schedule
+        st.html(render_tv_guide_html())
 
         # VLC Player Section
         st.markdown("---")
@@ -1778,21 +2120,7 @@ elif "Media" in selected_page:
         st.markdown("#### 📹 Sample Bashkir Content")
         st.markdown("*Educational content about Bashkir language and culture*")
 
-        sample_videos = [
-            {"title": "Bashkir Alphabet Song", "desc": "Learn the letters through music"},
-            {"title": "Ural-Batyr Animation", "desc": "The epic legend told visually"},
-            {"title": "Kuray Performance", "desc": "Traditional Bashkir flute music"}
-        ]
-
-        video_cols = st.columns(3)
-        for idx, video in enumerate(sample_videos):
-            with video_cols[idx]:
-                st.markdown(f"""
-                <div class="stat-box" style="text-align: center;">
-                    <h5>{video['title']}</h5>
-                    <p style="font-size: 0.9em; color: #666;">{video['desc']}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        st.html(render_sample_videos_html())
 
     # === REAL RUSSIA TAB ===
     with media_tab2:
@@ -1819,44 +2147,7 @@ elif "Media" in selected_page:
             st.markdown("#### 📰 Latest from Real Russia")
 
             # Simulated RSS-style feed entries
-            feed_entries = [
-                {
-                    "title": "Exploring Bashkir Villages",
-                    "preview": "Today we visited a traditional Bashkir village where honey is still harvested the ancient way...",
-                    "date": "2 hours ago",
-                    "engagement": "1.2K views"
-                },
-                {
-                    "title": "Russian Language Tips",
-                    "preview": "Quick lesson on common mistakes foreigners make when speaking Russian...",
-                    "date": "Yesterday",
-                    "engagement": "3.4K views"
-                },
-                {
-                    "title": "Ural Mountains Winter",
-                    "preview": "The Southern Urals are magical in winter. Here's what it's like to hike in -20Â°C...",
-                    "date": "3 days ago",
-                    "engagement": "5.6K views"
-                },
-                {
-                    "title": "Local Food Guide: Ufa",
-                    "preview": "The best places to try authentic Bashkir cuisine in the capital city...",
-                    "date": "1 week ago",
-                    "engagement": "8.2K views"
-                }
-            ]
-
-            for entry in feed_entries:
-                st.markdown(f"""
-                <div class="word-card" style="border-left: 4px solid #0088cc;">
-                    <h4 style="color: #004d00; margin-bottom: 5px;">{entry['title']}</h4>
-                    <p style="color: #333; margin: 10px 0;">{entry['preview']}</p>
-                    <div style="display: flex; justify-content: space-between; color: #666; font-size: 0.9em;">
-                        <span>â° {entry['date']}</span>
-                        <span>👀️ {entry['engagement']}</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            st.html("".join(FEED_CARD_TPL % entry for entry in FEED_ENTRIES))
 
         with col2:
             # Channel Info
@@ -1870,7 +2161,7 @@ elif "Media" in selected_page:
             """, unsafe_allow_html=True)
 
             st.markdown("#### 🔗 Connect")
-            st.link_button("📱 Open Telegram Channel", "https://t.me/baklykovlive", use_container_width=True)
+            st.link_button("📱 Open Telegram Channel", "https://t.me/baklykovlive", width="stretch")
 
             st.markdown("#### 🎯 Why Follow?")
             st.markdown("""
@@ -1898,62 +2189,17 @@ elif "Media" in selected_page:
         with download_categories[0]:
             st.markdown("#### 📄 PDF Resources")
 
-            pdf_resources = [
-                {"name": "Bashkir Alphabet Chart", "size": "1.2 MB", "desc": "Complete 42-letter alphabet with examples"},
-                {"name": "Basic Phrases Guide", "size": "850 KB", "desc": "100 essential phrases for beginners"},
-                {"name": "Grammar Reference", "size": "2.4 MB", "desc": "Comprehensive Bashkir grammar guide"},
-                {"name": "OCM Cultural Categories", "size": "1.8 MB", "desc": "Outline of Cultural Materials reference"}
-            ]
-
-            for pdf in pdf_resources:
-                col1, col2, col3 = st.columns([3, 1, 1])
-                with col1:
-                    st.markdown(f"**{pdf['name']}**")
-                    st.caption(pdf['desc'])
-                with col2:
-                    st.caption(pdf['size'])
-                with col3:
-                    st.button(f"📥 Download", key=f"dl_{pdf['name'][:10]}")
+            render_resource_table(PDF_RESOURCES, "size", "Size")
 
         with download_categories[1]:
             st.markdown("#### 🎵 Audio Resources")
 
-            audio_resources = [
-                {"name": "Alphabet Pronunciation", "duration": "5:30", "desc": "All 42 letters spoken clearly"},
-                {"name": "Basic Vocabulary Pack", "duration": "15:00", "desc": "First 100 words with repetition"},
-                {"name": "Kuray Music Collection", "duration": "45:00", "desc": "Traditional flute performances"},
-                {"name": "Ural-Batyr Epic Reading", "duration": "2:30:00", "desc": "Complete epic narration"}
-            ]
-
-            for audio in audio_resources:
-                col1, col2, col3 = st.columns([3, 1, 1])
-                with col1:
-                    st.markdown(f"**{audio['name']}**")
-                    st.caption(audio['desc'])
-                with col2:
-                    st.caption(f"🕐 {audio['duration']}")
-                with col3:
-                    st.button(f"📥 Download", key=f"dla_{audio['name'][:10]}")
+            render_resource_table(AUDIO_RESOURCES, "duration", "Duration")
 
         with download_categories[2]:
             st.markdown("#### 📖 Text Resources")
 
-            text_resources = [
-                {"name": "Word List (JSON)", "format": "JSON", "desc": "Complete vocabulary database"},
-                {"name": "Sentence Patterns", "format": "TXT", "desc": "Common sentence structures"},
-                {"name": "Cultural Context Notes", "format": "MD", "desc": "OCM-categorized cultural information"},
-                {"name": "Memory Palace Map", "format": "JSON", "desc": "Loci data with Ibn Arabi connections"}
-            ]
-
-            for text in text_resources:
-                col1, col2, col3 = st.columns([3, 1, 1])
-                with col1:
-                    st.markdown(f"**{text['name']}**")
-                    st.caption(text['desc'])
-                with col2:
-                    st.caption(f"📄 {text['format']}")
-                with col3:
-                    st.button(f"📥 Download", key=f"dlt_{text['name'][:10]}")
+            render_resource_table(TEXT_RESOURCES, "format", "Format")
 
     # === MEDIA TRANSCRIPT TAB ===
     with media_tab4:
@@ -1986,33 +2232,41 @@ elif "Media" in selected_page:
                     ["Plain Text", "With Timestamps", "SRT Subtitles"]
                 )
 
-            if st.button("🎯 Start Transcription", use_container_width=True):
-                with st.spinner("Transcribing audio... This may take a moment."):
-                    import time
-                    time.sleep(2)  # Simulated processing
-
-                st.success("âœ… Transcription complete!")
-
-                # Sample output
-                st.markdown("#### 📜 Transcription Result")
-                st.markdown("""
-                <div class="word-card" style="background: #f5f5f5;">
-                    <p style="font-family: monospace; white-space: pre-wrap;">
-[00:00:02] Òºаумыһығыҙ, дуҫтар!
-[00:00:05] Бүген беҙ Башҡортостан тураһында һөйләшербеҙ.
-[00:00:10] Башҡортостан — бик матур ер.
-[00:00:15] Унда тау, урман, йылға бар.
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
-
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.button("📋 Copy Text")
-                with col2:
-                    st.button("📥 Download TXT")
-                with col3:
-                    st.button("📥 Download SRT")
+            transcription_languages = {"Bashkir (Башҡорт)": "ba", "Russian (Русский)": "ru", "Mixed/Auto-detect": None}
+            job = st.session_state.get('transcription_job')
+            if st.button("🎯 Start Transcription", width="stretch"):
+                future = get_transcription_executor().submit(
+                    _transcribe_upload, uploaded_file.getvalue(),
+                    Path(uploaded_file.name).suffix, transcription_languages[language_mode],
+                )
+                job = st.session_state.transcription_job = (uploaded_file.file_id, future)
+
+            if job is not None and job[0] == uploaded_file.file_id:
+                future = job[1]
+                error = future.exception() if future.done() else None
+                segments = future.result() if future.done() and error is None else None
+                if not future.done():
+                    await_transcription(future)
+                elif error is not None:
+                    st.error(f"❌ Transcription failed: {error}")
+                elif segments:
+                    st.success("âœ… Transcription complete!")
+
+                    st.markdown("#### 📜 Transcription Result")
+                    st.code(format_transcript(segments, output_format), language=None)
+
+                    stem = Path(uploaded_file.name).stem
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.download_button("📥 Download TXT", format_transcript(segments, "Plain Text"),
+                                           file_name=f"{stem}.txt", width="stretch")
+                    with col2:
+                        st.download_button("📥 Download SRT", format_transcript(segments, "SRT Subtitles"),
+                                           file_name=f"{stem}.srt", width="stretch")
+                elif not WHISPER_AVAILABLE:
+                    st.warning("No speech recognized. Transcription requires faster-whisper to be installed.")
+                else:
+                    st.info("No speech recognized in this file.")
         else:
             st.markdown("""
             <div class="meditation-box" style="text-align: center;">
@@ -2043,12 +2297,12 @@ elif "Media" in selected_page:
 
         with col2:
             st.markdown("##### 🔤 Quick Insert")
-            special_chars = ['ә', 'ө', 'ү', 'ҡ', 'ғ', 'һ', 'ҙ', 'ҫ', 'Ò£']
-            char_cols = st.columns(3)
-            for idx, char in enumerate(special_chars):
-                with char_cols[idx % 3]:
-                    if st.button(char, key=f"char_{char}"):
-                        st.toast(f"Copied: {char}")
+            special_chars = ('ә', 'ө', 'ү', 'ҡ', 'ғ', 'һ', 'ҙ', 'ҫ', 'Ò£')
+            st.pills(
+                "Quick Insert", special_chars, key="quick_insert_char",
+                on_change=toast_selected_char, args=("quick_insert_char",),
+                label_visibility="collapsed",
+            )
 
         st.markdown("---")
 
@@ -2073,11 +2327,11 @@ elif "Media" in selected_page:
 
 # === PAGE: ALPHABET ===
 elif "Alphabet" in selected_page:
-    golden_data = load_golden_light_data()
-    alphabet_data = golden_data.get('alphabet', {})
+    golden = get_golden_light()
+    alphabet_data = golden.alphabet
     alphabet_title = alphabet_data.get('title', {})
-    full_alphabet = alphabet_data.get('full_alphabet', [])
-    special_letters = alphabet_data.get('special_letters', [])
+    full_alphabet = golden.full_alphabet
+    special_letters = golden.special_letters
 
     st.title("🔤 Башҡорт әлифбаһы — The Bashkir Alphabet")
     st.markdown(f"*{alphabet_data.get('description', '')}*")
@@ -2085,25 +2339,11 @@ elif "Alphabet" in selected_page:
     # Full alphabet display
     st.markdown("### 📍 The Complete Alphabet (42 Letters)")
 
-    # Display alphabet in rows
-    cols_per_row = 14
-    for i in range(0, len(full_alphabet), cols_per_row):
-        row_letters = full_alphabet[i:i + cols_per_row]
-        cols = st.columns(cols_per_row)
-        for j, letter in enumerate(row_letters):
-            with cols[j]:
-                # Highlight special Bashkir letters
-                is_special = letter in ['Ó˜', 'Ө', 'Ò®', 'Ò’', 'Ò ', 'Ò¢', 'Ò˜', 'Òª', 'Òº']
-                bg_color = '#00AF66' if is_special else '#e6f2ff'
-                text_color = 'white' if is_special else '#004d00'
-
-                st.markdown(f"""
-                <div style="background: {bg_color}; color: {text_color}; padding: 10px;
-                            text-align: center; border-radius: 8px; font-size: 1.5em;
-                            font-weight: bold; margin: 2px; border: 2px solid #0066B3;">
-                    {letter}
-                </div>
-                """, unsafe_allow_html=True)
+    # Display alphabet as one 14-column grid, special Bashkir letters highlighted
+    letters = tuple(
+        (letter, letter in SPECIAL_LETTERS) for letter in full_alphabet
+    )
+    st.html(render_alphabet_grid_html(letters, 14))
 
     st.markdown("""
     <p style="text-align: center; color: #666; margin-top: 10px;">
@@ -2119,31 +2359,30 @@ elif "Alphabet" in selected_page:
     st.markdown("*These unique letters represent sounds not found in Russian*")
 
     for letter_info in special_letters:
-        st.markdown(f"""
+        st.html(f"""
         <div class="word-card" style="display: flex; align-items: center; gap: 20px;">
             <div style="background: linear-gradient(135deg, #00AF66 0%, #008f55 100%);
                         color: white; padding: 20px 30px; border-radius: 12px;
                         font-size: 2.5em; font-weight: bold; min-width: 80px; text-align: center;">
-                {letter_info.get('letter', '')}
+                {letter_info.letter}
             </div>
             <div style="flex: 1;">
-                <h4 style="color: #00AF66; margin: 0 0 5px 0;">{letter_info.get('name', '')}</h4>
+                <h4 style="color: #00AF66; margin: 0 0 5px 0;">{letter_info.name}</h4>
                 <p style="color: #0066B3; margin: 5px 0;">
-                    🔊 Sound: <strong>{letter_info.get('sound', '')}</strong>
+                    🔊 Sound: <strong>{letter_info.sound}</strong>
                 </p>
                 <p style="color: #333; margin: 5px 0;">
-                    📍 Example: <span class="bashkir-text" style="font-size: 1.1em;">{letter_info.get('example', '')}</span>
+                    📍 Example: <span class="bashkir-text" style="font-size: 1.1em;">{letter_info.example}</span>
                 </p>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
         # Audio button for example
-        example_word = letter_info.get('example', '').split(' ')[0]  # Get just the Bashkir word
         col1, col2 = st.columns([1, 4])
         with col1:
-            if st.button(f"🔊 Hear example", key=f"alpha_{letter_info.get('letter', '')}"):
-                play_audio(example_word, slow=True)
+            if st.button(f"🔊 Hear example", key=f"alpha_{letter_info.letter}"):
+                play_audio(letter_info.example_word, slow=True)
         with col2:
             st.write("")
 
@@ -2151,19 +2390,7 @@ elif "Alphabet" in selected_page:
     st.markdown("---")
     st.markdown("### 🎯 Quick Reference")
 
-    st.markdown("""
-    | Letter | IPA | Similar To | Example |
-    |:------:|:---:|:-----------|:--------|
-    | **Ó˜** | /Ã¦/ | 'a' in "cat" | әсә (mother) |
-    | **Ө** | /Ã¸/ | German 'Ã¶' | өй (house) |
-    | **Ò®** | /y/ | German 'Ã¼' | үҙ (self) |
-    | **Ò’** | /Ê/ | Arabic 'Øº' (gh) | ғаилә (family) |
-    | **Ò ** | /q/ | Deep throat 'k' | ҡыҙ (girl) |
-    | **Ò¢** | /Å‹/ | 'ng' in "sing" | таÒ£ (dawn) |
-    | **Ò˜** | // | 'th' in "this" | ҙур (big) |
-    | **Òª** | /Î¸/ | 'th' in "think" | ҫәс (hair) |
-    | **Òº** | /h/ | 'h' in "house" | һыу (water) |
-    """)
+    st.dataframe(dict(ALPHABET_REFERENCE), hide_index=True, width="stretch")
 
 # === PAGE: SENTENCE BUILDER (Enhanced with Audio Export and Working Word Bank) ===
 elif "Sentence Builder" in selected_page:
@@ -2196,89 +2423,7 @@ elif "Sentence Builder" in selected_page:
     st.markdown("### 🐦 Word Bank")
     st.markdown("*Click words to add them to your sentence. Words are organized by semantic categories.*")
 
-    # Define OCM-based semantic categories for nouns
-    nature_ocm = ['131', '132', '133', '134', '137', '138', '139', '221', '222', '231', '232', '233', '234', '235', '241', '242', '243', '244', '245', '246', '251', '252', '253', '254', '255', '256', '257', '258', '259']
-    culture_ocm = ['530', '531', '532', '533', '534', '535', '536', '537', '538', '539', '541', '542', '543', '544', '545', '551', '552', '553', '554', '561', '562', '563', '564', '565', '566', '571', '572', '573', '574', '575', '576', '577', '578', '579', '581', '582', '583', '584', '585', '586', '587']
-    people_ocm = ['591', '592', '593', '594', '595', '596', '597', '598', '599', '601', '602', '603', '604', '605', '606', '607', '608', '609', '610', '611', '612', '621', '622', '623', '624', '625', '626', '627', '628', '629']
-    places_ocm = ['361', '362', '363', '364', '365', '366', '367', '368', '369', '481', '482', '483', '484', '485', '486', '487', '488', '489', '131', '784']
-
-    # Nature keywords for backup categorization
-    nature_keywords = ['тау', 'ҡояш', 'ай', 'йондоҙ', 'һыу', 'йылға', 'күл', 'диÒ£геҙ', 'урман', 'ағас', 'сәскә', 'үлән', 'ҡош', 'айыу', 'бүре', 'ҡуй', 'ат', 'һыйыр', 'балыҡ', 'йылан', 'ел', 'ҡар', 'боҙ', 'ямғыр', 'болот', 'көн', 'төн', 'яҙ', 'йәй', 'көҙ', 'ҡыш', 'таш', 'туфраҡ', 'ер', 'нур']
-    culture_keywords = ['байрам', 'сабантуй', 'туй', 'йола', 'әкиәт', 'риүәйәт', 'йыр', 'моÒ£', 'бейеү', 'ҡурай', 'думбыра', 'ҡубыҙ', 'бал', 'ҡымыҙ', 'буҙа', 'икмәк', 'ит', 'аш', 'сәй', 'тирмә', 'биҙәк', 'ойма', 'көрәш', 'уйын', 'дин', 'мәсьет', 'театр']
-    people_keywords = ['ата', 'әсә', 'бала', 'ҡыҙ', 'егет', 'бабай', 'өләсәй', 'туғандар', 'ғаилә', 'халыҡ', 'милләт', 'дуҫ', 'ҡунаҡ', 'уҡытыусы', 'эшсе', 'оҫта', 'батыр', 'граждан', 'президент']
-    places_keywords = ['Өфө', 'Башҡортостан', 'ҡала', 'урам', 'мәйҙан', 'өй', 'йорт', 'мәктәп', 'завод', 'магазин', 'банк', 'поÑ‡та', 'ил', 'дәүләт', 'республика', 'Ағиҙел', 'Шүлгәнташ', 'Ямантау', 'Ð˜ремәл', 'Бижбуляк', 'Белорет']
-
-    # Expanded word categories
-    word_categories = {
-        "👥 Pronouns": [],
-        "🌿 Nature": [],
-        "🎭 Culture": [],
-        "👨â€👩â€👧 People": [],
-        "🛕️ Places": [],
-        "💭 Concepts": [],
-        "🎬 Verbs": [],
-        "📍 Adjectives": [],
-        "🔢 Numbers": []
-    }
-
-    for word in words_data:
-        pos = word.get('pos', 'noun').lower()
-        bashkir = word['bashkir']
-        english = word.get('english', '').lower()
-
-        # Get OCM codes from word data
-        ocm_codes = []
-        if 'cultural_context' in word and 'ocm_codes' in word['cultural_context']:
-            ocm_codes = word['cultural_context']['ocm_codes']
-
-        if pos == 'pronoun':
-            word_categories["👥 Pronouns"].append(bashkir)
-        elif pos == 'verb':
-            word_categories["🎬 Verbs"].append(bashkir)
-        elif pos in ['adjective', 'adj']:
-            word_categories["📍 Adjectives"].append(bashkir)
-        elif pos in ['number', 'numeral']:
-            word_categories["🔢 Numbers"].append(bashkir)
-        elif pos == 'noun':
-            # Categorize nouns by OCM code or keywords
-            categorized = False
-
-            # Check OCM codes first
-            for code in ocm_codes:
-                if code in nature_ocm:
-                    word_categories["🌿 Nature"].append(bashkir)
-                    categorized = True
-                    break
-                elif code in culture_ocm:
-                    word_categories["🎭 Culture"].append(bashkir)
-                    categorized = True
-                    break
-                elif code in people_ocm:
-                    word_categories["👨â€👩â€👧 People"].append(bashkir)
-                    categorized = True
-                    break
-                elif code in places_ocm:
-                    word_categories["🛕️ Places"].append(bashkir)
-                    categorized = True
-                    break
-
-            # If not categorized by OCM, check keywords
-            if not categorized:
-                if any(kw in bashkir for kw in nature_keywords) or any(kw in english for kw in ['sun', 'moon', 'star', 'water', 'river', 'lake', 'tree', 'forest', 'bird', 'animal', 'wolf', 'bear', 'fish', 'horse', 'cow', 'sheep', 'snow', 'rain', 'wind', 'day', 'night', 'spring', 'summer', 'autumn', 'winter', 'flower', 'grass', 'mountain', 'stone', 'earth', 'sky']):
-                    word_categories["🌿 Nature"].append(bashkir)
-                elif any(kw in bashkir for kw in culture_keywords) or any(kw in english for kw in ['festival', 'wedding', 'song', 'dance', 'music', 'honey', 'kumis', 'bread', 'meat', 'tea', 'food', 'tradition', 'legend', 'tale', 'story', 'holiday', 'craft', 'art', 'ornament', 'religion']):
-                    word_categories["🎭 Culture"].append(bashkir)
-                elif any(kw in bashkir for kw in people_keywords) or any(kw in english for kw in ['father', 'mother', 'child', 'girl', 'boy', 'grandfather', 'grandmother', 'family', 'relative', 'people', 'nation', 'friend', 'guest', 'teacher', 'worker', 'hero', 'citizen', 'president']):
-                    word_categories["👨â€👩â€👧 People"].append(bashkir)
-                elif any(kw in bashkir for kw in places_keywords) or any(kw in english for kw in ['city', 'street', 'square', 'house', 'home', 'school', 'factory', 'shop', 'bank', 'post', 'country', 'state', 'republic', 'capital', 'village', 'ufa', 'bashkortostan']):
-                    word_categories["🛕️ Places"].append(bashkir)
-                else:
-                    word_categories["💭 Concepts"].append(bashkir)
-        else:
-            word_categories["💭 Concepts"].append(bashkir)
-
-    # Remove empty categories and deduplicate
-    word_categories = {k: list(dict.fromkeys(v)) for k, v in word_categories.items() if v}
+    word_categories = load_word_bank_categories()
 
     if word_categories:
         # Create tabs with expanded categories
@@ -2288,27 +2433,17 @@ elif "Sentence Builder" in selected_page:
             with tab:
                 st.markdown(f"**{len(word_list)} words available:**")
 
-                # Display words in a grid - 4 columns for better readability
-                cols_per_row = 4
+                # Display words as one pills grid rather than a button per word
                 max_words = 40  # Increased limit for better coverage
-                for row_start in range(0, min(len(word_list), max_words), cols_per_row):
-                    cols = st.columns(cols_per_row)
-                    for idx, col in enumerate(cols):
-                        word_idx = row_start + idx
-                        if word_idx < len(word_list):
-                            word = word_list[word_idx]
-                            word_data = next((w for w in words_data if w['bashkir'] == word), None)
-                            english = word_data.get('english', '?') if word_data else '?'
-
-                            with col:
-                                # Create a unique key for each word button
-                                btn_key = f"wb_{category[:3]}_{word_idx}_{word[:5] if len(word) >= 5 else word}"
-                                if st.button(f"**{word}**\n_{english}_", key=btn_key, use_container_width=True):
-                                    st.session_state.builder_sentence.append({
-                                        'word': word,
-                                        'english': english
-                                    })
-                                    st.rerun()
+                st.pills(
+                    f"{category} words",
+                    word_list[:max_words],
+                    format_func=lambda w: f"{w} · {words_by_bashkir.get(w, {}).get('english', '?')}",
+                    key=f"wb_{category}",
+                    on_change=add_word_bank_pick,
+                    args=(f"wb_{category}",),
+                    label_visibility="collapsed",
+                )
 
                 if len(word_list) > max_words:
                     st.caption(f"*Showing {max_words} of {len(word_list)} words. Use search in Audio Dictionary for more.*")
@@ -2351,6 +2486,7 @@ elif "Sentence Builder" in selected_page:
                     'gloss': gloss_text,
                     'created': datetime.now().isoformat()
                 })
+                save_session()
                 st.success("Sentence saved to your phrasebook!")
 
         with col4:
@@ -2360,14 +2496,7 @@ elif "Sentence Builder" in selected_page:
 
         # Audio export
         st.markdown("### 💾 Export Audio")
-        audio_bytes = generate_audio_with_retry(sentence_text, slow=True)
-        if audio_bytes:
-            st.download_button(
-                label="â¬‡️ Download Audio (MP3)",
-                data=audio_bytes,
-                file_name=f"bashkir_sentence_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3",
-                mime="audio/mp3"
-            )
+        audio_download_button(sentence_text, f"bashkir_sentence_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3", label="â¬‡️ Download Audio (MP3)")
 
         # Grammar notes
         st.markdown("### 📖 Grammar Helper")
@@ -2391,7 +2520,9 @@ elif "Sentence Builder" in selected_page:
         st.markdown("---")
         st.markdown("### 📒 Your Phrasebook")
 
-        for idx, sentence in enumerate(st.session_state.saved_sentences[-5:]):
+        # Index into the full phrasebook so Remove pops (and keys name) the right entry
+        first_shown = max(len(st.session_state.saved_sentences) - 5, 0)
+        for idx, sentence in enumerate(st.session_state.saved_sentences[first_shown:], first_shown):
             with st.container():
                 st.markdown(f"""
                 <div class="word-card">
@@ -2405,18 +2536,11 @@ elif "Sentence Builder" in selected_page:
                     if st.button(f"â–¶️ Play", key=f"play_saved_{idx}"):
                         play_audio(sentence['bashkir'], slow=True)
                 with sent_col2:
-                    audio_data = generate_audio_with_retry(sentence['bashkir'], slow=True)
-                    if audio_data:
-                        st.download_button(
-                            label="â¬‡️ Download",
-                            data=audio_data,
-                            file_name=f"sentence_{idx+1}.mp3",
-                            mime="audio/mp3",
-                            key=f"download_saved_{idx}"
-                        )
+                    audio_download_button(sentence['bashkir'], f"sentence_{idx+1}.mp3", label="â¬‡️ Download", key=f"download_saved_{idx}")
                 with sent_col3:
                     if st.button(f"🗑️ Remove", key=f"remove_saved_{idx}"):
                         st.session_state.saved_sentences.pop(idx)
+                        save_session()
                         st.rerun()
 
 # === PAGE: AUDIO DICTIONARY (Enhanced with OCM Categories) ===
@@ -2425,9 +2549,9 @@ elif "Audio Dictionary" in selected_page:
     st.markdown("*Listen to all Bashkir words organized by cultural categories (OCM eHRAF 2021)*")
 
     # Load OCM mapping
-    ocm_data = load_ocm_mapping()
-    thematic_groups = ocm_data.get('thematic_groups', {})
-    ocm_labels = ocm_data.get('ocm_labels', {})
+    ocm = get_ocm_index()
+    thematic_groups = ocm.groups
+    ocm_labels = ocm.labels
 
     # Search bar with improved styling
     st.markdown("### 📄 Search")
@@ -2437,10 +2561,11 @@ elif "Audio Dictionary" in selected_page:
 
     # Filter words based on search
     if search_term:
-        filtered_words = [w for w in words_data if
-                         search_term.lower() in w['bashkir'].lower() or
-                         search_term.lower() in w.get('english', '').lower() or
-                         search_term.lower() in w.get('russian', '').lower()]
+        search_index, longest_field = load_search_index()
+        q = search_term.lower()
+        filtered_words = [] if len(q) > longest_field else [
+            w for w, b, e, r in search_index if q in b or q in e or q in r
+        ]
         st.markdown(f"**Found {len(filtered_words)} matching words**")
 
         # Show search results
@@ -2465,20 +2590,12 @@ elif "Audio Dictionary" in selected_page:
 
                 with col2:
                     st.markdown("**🔊 Audio:**")
-                    if st.button("â–¶️ Normal", key=f"audio_normal_{word['id']}"):
+                    if st.button("â–¶️ Normal", key=f"an{word['word_id']}"):
                         play_audio(word['bashkir'], slow=False)
-                    if st.button("🏢 Slow", key=f"audio_slow_{word['id']}"):
+                    if st.button("🏢 Slow", key=f"as{word['word_id']}"):
                         play_audio(word['bashkir'], slow=True)
 
-                    audio_bytes = generate_audio_with_retry(word['bashkir'], slow=True)
-                    if audio_bytes:
-                        st.download_button(
-                            label="â¬‡️ Download",
-                            data=audio_bytes,
-                            file_name=f"{word['bashkir']}.mp3",
-                            mime="audio/mp3",
-                            key=f"download_{word['id']}"
-                        )
+                    audio_download_button(word['bashkir'], f"{word['bashkir']}.mp3", label="â¬‡️ Download", key=f"ad{word['word_id']}")
     else:
         # Show all words organized by OCM thematic groups
         st.markdown("---")
@@ -2492,68 +2609,50 @@ elif "Audio Dictionary" in selected_page:
         if display_names:
             tabs = st.tabs(display_names)
 
-            for tab, group_key in zip(tabs, group_names):
+            for group_idx, (tab, group_key) in enumerate(zip(tabs, group_names)):
                 with tab:
                     group_info = thematic_groups[group_key]
-                    group_words_list = group_info.get('words', [])
                     ocm_codes = group_info.get('ocm_codes', [])
 
                     # Get OCM labels for this group
-                    ocm_names = [f"{code}: {ocm_labels.get(code, 'Unknown')}" for code in ocm_codes[:5]]
+                    ocm_names = [ocm.code_title(code) for code in ocm_codes[:5]]
 
                     st.markdown(f"**OCM Categories:** {', '.join(ocm_names[:3])}...")
 
-                    # Find matching words from words_data
-                    matching_words = []
-                    for word in words_data:
-                        word_ocm = word.get('cultural_context', {}).get('ocm_codes', [])
-                        if any(code in word_ocm for code in ocm_codes):
-                            matching_words.append(word)
-                        elif word['bashkir'] in group_words_list:
-                            matching_words.append(word)
-
-                    # Remove duplicates
+                    # Find matching words from words_data, skipping duplicate headwords
+                    ocm_codes_set = ocm.group_code_sets[group_key]
+                    group_words_set = ocm.group_word_sets[group_key]
                     seen = set()
                     unique_words = []
-                    for w in matching_words:
-                        if w['bashkir'] not in seen:
-                            seen.add(w['bashkir'])
-                            unique_words.append(w)
+                    for word in words_data:
+                        bashkir = word['bashkir']
+                        if bashkir in seen:
+                            continue
+                        word_ocm = word.get('cultural_context', {}).get('ocm_codes', ())
+                        if not ocm_codes_set.isdisjoint(word_ocm) or bashkir in group_words_set:
+                            seen.add(bashkir)
+                            unique_words.append(word)
 
                     if unique_words:
                         st.markdown(f"**{len(unique_words)} words in this category:**")
 
-                        # Display in groups of 3-4 per row
+                        # Display in rows of 3: one card-row element, then controls per word
                         for i in range(0, len(unique_words), 3):
-                            cols = st.columns(3)
-                            for j, col in enumerate(cols):
-                                if i + j < len(unique_words):
-                                    word = unique_words[i + j]
-                                    with col:
-                                        st.markdown(f"""
-                                        <div class="word-card" style="text-align: center; min-height: 120px;">
-                                            <span class="bashkir-text" style="font-size: 1.6em;">{word['bashkir']}</span>
-                                            <span class="ipa-text">{word.get('ipa', '')}</span>
-                                            <div style="color: #004d00; font-size: 1.1em; margin: 8px 0;">{word.get('english', '')}</div>
-                                            <small style="color: #666;">🇷🇺 {word.get('russian', '')}</small>
-                                        </div>
-                                        """, unsafe_allow_html=True)
-
-                                        bcol1, bcol2 = st.columns(2)
-                                        with bcol1:
-                                            if st.button("🔊", key=f"cat_audio_{group_key}_{word['id']}",
-                                                        help=f"Play {word['bashkir']}"):
-                                                play_audio(word['bashkir'], slow=True)
-                                        with bcol2:
-                                            audio_data = generate_audio_with_retry(word['bashkir'], slow=True)
-                                            if audio_data:
-                                                st.download_button(
-                                                    "â¬‡️",
-                                                    data=audio_data,
-                                                    file_name=f"{word['bashkir']}.mp3",
-                                                    mime="audio/mp3",
-                                                    key=f"cat_dl_{group_key}_{word['id']}"
-                                                )
+                            row_words = unique_words[i:i + 3]
+                            st.markdown(render_category_row_html(tuple(
+                                (word['bashkir'], word.get('ipa', ''), word.get('english', ''), word.get('russian', ''))
+                                for word in row_words
+                            ), 3), unsafe_allow_html=True)
+
+                            for word, col in zip(row_words, st.columns(3)):
+                                with col:
+                                    bcol1, bcol2 = st.columns(2)
+                                    with bcol1:
+                                        if st.button("🔊", key=f"ca{group_idx}.{word['word_id']}",
+                                                    help=f"Play {word['bashkir']}"):
+                                            play_audio(word['bashkir'], slow=True)
+                                    with bcol2:
+                                        audio_download_button(word['bashkir'], f"{word['bashkir']}.mp3", label="â¬‡️", key=f"cd{group_idx}.{word['word_id']}")
                     else:
                         st.info("No words found in this category yet.")
 
@@ -2567,46 +2666,16 @@ elif "Review" in selected_page:
     st.markdown("*Review learned words using the SM-2 algorithm for optimal retention.*")
 
     # Stats
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.markdown("""
-        <div class="stat-box">
-            <h3>📚</h3>
-            <h2>{}</h2>
-            <p>Total Learned</p>
-        </div>
-        """.format(len(st.session_state.learned_words)), unsafe_allow_html=True)
-
-    with col2:
-        st.markdown("""
-        <div class="stat-box">
-            <h3>📋</h3>
-            <h2>{}</h2>
-            <p>Due Today</p>
-        </div>
-        """.format(len(st.session_state.review_queue)), unsafe_allow_html=True)
-
-    with col3:
-        mastered = len([w for w in st.session_state.learned_words
-                       if st.session_state.srs_data.get(w, {}).get('interval', 0) >= 21])
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3>🏆</h3>
-            <h2>{mastered}</h2>
-            <p>Mastered</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col4:
-        accuracy = 85  # Placeholder
-        st.markdown(f"""
-        <div class="stat-box">
-            <h3>🎯</h3>
-            <h2>{accuracy}%</h2>
-            <p>Accuracy</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # srs_data only holds reviewed cards, so scan it and test learned-word bits
+    mastered = sum(1 for w, srs in st.session_state.srs_data.items()
+                   if srs['interval'] >= 21 and w in st.session_state.learned_words)
+    accuracy = 85  # Placeholder
+    st.markdown(render_stat_row_html((
+        ("📚", len(st.session_state.learned_words), "Total Learned"),
+        ("📋", len(st.session_state.review_queue), "Due Today"),
+        ("🏆", mastered, "Mastered"),
+        ("🎯", f"{accuracy}%", "Accuracy"),
+    )), unsafe_allow_html=True)
 
     st.markdown("---")
 
@@ -2614,104 +2683,71 @@ elif "Review" in selected_page:
     if st.session_state.review_queue:
         st.markdown("### 📍 Review Session")
 
-        # Get current word
-        if 'review_index' not in st.session_state:
-            st.session_state.review_index = 0
+        # Current card is the front of the queue
+        current_word = st.session_state.review_queue[0]
+        word_data = words_by_bashkir.get(current_word)
 
-        if st.session_state.review_index < len(st.session_state.review_queue):
-            current_word = st.session_state.review_queue[st.session_state.review_index]
-            word_data = next((w for w in words_data if w['bashkir'] == current_word), None)
+        if word_data:
+            # Flashcard
+            if 'show_answer' not in st.session_state:
+                st.session_state.show_answer = False
 
-            if word_data:
-                # Flashcard
-                if 'show_answer' not in st.session_state:
-                    st.session_state.show_answer = False
+            st.markdown(f"""
+            <div class="word-card" style="text-align: center; padding: 40px;">
+                <span class="bashkir-text" style="font-size: 2.5em;">{word_data['bashkir']}</span>
+                <br><br>
+                <small>{word_data.get('ipa', '')}</small>
+            </div>
+            """, unsafe_allow_html=True)
 
+            if not st.session_state.show_answer:
+                if st.button("👀️ Show Answer", width="stretch"):
+                    st.session_state.show_answer = True
+                    st.rerun()
+            else:
                 st.markdown(f"""
-                <div class="word-card" style="text-align: center; padding: 40px;">
-                    <span class="bashkir-text" style="font-size: 2.5em;">{word_data['bashkir']}</span>
-                    <br><br>
-                    <small>{word_data.get('ipa', '')}</small>
+                <div class="word-card" style="text-align: center; background: #e8f5e9;">
+                    <h2>{word_data['english']}</h2>
+                    <p><em>{word_data.get('russian', '')}</em></p>
                 </div>
                 """, unsafe_allow_html=True)
 
-                if not st.session_state.show_answer:
-                    if st.button("👀️ Show Answer", use_container_width=True):
-                        st.session_state.show_answer = True
-                        st.rerun()
-                else:
+                # Show mnemonic
+                mnemonic = word_data.get('memory_palace', {}).get('mnemonic', '')
+                if mnemonic:
                     st.markdown(f"""
-                    <div class="word-card" style="text-align: center; background: #e8f5e9;">
-                        <h2>{word_data['english']}</h2>
-                        <p><em>{word_data.get('russian', '')}</em></p>
+                    <div class="mnemonic-text">
+                    {mnemonic}
                     </div>
                     """, unsafe_allow_html=True)
 
-                    # Show mnemonic
-                    mnemonic = word_data.get('memory_palace', {}).get('mnemonic', '')
-                    if mnemonic:
-                        st.markdown(f"""
-                        <div class="mnemonic-text">
-                        {mnemonic}
-                        </div>
-                        """, unsafe_allow_html=True)
+                # Rating buttons
+                st.markdown("**How well did you remember?**")
+
+                st.segmented_control(
+                    "How well did you remember?",
+                    list(SRS_RATINGS),
+                    format_func=SRS_RATINGS.get,
+                    key="srs_rating",
+                    on_change=rate_review_card,
+                    args=("srs_rating", current_word),
+                    label_visibility="collapsed",
+                    width="stretch",
+                )
 
-                    # Rating buttons
-                    st.markdown("**How well did you remember?**")
-
-                    col1, col2, col3, col4 = st.columns(4)
-
-                    ratings = [
-                        ("😞 Forgot", 1, col1),
-                        ("😕 Hard", 3, col2),
-                        ("🏙‚ Good", 4, col3),
-                        ("😄 Easy", 5, col4)
-                    ]
-
-                    for label, rating, col in ratings:
-                        with col:
-                            if st.button(label, key=f"rate_{rating}", use_container_width=True):
-                                # Update SRS data
-                                if current_word not in st.session_state.srs_data:
-                                    st.session_state.srs_data[current_word] = {
-                                        'ease': 2.5, 'interval': 0, 'reps': 0
-                                    }
-
-                                srs = st.session_state.srs_data[current_word]
-
-                                if rating >= 3:
-                                    if srs['reps'] == 0:
-                                        srs['interval'] = 1
-                                    elif srs['reps'] == 1:
-                                        srs['interval'] = 6
-                                    else:
-                                        srs['interval'] = int(srs['interval'] * srs['ease'])
-                                    srs['reps'] += 1
-                                else:
-                                    srs['interval'] = 1
-                                    srs['reps'] = 0
-
-                                srs['ease'] = max(1.3, srs['ease'] + (0.1 - (5 - rating) * 0.08))
-
-                                # Move to next word
-                                st.session_state.review_index += 1
-                                st.session_state.show_answer = False
-                                st.rerun()
-
-                # Progress - FIXED: proper parentheses to avoid ZeroDivisionError
-                total_reviews = len(st.session_state.review_queue)
-                if total_reviews > 0:
-                    progress = (st.session_state.review_index + 1) / total_reviews
-                else:
-                    progress = 0.0
-                st.progress(min(progress, 1.0))
-                st.caption(f"Card {st.session_state.review_index + 1} of {total_reviews}")
-        else:
+            # Progress over cards done plus cards still queued (never zero here)
+            done = st.session_state.reviews_this_session
+            total_reviews = done + len(st.session_state.review_queue)
+            st.progress(min((done + 1) / total_reviews, 1.0))
+            st.caption(f"Card {done + 1} of {total_reviews}")
+    elif st.session_state.learned_words:
+        if st.session_state.reviews_this_session:
             st.success("🎉 Review session complete!")
-            if st.button("Start New Session"):
-                st.session_state.review_index = 0
-                st.session_state.show_answer = False
-                st.rerun()
+        if st.button("Start New Session"):
+            st.session_state.review_queue = deque(st.session_state.learned_words)
+            st.session_state.reviews_this_session = 0
+            st.session_state.show_answer = False
+            st.rerun()
     else:
         st.info("No words to review! Visit the Palace to learn new words.")
         if st.button("Go to Palace"):
@@ -2729,12 +2765,8 @@ elif "Review" in selected_page:
     > — The Pilgrim
     """)
     
-    # Calculate total reviews across all words
-    total_reviews = sum(
-        st.session_state.srs_data.get(w, {}).get('reviews', 0) 
-        for w in st.session_state.learned_words
-    )
-    st.session_state.total_reviews_completed = total_reviews
+    # Running count kept by rate_review_card
+    total_reviews = st.session_state.total_reviews_completed
     
     # Map to Pilgrim's stages
     if total_reviews < 100:
@@ -2764,17 +2796,8 @@ elif "Review" in selected_page:
     st.markdown("### 📝 Review Reflection")
     st.markdown('*"Choose, and you shall see what validity there is in it."* — Kierkegaard')
     
-    reflection_prompts = [
-        "What word surprised you today?",
-        "Which word do you feel you truly *know* now?",
-        "What distracted you during this session? (logismoi)",
-        "Did any word connect to your personal life?",
-        "What would help you remember these words better?",
-    ]
-    
-    import random
     if 'review_reflection_prompt' not in st.session_state:
-        st.session_state.review_reflection_prompt = random.choice(reflection_prompts)
+        st.session_state.review_reflection_prompt = random.choice(REVIEW_REFLECTION_PROMPTS)
     
     st.markdown(f"*{st.session_state.review_reflection_prompt}*")
     
@@ -2790,7 +2813,7 @@ elif "Review" in selected_page:
             })
             st.success("Reflection saved to your journal!")
             # Pick a new prompt for next time
-            st.session_state.review_reflection_prompt = random.choice(reflection_prompts)
+            st.session_state.review_reflection_prompt = random.choice(REVIEW_REFLECTION_PROMPTS)
         else:
             st.info("Write something first, then save.")
 
@@ -2800,9 +2823,9 @@ elif "BashkortNet" in selected_page:
     st.markdown("*Explore the semantic network connecting Bashkir words with OCM cultural classifications.*")
 
     # Load OCM data
-    ocm_data = load_ocm_mapping()
-    ocm_labels = ocm_data.get('ocm_labels', {})
-    bashkir_to_ocm = ocm_data.get('bashkir_to_ocm', {})
+    ocm = get_ocm_index()
+    ocm_labels = ocm.labels
+    bashkir_to_ocm = ocm.bashkir_to_ocm
 
     # Neo4j integration info
     st.markdown("---")
@@ -2820,45 +2843,30 @@ elif "BashkortNet" in selected_page:
     that can be directly imported into Neo4j using APOC procedures.
     """)
 
-    # Export to Neo4j format button
-    if st.button("📤 Export to Neo4j Format (Cypher)"):
-        # Generate Cypher statements
-        cypher_statements = []
-        cypher_statements.append("// Neo4j Cypher statements for BashkortNet")
-        cypher_statements.append("// Run these in Neo4j Browser or neo4j-admin")
-        cypher_statements.append("")
-
-        for word in words_data[:20]:  # Limit for display
-            bashkir = word['bashkir'].replace("'", "\\'")
-            english = word.get('english', '').replace("'", "\\'")
-            cypher_statements.append(f"CREATE (w:Word {{bashkir: '{bashkir}', english: '{english}', pos: '{word.get('pos', 'noun')}'}})")
-
-            # Add relations
-            bashkortnet_data = word.get('bashkortnet', {})
-            relations = bashkortnet_data.get('relations', {})
-            for rel_type, targets in relations.items():
-                for target in targets:
-                    if isinstance(target, dict):
-                        target_word = target.get('target', '').replace("'", "\\'")
-                    else:
-                        target_word = str(target).replace("'", "\\'")
-                    if target_word:
-                        cypher_statements.append(f"// {bashkir} -{rel_type}-> {target_word}")
+    # Export to Neo4j format: preview on demand, full file generated on download
+    export_col1, export_col2 = st.columns(2)
+    with export_col1:
+        show_cypher_preview = st.button("📤 Export to Neo4j Format (Cypher)")
+    with export_col2:
+        st.download_button(
+            "💾 Download Full Export (.cypher)",
+            data=lambda: build_cypher_export().encode('utf-8'),
+            file_name="bashkortnet.cypher",
+            mime="text/plain",
+        )
 
+    if show_cypher_preview:
+        cypher_statements = build_cypher_export().splitlines()
         st.code("\n".join(cypher_statements[:30]), language="cypher")
         st.caption("*Showing first 30 statements. Full export available for download.*")
 
     st.markdown("---")
 
     # Word search with Bashkir and English
-    search_word = st.selectbox(
-        "Select a word to explore (Bashkir / English):",
-        [w['bashkir'] for w in words_data],
-        format_func=lambda x: f"{x} ({next((w['english'] for w in words_data if w['bashkir'] == x), '?')})"
-    )
+    search_word = word_picker("Select a word to explore (Bashkir / English):", key="bashkortnet_word")
 
     if search_word:
-        word_data = next((w for w in words_data if w['bashkir'] == search_word), None)
+        word_data = words_by_bashkir.get(search_word)
 
         if word_data:
             col1, col2 = st.columns([1, 2])
@@ -2879,7 +2887,7 @@ elif "BashkortNet" in selected_page:
                 """, unsafe_allow_html=True)
 
                 # Audio button
-                if st.button("🔊 Play Pronunciation", key=f"bashkortnet_audio_{word_data['id']}"):
+                if st.button("🔊 Play Pronunciation", key=f"ba{word_data['word_id']}"):
                     play_audio(word_data['bashkir'], slow=True)
 
             with col2:
@@ -2895,32 +2903,14 @@ elif "BashkortNet" in selected_page:
                     if relations:
                         for rel_type, targets in relations.items():
                             if targets:
-                                rel_labels = {
-                                    'SYN': '🔄 Synonyms',
-                                    'ANT': 'â†”️ Antonyms',
-                                    'ISA': 'â¬†️ Is a type of',
-                                    'HAS_TYPE': 'â¬‡️ Types',
-                                    'PART_OF': '🧩 Part of',
-                                    'HAS_PART': '🔧 Has parts',
-                                    'CULT_ASSOC': '🛕️ Cultural',
-                                    'MYTH_LINK': '📜 Mythological'
-                                }
-
-                                st.markdown(f"**{rel_labels.get(rel_type, rel_type)}:**")
-
-                                for target in targets:
-                                    if isinstance(target, dict):
-                                        target_word = target.get('target', target.get('gloss', str(target)))
-                                        gloss = target.get('gloss', '')
-                                        note = target.get('note', '')
-                                        display = f"- {target_word}"
-                                        if gloss:
-                                            display += f" ({gloss})"
-                                        if note:
-                                            display += f" *({note})*"
-                                        st.markdown(display)
-                                    else:
-                                        st.markdown(f"- {target}")
+                                st.markdown(f"**{RELATION_LABELS.get(rel_type, rel_type)}:**")
+
+                                st.markdown("\n".join(
+                                    f"- {t['target']}"
+                                    + (f" ({t['gloss']})" if t['gloss'] else "")
+                                    + (f" *({t['note']})*" if t['note'] else "")
+                                    for t in targets
+                                ))
                     else:
                         st.info("No relations defined for this word yet.")
 
@@ -2932,12 +2922,12 @@ elif "BashkortNet" in selected_page:
                     cultural_context = word_data.get('cultural_context', {})
                     embedded_ocm_codes = cultural_context.get('ocm_codes', [])
 
-                    all_codes = list(set([str(c) for c in word_ocm_codes + embedded_ocm_codes]))
+                    all_codes = list(dict.fromkeys(str(c) for c in chain(word_ocm_codes, embedded_ocm_codes)))
 
                     if all_codes:
-                        for code in all_codes:
-                            label = ocm_labels.get(str(code), f"Category {code}")
-                            st.markdown(f"- **OCM {code}**: {label}")
+                        st.markdown("\n".join(
+                            f"- **OCM {code}**: {ocm_labels.get(code, f'Category {code}')}" for code in all_codes
+                        ))
                     else:
                         st.info("No OCM codes assigned to this word yet.")
 
@@ -2975,10 +2965,10 @@ elif "Cultural Context" in selected_page:
     st.markdown("*Understand the anthropological depth behind each word with eHRAF 2021 OCM classifications.*")
 
     # Load OCM data
-    ocm_data = load_ocm_mapping()
-    ocm_labels = ocm_data.get('ocm_labels', {})
-    bashkir_to_ocm = ocm_data.get('bashkir_to_ocm', {})
-    thematic_groups = ocm_data.get('thematic_groups', {})
+    ocm = get_ocm_index()
+    ocm_labels = ocm.labels
+    bashkir_to_ocm = ocm.bashkir_to_ocm
+    thematic_groups = ocm.groups
 
     # Truth Unveiled toggle
     st.sidebar.markdown("---")
@@ -2994,14 +2984,10 @@ elif "Cultural Context" in selected_page:
 
     with tab1:
         # Word selection
-        search_word = st.selectbox(
-            "Select a word:",
-            [w['bashkir'] for w in words_data],
-            format_func=lambda x: f"{x} ({next((w['english'] for w in words_data if w['bashkir'] == x), '?')})"
-        )
+        search_word = word_picker("Select a word:", key="cultural_word")
 
         if search_word:
-            word_data = next((w for w in words_data if w['bashkir'] == search_word), None)
+            word_data = words_by_bashkir.get(search_word)
 
             if word_data:
                 st.markdown(f"## {word_data['bashkir']} — {word_data['english']}")
@@ -3011,13 +2997,13 @@ elif "Cultural Context" in selected_page:
                 # OCM codes
                 word_ocm_codes = bashkir_to_ocm.get(word_data['bashkir'], [])
                 embedded_ocm_codes = cultural.get('ocm_codes', [])
-                all_codes = list(set([str(c) for c in word_ocm_codes + embedded_ocm_codes]))
+                all_codes = list(dict.fromkeys(str(c) for c in chain(word_ocm_codes, embedded_ocm_codes)))
 
                 if all_codes:
                     st.markdown("### 🏷️ OCM Categories (eHRAF 2021)")
-                    for code in all_codes:
-                        label = ocm_labels.get(str(code), f"Category {code}")
-                        st.markdown(f"- **{code}**: {label}")
+                    st.markdown("\n".join(
+                        f"- **{code}**: {ocm_labels.get(code, f'Category {code}')}" for code in all_codes
+                    ))
 
                 # Significance
                 significance = cultural.get('significance', '')
@@ -3033,11 +3019,11 @@ elif "Cultural Context" in selected_page:
                 sources = cultural.get('sources', [])
                 if sources:
                     st.markdown("### 📚 Sources")
-                    for source in sources:
-                        if isinstance(source, dict):
-                            st.markdown(f"- {source.get('author', '')} ({source.get('year', '')}). *{source.get('title', '')}*")
-                        else:
-                            st.markdown(f"- {source}")
+                    st.markdown("\n".join(
+                        f"- {source.get('author', '')} ({source.get('year', '')}). *{source.get('title', '')}*"
+                        if isinstance(source, dict) else f"- {source}"
+                        for source in sources
+                    ))
 
                 # Sensitivity warning
                 sensitivity = cultural.get('sensitivity', {})
@@ -3049,30 +3035,22 @@ elif "Cultural Context" in selected_page:
         st.markdown("### Browse by OCM Category")
         st.markdown("*Explore words organized by anthropological classification*")
 
-        # Get unique OCM codes from all words
-        all_ocm_codes_list = []
-        for word in words_data:
-            cultural = word.get('cultural_context', {})
-            codes = cultural.get('ocm_codes', [])
-            all_ocm_codes_list.extend([str(c) for c in codes])
-
-        unique_codes = sorted(set(all_ocm_codes_list))
+        # Unique OCM codes across all words, from the cached inverted index
+        words_by_ocm = load_words_by_ocm_code()
+        unique_codes = list(words_by_ocm)
 
         if unique_codes:
             selected_code = st.selectbox(
                 "Select OCM Category:",
                 unique_codes,
-                format_func=lambda x: f"{x}: {ocm_labels.get(x, 'Unknown')}"
+                format_func=ocm.code_title
             )
 
             if selected_code:
                 st.markdown(f"### {ocm_labels.get(selected_code, f'Category {selected_code}')}")
 
-                # Find words with this OCM code
-                matching_words = [
-                    w for w in words_data
-                    if selected_code in [str(c) for c in w.get('cultural_context', {}).get('ocm_codes', [])]
-                ]
+                # Words with this OCM code
+                matching_words = words_by_ocm.get(selected_code, ())
 
                 if matching_words:
                     for word in matching_words:
@@ -3095,19 +3073,16 @@ elif "Cultural Context" in selected_page:
                 with st.expander(f"🎨 {display_name}"):
                     if theme_ocm_codes:
                         st.markdown("**OCM Codes:**")
-                        code_labels = [f"{c}: {ocm_labels.get(c, 'Unknown')}" for c in theme_ocm_codes]
+                        code_labels = [ocm.code_title(c) for c in theme_ocm_codes]
                         st.write(", ".join(code_labels))
 
                     if theme_words:
                         st.markdown("**Words:**")
-                        word_displays = []
-                        for bword in theme_words:
-                            word_info = next((w for w in words_data if w['bashkir'] == bword), None)
-                            if word_info:
-                                word_displays.append(f"**{bword}** ({word_info['english']})")
-                            else:
-                                word_displays.append(f"**{bword}**")
-                        st.markdown(" | ".join(word_displays))
+                        st.markdown(" | ".join(
+                            f"**{bword}** ({words_by_bashkir[bword]['english']})" if bword in words_by_bashkir
+                            else f"**{bword}**"
+                            for bword in theme_words
+                        ))
         else:
             st.info("No thematic groups defined yet.")
 
@@ -3116,18 +3091,15 @@ elif "Truth Unveiled" in selected_page:
     st.title("🌟 Truth Unveiled — Алтын Яҡты")
     st.markdown("*The Golden Light: Proverbs, Timeline, and the Deeper Knowledge*")
 
-    # Load data from both sources for comprehensive coverage
-    epic_data = load_ural_batyr_epic()
-    golden_data = load_golden_light_data()
-
-    # Use golden_light_data.json for proverbs and timeline (more comprehensive)
-    proverbs = golden_data.get('proverbs', epic_data.get('proverbs', []))
-    timeline = golden_data.get('timeline', epic_data.get('timeline', []))
-    cultural_facts = epic_data.get('cultural_facts', [])
+    # Shared views over both sources; golden_light_data.json wins for
+    # proverbs and timeline (more comprehensive)
+    golden = get_golden_light()
+    proverbs = golden.proverbs
+    timeline = golden.timeline
+    cultural_facts = golden.cultural_facts
 
     # Legacy proverb from golden_light_data
-    gl_info = golden_data.get('golden_light', {})
-    legacy_proverb = gl_info.get('legacy_proverb', epic_data.get('legacy_proverb', {}))
+    legacy_proverb = golden.legacy_proverb
 
     # The Golden Light Introduction
     st.markdown(f"""
@@ -3159,69 +3131,51 @@ elif "Truth Unveiled" in selected_page:
         st.markdown("*Wisdom passed down through generations*")
 
         # Filter by category
-        categories = list(set([p.get('category', 'General') for p in proverbs]))
-        selected_category = st.selectbox("Filter by theme:", ['All'] + categories)
+        selected_category = st.selectbox("Filter by theme:", ('All',) + golden.proverb_categories)
 
-        filtered_proverbs = proverbs if selected_category == 'All' else [p for p in proverbs if p.get('category') == selected_category]
+        filtered_proverbs = golden.proverbs_by_category.get(selected_category, proverbs)
 
-        for proverb in filtered_proverbs:
-            st.markdown(f"""
-            <div class="word-card" style="border-left: 5px solid #d4af37;">
-                <span style="background: #d4af37; color: white; padding: 2px 8px; border-radius: 4px; font-size: 0.8em;">
-                    {proverb.get('category', 'General')}
-                </span>
-                <p class="bashkir-text" style="margin-top: 10px;">{proverb.get('bashkir', '')}</p>
-                <p class="russian-text">🇷🇺 {proverb.get('russian', '')}</p>
-                <p class="english-text">🇬🇧 {proverb.get('english', '')}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        if filtered_proverbs:
+            st.markdown("".join(
+                PROVERB_CARD_TPL % dict(
+                    category=proverb.get('category', 'General'), bashkir=proverb.get('bashkir', ''),
+                    russian=proverb.get('russian', ''), english=proverb.get('english', ''),
+                )
+                for proverb in filtered_proverbs
+            ), unsafe_allow_html=True)
 
     with tab2:
         st.markdown("### â³ Historical Timeline — Тарих ÑŽлы")
         st.markdown("*Key moments in Bashkir history*")
 
         # Timeline visualization
-        for idx, event in enumerate(timeline):
-            year = event.get('year', '')
-            desc = event.get('event', '')
-
-            st.markdown(f"""
-            <div style="display: flex; margin: 10px 0;">
-                <div style="min-width: 80px; padding: 8px; background: #0066B3; color: white; border-radius: 8px; text-align: center; font-weight: bold;">
-                    {year}
-                </div>
-                <div style="flex: 1; padding: 8px 15px; background: #e6f2ff; border-radius: 8px; margin-left: 10px; border-left: 3px solid #00AF66;">
-                    {desc}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        if timeline:
+            st.markdown("".join(
+                TIMELINE_EVENT_TPL % dict(year=event.get('year', ''), event=event.get('event', ''))
+                for event in timeline
+            ), unsafe_allow_html=True)
 
     with tab3:
         st.markdown("### 📍️ Cultural Facts — Мәҙәниәт")
         st.markdown("*Deep knowledge of Bashkir heritage*")
 
         # Filter by category
-        fact_categories = list(set([f.get('category', 'general') for f in cultural_facts]))
-        selected_fact_category = st.selectbox("Filter facts by:", ['All'] + fact_categories, key="fact_filter")
-
-        filtered_facts = cultural_facts if selected_fact_category == 'All' else [f for f in cultural_facts if f.get('category') == selected_fact_category]
+        selected_fact_category = st.selectbox(
+            "Filter facts by:", ('All',) + golden.cultural_fact_categories, key="fact_filter"
+        )
 
-        for fact in filtered_facts:
-            cat_colors = {'history': '#0066B3', 'culture': '#00AF66', 'geography': '#d4af37', 'language': '#cc3333'}
-            color = cat_colors.get(fact.get('category', ''), '#666')
+        filtered_facts = golden.cultural_facts_by_category.get(selected_fact_category, cultural_facts)
 
-            st.markdown(f"""
-            <div class="word-card">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
-                    <span style="background: {color}; color: white; padding: 2px 8px; border-radius: 4px; font-size: 0.8em;">
-                        {fact.get('category', 'general').upper()}
-                    </span>
-                    <span style="color: #666; font-size: 0.9em;">{fact.get('year', '')}</span>
-                </div>
-                <h4 style="color: #00AF66; margin: 5px 0;">{fact.get('title', '')}</h4>
-                <p style="color: #004d00;">{fact.get('content', '')}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        cat_colors = {'history': '#0066B3', 'culture': '#00AF66', 'geography': '#d4af37', 'language': '#cc3333'}
+        if filtered_facts:
+            st.markdown("".join(
+                CULTURAL_FACT_CARD_TPL % dict(
+                    color=cat_colors.get(fact.get('category', ''), '#666'),
+                    category=fact.get('category', 'general').upper(), year=fact.get('year', ''),
+                    title=fact.get('title', ''), content=fact.get('content', ''),
+                )
+                for fact in filtered_facts
+            ), unsafe_allow_html=True)
 
     with tab4:
         st.markdown("### 🔥 The Duality: Ural and Shulgen")
@@ -3334,13 +3288,12 @@ elif "Sacred Practice" in selected_page:
         """)
         
         # Word selector for practice
-        words_data = load_words()
-        word_list = list(words_data.keys())
+        word_list = list(words_by_bashkir)
         
         selected_word = st.selectbox("Choose a word to practice:", word_list[:20])
         
-        if selected_word and selected_word in words_data:
-            word = words_data[selected_word]
+        if selected_word and selected_word in words_by_bashkir:
+            word = words_by_bashkir[selected_word]
             
             st.markdown(f"""
             <div class="word-card" style="text-align: center;">
@@ -3350,24 +3303,15 @@ elif "Sacred Practice" in selected_page:
             """, unsafe_allow_html=True)
             
             if st.button("🌬️ Begin 30-second breathing practice", key="breathing_btn"):
-                progress_bar = st.progress(0)
-                status = st.empty()
-                
-                phases = [
-                    ("Inhale... see the word", 4),
-                    ("Hold... feel its meaning", 2),
-                    ("Exhale... speak it aloud", 4),
-                    ("Rest... let it settle", 2)
-                ]
-                
-                for cycle in range(2):  # 2 cycles = 24 seconds
-                    for phase_name, duration in phases:
-                        status.markdown(f"**{phase_name}**")
-                        for i in range(duration):
-                            time.sleep(1)
-                            total_progress = (cycle * 12 + sum(p[1] for p in phases[:phases.index((phase_name, duration))]) + i + 1) / 24
-                            progress_bar.progress(min(total_progress, 1.0))
-                
+                start_practice_timer("sacred_breathing")
+
+            phases = [
+                ("**Inhale... see the word**", 4),
+                ("**Hold... feel its meaning**", 2),
+                ("**Exhale... speak it aloud**", 4),
+                ("**Rest... let it settle**", 2)
+            ]
+            if practice_timer("sacred_breathing", phases, cycles=2):  # 2 cycles = 24 seconds
                 st.session_state.breathing_completed = True
                 st.session_state.sacred_practice_count += 1
                 st.success("✨ Practice complete. The word is settling into your heart.")
@@ -3427,8 +3371,11 @@ elif "Sacred Practice" in selected_page:
         
         if st.session_state.logismoi_journal:
             st.markdown("#### Your Logismoi Patterns")
-            from collections import Counter
-            patterns = Counter([l['distraction'] for l in st.session_state.logismoi_journal])
+            # Tally only the entries recorded since the last rerun
+            journal = st.session_state.logismoi_journal
+            patterns = st.session_state._logismoi_counts
+            patterns.update(l['distraction'] for l in journal[st.session_state._logismoi_counted:])
+            st.session_state._logismoi_counted = len(journal)
             for distraction, count in patterns.most_common(5):
                 st.markdown(f"- **{distraction}**: {count} times")
     
@@ -3464,21 +3411,16 @@ elif "Sacred Practice" in selected_page:
         """)
         
         if st.button("🤫 Begin 2-minute silence"):
-            progress_bar = st.progress(0)
-            status = st.empty()
-            status.markdown("*Enter the silence...*")
-            
-            for i in range(120):
-                time.sleep(1)
-                progress_bar.progress((i + 1) / 120)
-                if i == 30:
-                    status.markdown("*Let thoughts pass like clouds...*")
-                elif i == 60:
-                    status.markdown("*If a Bashkir word arises, welcome it...*")
-                elif i == 90:
-                    status.markdown("*Dwell in the space between words...*")
-            
-            status.markdown("*The silence continues within you.*")
+            start_practice_timer("silence")
+
+        silence_phases = [
+            ("*Enter the silence...*", 30),
+            ("*Let thoughts pass like clouds...*", 30),
+            ("*If a Bashkir word arises, welcome it...*", 30),
+            ("*Dwell in the space between words...*", 30),
+        ]
+        if practice_timer("silence", silence_phases):
+            st.markdown("*The silence continues within you.*")
             st.success("✨ Practice complete.")
     
     with tab4:
@@ -3553,13 +3495,7 @@ elif "Your Journey" in selected_page:
     st.title("📈 Your Journey")
     st.markdown("*Track your progression through the stages of learning*")
     
-    st.markdown("""
-    <div class="meditation-box">
-        <em>"The question is, under what categories one wants to contemplate 
-        the entire world and would oneself live."</em>
-        <br>— Kierkegaard, Either/Or
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(KIERKEGAARD_CATEGORIES_HTML, unsafe_allow_html=True)
     
     # Calculate metrics
     words_learned = len(st.session_state.learned_words)
@@ -3692,6 +3628,7 @@ elif "Your Journey" in selected_page:
     st.markdown("### 🎯 Milestones")
     
     milestones = st.session_state.milestones
+    reached_before = sum(1 for v in milestones.values() if v)
     
     # Check and update milestones
     if words_learned >= 1 and not milestones.get('first_word'):
@@ -3704,6 +3641,8 @@ elif "Your Journey" in selected_page:
         milestones['fifty_words'] = datetime.now().isoformat()
     if words_learned >= 100 and not milestones.get('hundred_words'):
         milestones['hundred_words'] = datetime.now().isoformat()
+    if sum(1 for v in milestones.values() if v) != reached_before:
+        save_session()
     
     milestone_display = [
         ("🌱 First word learned", milestones.get('first_word')),
@@ -3942,6 +3881,20 @@ elif "Settings" in selected_page:
     st.number_input("New words per session", 1, 20, 5)
     st.number_input("Review words per session", 5, 50, 20)
 
+    st.markdown("### 💾 Progress Profile")
+    st.text_input(
+        "Profile name",
+        value=st.session_state.profile,
+        key="profile_input",
+        on_change=switch_profile,
+        args=("profile_input",),
+        help="Progress is saved under this name (letters, digits, - and _). "
+             "Bookmark the page to come back to it; leave empty to keep progress "
+             "for this browser session only.",
+    )
+    if not st.session_state.profile:
+        st.caption("Progress is not being saved between visits.")
+
     st.markdown("### 🔄 Data Management")
 
     col1, col2 = st.columns(2)
@@ -3961,11 +3914,24 @@ elif "Settings" in selected_page:
             )
 
     with col2:
+        if st.button("Clear Audio & Translation Memory"):
+            _generate_audio_cached.clear()
+            _translate_cached.clear()
+            st.success("In-memory caches cleared!")
+
+        audio_stats = get_audio_cache().get_stats()
+        st.caption(
+            f"🎵 Audio cache: {audio_stats['entries']} clips, "
+            f"{audio_stats['total_bytes'] / 2**20:.1f} of {audio_stats['max_bytes'] / 2**20:.0f} MB"
+        )
+
         if st.button("Reset All Progress"):
-            st.session_state.learned_words = set()
-            st.session_state.review_queue = []
+            st.session_state.learned_words = new_learned_words()
+            st.session_state.review_queue = deque()
+            st.session_state.reviews_this_session = 0
             st.session_state.saved_sentences = []
             st.session_state.srs_data = {}
+            save_session()
             st.success("Progress reset!")
             st.rerun()
 
@@ -0,0 +1,198 @@
+"""
+Content Models
+==============
+Frozen records for the Golden Light content (stations and their vocabulary,
+Independence reasons, the Geography overview, cities, landmarks and facts,
+the special alphabet letters).
+
+The JSON is converted once when the shared Golden Light views are built, so
+render loops read attributes instead of chaining ``dict.get(key, default)``
+calls, and derived values such as the station's hex colour are looked up
+once per load rather than once per render.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from static_content import CITY_TYPE_COLORS, FACT_CATEGORY_COLORS, STATION_COLOR_MAP
+
+
+@dataclass(frozen=True)
+class VocabWord:
+    """A Bashkir headword with its pronunciation hint and English gloss."""
+    bashkir: str = ""
+    phonetic: str = ""
+    english: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VocabWord":
+        return cls(
+            bashkir=data.get('bashkir', ''),
+            phonetic=data.get('phonetic', ''),
+            english=data.get('english', ''),
+        )
+
+
+@dataclass(frozen=True)
+class Station:
+    """A Golden Light memory-palace station."""
+    id: int = 0
+    title: str = ""
+    bashkir: str = ""
+    icon: str = "📍"
+    color: str = "emerald"
+    hex_color: str = "#00AF66"
+    summary: str = ""
+    memory_peg: str = ""
+    memory_image: str = ""
+    vocab: Tuple[VocabWord, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Station":
+        color = data.get('color', 'emerald')
+        return cls(
+            id=data.get('id', 0),
+            title=data.get('title', ''),
+            bashkir=data.get('bashkir', ''),
+            icon=data.get('icon', '📍'),
+            color=color,
+            hex_color=STATION_COLOR_MAP.get(color, '#00AF66'),
+            summary=data.get('summary', ''),
+            memory_peg=data.get('memory_peg', ''),
+            memory_image=data.get('memory_image', ''),
+            vocab=tuple(VocabWord.from_dict(w) for w in data.get('vocab', [])),
+        )
+
+
+@dataclass(frozen=True)
+class Reason:
+    """One of the Twelve Reasons on the Independence page."""
+    id: int = 0
+    title: str = ""
+    description: str = ""
+    icon: str = "📜"
+    bashkir_term: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Reason":
+        return cls(
+            id=data.get('id', 0),
+            title=data.get('title', ''),
+            description=data.get('description', ''),
+            icon=data.get('icon', '📜'),
+            bashkir_term=data.get('bashkir_term', ''),
+        )
+
+
+def _thousands(value) -> str:
+    """Format a number with thousands separators; non-numbers become ""."""
+    return f"{value:,}" if isinstance(value, (int, float)) else ""
+
+
+@dataclass(frozen=True)
+class GeographyOverview:
+    """Republic overview stats, with the numbers pre-formatted for display."""
+    capital: str = ""
+    bashkir_name: str = ""
+    area_km2_str: str = ""
+    population_str: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "GeographyOverview":
+        return cls(
+            capital=data.get('capital', ''),
+            bashkir_name=data.get('bashkir_name', ''),
+            area_km2_str=_thousands(data.get('area_km2')),
+            population_str=_thousands(data.get('population')),
+        )
+
+
+@dataclass(frozen=True)
+class City:
+    """A city on the Geography page."""
+    name: str = ""
+    bashkir: str = ""
+    type: str = "city"
+    type_color: str = "#00AF66"
+    population: str = ""
+    lat: float = 54.0
+    lon: float = 56.0
+    key: str = ""  # compact widget key, assigned at load time
+
+    @classmethod
+    def from_dict(cls, data: Dict, key: str = "") -> "City":
+        city_type = data.get('type', 'city')
+        return cls(
+            name=data.get('name', ''),
+            bashkir=data.get('bashkir', ''),
+            type=city_type,
+            type_color=CITY_TYPE_COLORS.get(city_type, '#00AF66'),
+            population=data.get('population', ''),
+            lat=data.get('lat', 54.0),
+            lon=data.get('lon', 56.0),
+            key=key,
+        )
+
+
+@dataclass(frozen=True)
+class Landmark:
+    """A mountain, river or cave on the Geography page."""
+    name: str = ""
+    bashkir: str = ""
+    icon: str = "📍️"
+    description: str = ""
+    significance: str = ""
+    lat: float = 54.0
+    lon: float = 56.0
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Landmark":
+        return cls(
+            name=data.get('name', ''),
+            bashkir=data.get('bashkir', ''),
+            icon=data.get('icon', '📍️'),
+            description=data.get('description', ''),
+            significance=data.get('significance', ''),
+            lat=data.get('lat', 54.0),
+            lon=data.get('lon', 56.0),
+        )
+
+
+@dataclass(frozen=True)
+class Fact:
+    """A geographic or natural fact on the Geography page."""
+    category: str = "general"
+    category_color: str = "#666"
+    title: str = ""
+    content: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Fact":
+        category = data.get('category', 'general')
+        return cls(
+            category=category,
+            category_color=FACT_CATEGORY_COLORS.get(category, '#666'),
+            title=data.get('title', ''),
+            content=data.get('content', ''),
+        )
+
+
+@dataclass(frozen=True)
+class SpecialLetter:
+    """One of the special Bashkir letters on the Alphabet page."""
+    letter: str = ""
+    name: str = ""
+    sound: str = ""
+    example: str = ""
+    example_word: str = ""  # Bashkir word of the example, spoken by the audio button
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SpecialLetter":
+        example = data.get('example', '')
+        return cls(
+            letter=data.get('letter', ''),
+            name=data.get('name', ''),
+            sound=data.get('sound', ''),
+            example=example,
+            example_word=example.split(' ')[0],
+        )
@@ -0,0 +1,309 @@
+"""
+HTML Templates for Page Cards
+=============================
+Precompiled templates for the repeated card markup (rows of vocabulary
+cards, Audio Dictionary category card rows, Golden Light station cards,
+Independence reason cards, legacy proverb banners, Truth Unveiled proverb,
+timeline and fact cards, stat box rows, Geography fact cards, the Media TV
+guide, feed cards and sample video tiles, alphabet tiles) and cached
+renderers that fill them.
+
+Templates are constant %-format strings filled from a dict, so rendering is
+a single format operation. Content is static per data load, so each rendered
+string is built once and reused across reruns instead of re-formatting
+multi-line f-strings.
+"""
+
+import streamlit as st
+
+from static_content import SAMPLE_VIDEOS, TV_CHANNELS, TV_SCHEDULE, TV_SCHEDULE_TITLE
+
+
+WORD_CARD_TPL = """
+<div class="word-card" style="text-align: center;">
+    <span class="bashkir-text">%(bashkir)s</span>
+    <span class="ipa-text">[%(phonetic)s]</span>
+    <div class="english-text">%(english)s</div>
+</div>
+"""
+
+CATEGORY_CARD_TPL = """
+<div class="word-card" style="text-align: center; min-height: 120px;">
+    <span class="bashkir-text" style="font-size: 1.6em;">%(bashkir)s</span>
+    <span class="ipa-text">%(ipa)s</span>
+    <div style="color: #004d00; font-size: 1.1em; margin: 8px 0;">%(english)s</div>
+    <small style="color: #666;">🇷🇺 %(russian)s</small>
+</div>
+"""
+
+STATION_CARD_TPL = """
+<div class="word-card" style="border-left: 5px solid %(color)s; background: linear-gradient(135deg, #ffffff 0%%, #f0f8ff 100%%);">
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <span style="font-size: 2em;">%(icon)s</span>
+        <span style="background: %(color)s; color: white; padding: 5px 15px; border-radius: 20px;">
+            Station %(station_id)s
+        </span>
+    </div>
+    <h2 style="color: %(color)s; margin: 10px 0;">%(title)s</h2>
+    <p style="font-size: 1.2em; font-style: italic; color: #00AF66;">
+        %(bashkir)s
+    </p>
+    <p style="color: #333; margin: 10px 0;">%(summary)s</p>
+</div>
+"""
+
+REASON_CARD_TPL = """
+<div class="word-card" style="border-left: 5px solid #8B7355; min-height: 180px;">
+    <div style="display: flex; align-items: center; gap: 15px; margin-bottom: 10px;">
+        <span style="font-size: 2em;">%(icon)s</span>
+        <div>
+            <span style="background: #8B7355; color: white; padding: 2px 10px; border-radius: 10px; font-size: 0.8em;">
+                Reason %(reason_id)s
+            </span>
+            <h4 style="color: #00AF66; margin: 5px 0;">%(title)s</h4>
+        </div>
+    </div>
+    <p style="color: #333; font-size: 0.95em;">%(description)s</p>
+    <p style="color: #0066B3; font-style: italic; margin-top: 10px;">
+        🏷️ %(bashkir_term)s
+    </p>
+</div>
+"""
+
+LEGACY_PROVERB_TPL = """
+<div style="background: linear-gradient(135deg, #d4af37 0%%, #f4e4bc 50%%, #d4af37 100%%);
+            padding: 30px; border-radius: 15px; text-align: center; margin: 20px 0;
+            border: 3px solid #8B7355; box-shadow: 0 8px 32px rgba(212,175,55,0.3);">
+    <h2 style="color: #2d1f10; margin-bottom: 15px; font-size: 1.8em;">🌟 The Legacy Proverb 🌟</h2>
+    <p style="font-size: 1.5em; color: #2d1f10; font-weight: bold; margin: 15px 0;">
+        "%(bashkir)s"
+    </p>
+    <p style="font-size: 1.2em; color: #4a3728; font-style: italic; margin: 15px 0;">
+        "%(english)s"
+    </p>
+    <p style="font-size: 0.95em; color: #5a4738;">
+        🇷🇺 %(russian)s
+    </p>
+    <p style="font-size: 0.9em; color: #6a5748; margin-top: 10px;">
+        [%(phonetic)s]
+    </p>
+</div>
+"""
+
+EPIC_PROVERB_TPL = """
+<div class="meditation-box" style="text-align: center; border-left: none; border: 3px solid #d4af37;">
+    <p style="font-size: 1.3em; margin-bottom: 10px;">✨ <strong>%(bashkir)s</strong></p>
+    <p style="font-size: 1.1em; color: #004d00;">%(english)s</p>
+    <p style="font-size: 0.9em; color: #666;">[%(phonetic)s]</p>
+</div>
+"""
+
+
+PROVERB_CARD_TPL = """<div class="word-card" style="border-left: 5px solid #d4af37;">
+    <span style="background: #d4af37; color: white; padding: 2px 8px; border-radius: 4px; font-size: 0.8em;">
+        %(category)s
+    </span>
+    <p class="bashkir-text" style="margin-top: 10px;">%(bashkir)s</p>
+    <p class="russian-text">🇷🇺 %(russian)s</p>
+    <p class="english-text">🇬🇧 %(english)s</p>
+</div>"""
+
+TIMELINE_EVENT_TPL = """<div style="display: flex; margin: 10px 0;">
+    <div style="min-width: 80px; padding: 8px; background: #0066B3; color: white; border-radius: 8px; text-align: center; font-weight: bold;">
+        %(year)s
+    </div>
+    <div style="flex: 1; padding: 8px 15px; background: #e6f2ff; border-radius: 8px; margin-left: 10px; border-left: 3px solid #00AF66;">
+        %(event)s
+    </div>
+</div>"""
+
+CULTURAL_FACT_CARD_TPL = """<div class="word-card">
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
+        <span style="background: %(color)s; color: white; padding: 2px 8px; border-radius: 4px; font-size: 0.8em;">
+            %(category)s
+        </span>
+        <span style="color: #666; font-size: 0.9em;">%(year)s</span>
+    </div>
+    <h4 style="color: #00AF66; margin: 5px 0;">%(title)s</h4>
+    <p style="color: #004d00;">%(content)s</p>
+</div>"""
+
+
+FACT_CARD_TPL = """<div class="word-card">
+    <span style="background: %(color)s; color: white; padding: 2px 8px; border-radius: 4px; font-size: 0.8em;">
+        %(category)s
+    </span>
+    <h4 style="color: #00AF66; margin: 10px 0;">%(title)s</h4>
+    <p style="color: #333;">%(content)s</p>
+</div>"""
+
+CHANNEL_CARD_TPL = """<div class="channel-card">
+    <h4 style="color: #00AF66; margin: 0;">%(icon)s %(name)s</h4>
+    <p style="color: #aaa; margin: 5px 0;">%(description)s</p>
+    <small style="color: #666;">Stream: %(stream_url)s</small>
+</div>"""
+
+TV_GUIDE_TPL = """<div class="tv-container">
+<div class="tv-guide">
+<div>
+<h4>📺 Available Channels</h4>
+%(channels)s
+</div>
+<div>
+<h4>🕐 TV Schedule (Sample)</h4>
+<p><strong>%(schedule_title)s</strong></p>
+<ul>%(schedule)s</ul>
+</div>
+</div>
+</div>"""
+
+SCHEDULE_ITEM_TPL = """<li>%(time)s — %(title)s</li>"""
+
+STAT_BOX_TPL = """<div class="stat-box">
+    <h3>%(icon)s</h3>
+    <h2>%(value)s</h2>
+    <p>%(label)s</p>
+</div>"""
+
+SAMPLE_VIDEO_TPL = """<div class="stat-box" style="text-align: center;">
+    <h5>%(title)s</h5>
+    <p style="font-size: 0.9em; color: #666;">%(desc)s</p>
+</div>"""
+
+FEED_CARD_TPL = """<div class="word-card" style="border-left: 4px solid #0088cc;">
+    <h4 style="color: #004d00; margin-bottom: 5px;">%(title)s</h4>
+    <p style="color: #333; margin: 10px 0;">%(preview)s</p>
+    <div style="display: flex; justify-content: space-between; color: #666; font-size: 0.9em;">
+        <span>â° %(date)s</span>
+        <span>👀️ %(engagement)s</span>
+    </div>
+</div>"""
+
+LETTER_TILE_TPL = """<div style="background: %(bg_color)s; color: %(text_color)s; padding: 10px;
+            text-align: center; border-radius: 8px; font-size: 1.5em;
+            font-weight: bold; margin: 2px; border: 2px solid #0066B3;">
+    %(letter)s
+</div>"""
+
+
+@st.cache_data(show_spinner=False)
+def render_vocab_row_html(words: tuple) -> str:
+    """
+    A row of vocabulary cards as one grid element.
+
+    ``words`` is a tuple of (bashkir, phonetic, english) tuples; the row has
+    one column per word so controls rendered in ``st.columns`` below line up.
+    """
+    cards_html = "".join(
+        WORD_CARD_TPL % dict(bashkir=bashkir, phonetic=phonetic, english=english)
+        for bashkir, phonetic, english in words
+    )
+    return (
+        f'<div class="word-card-row" style="grid-template-columns: repeat({len(words)}, 1fr);">'
+        f'{cards_html}</div>'
+    )
+
+
+@st.cache_data(show_spinner=False)
+def render_category_row_html(words: tuple, cols: int) -> str:
+    """
+    A row of Audio Dictionary category cards as one grid element.
+
+    ``words`` is a tuple of (bashkir, ipa, english, russian) tuples; the grid
+    always has ``cols`` columns so a short last row still lines up with the
+    ``st.columns(cols)`` controls rendered below it.
+    """
+    cards_html = "".join(
+        CATEGORY_CARD_TPL % dict(bashkir=bashkir, ipa=ipa, english=english, russian=russian)
+        for bashkir, ipa, english, russian in words
+    )
+    return (
+        f'<div class="word-card-row" style="grid-template-columns: repeat({cols}, 1fr);">'
+        f'{cards_html}</div>'
+    )
+
+
+@st.cache_data(show_spinner=False)
+def render_station_card_html(station_id, title: str, bashkir: str, summary: str, color: str, icon: str = "📍") -> str:
+    """Golden Light memory-palace station header card."""
+    return STATION_CARD_TPL % dict(
+        station_id=station_id, title=title, bashkir=bashkir,
+        summary=summary, color=color, icon=icon,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def render_reason_card_html(reason_id, title: str, description: str, icon: str, bashkir_term: str) -> str:
+    """Independence page reason card."""
+    return REASON_CARD_TPL % dict(
+        reason_id=reason_id, title=title, description=description,
+        icon=icon, bashkir_term=bashkir_term,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def render_legacy_proverb_html(bashkir: str, english: str, russian: str, phonetic: str) -> str:
+    """Golden Light legacy proverb banner."""
+    return LEGACY_PROVERB_TPL % dict(
+        bashkir=bashkir, english=english, russian=russian, phonetic=phonetic,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def render_epic_proverb_html(bashkir: str, english: str, phonetic: str) -> str:
+    """Ural-Batyr legacy proverb banner."""
+    return EPIC_PROVERB_TPL % dict(bashkir=bashkir, english=english, phonetic=phonetic)
+
+
+@st.cache_data(show_spinner=False)
+def render_alphabet_grid_html(letters: tuple, cols: int) -> str:
+    """
+    Alphabet as one grid element of letter tiles.
+
+    ``letters`` is a tuple of (letter, is_special) pairs; special Bashkir
+    letters get the flag-green tile.
+    """
+    tiles_html = "".join(
+        LETTER_TILE_TPL % dict(
+            bg_color='#00AF66' if is_special else '#e6f2ff',
+            text_color='white' if is_special else '#004d00',
+            letter=letter,
+        )
+        for letter, is_special in letters
+    )
+    return (
+        f'<div style="display: grid; grid-template-columns: repeat({cols}, 1fr);">'
+        f'{tiles_html}</div>'
+    )
+
+
+def render_stat_row_html(stats: tuple) -> str:
+    """
+    A row of stat boxes as one grid element.
+
+    ``stats`` is a tuple of (icon, value, label) tuples, one column each.
+    Not cached: the values are per-user counts, and formatting is cheap.
+    """
+    boxes_html = "".join(
+        STAT_BOX_TPL % dict(icon=icon, value=value, label=label) for icon, value, label in stats
+    )
+    return (
+        f'<div class="stat-row" style="grid-template-columns: repeat({len(stats)}, 1fr);">'
+        f'{boxes_html}</div>'
+    )
+
+
+@st.cache_data(show_spinner=False)
+def render_tv_guide_html() -> str:
+    """Media TV Guide: channel cards and tonight's schedule in one dimmed container."""
+    return TV_GUIDE_TPL % dict(
+        channels="".join(CHANNEL_CARD_TPL % channel for channel in TV_CHANNELS),
+        schedule_title=TV_SCHEDULE_TITLE,
+        schedule="".join(SCHEDULE_ITEM_TPL % dict(time=time, title=title) for time, title in TV_SCHEDULE),
+    )
+
+
+@st.cache_data(show_spinner=False)
+def render_sample_videos_html() -> str:
+    """Media sample video tiles as one three-column grid."""
+    return '<div class="video-grid">%s</div>' % "".join(SAMPLE_VIDEO_TPL % video for video in SAMPLE_VIDEOS)
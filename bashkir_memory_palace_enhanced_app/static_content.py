@@ -0,0 +1,332 @@
+"""
+Static Page Content
+===================
+Immutable constants shared by the app pages: colour maps, the Four Birds
+cosmology cards, the Four Birds quiz, the Media page channel, schedule, feed,
+sample video and download listings, the special Bashkir letters and their
+quick-reference table, BashkortNet relation headings, the Review reflection
+prompts and the fixed HTML banners.
+
+Kept in an imported module so they are built once per process rather than
+on every Streamlit rerun of app.py. Mappings are read-only
+(``MappingProxyType``) and lists are tuples.
+"""
+
+from types import MappingProxyType
+
+
+def _frozen_records(records):
+    """Freeze a list of dicts into a tuple of read-only mappings."""
+    return tuple(
+        MappingProxyType({k: tuple(v) if isinstance(v, list) else v for k, v in record.items()})
+        for record in records
+    )
+
+
+# Golden Light station colour names -> hex
+STATION_COLOR_MAP = MappingProxyType({
+    'emerald': '#00AF66', 'sky': '#0066B3', 'blue': '#0044AA',
+    'amber': '#d4af37', 'red': '#cc3333', 'purple': '#8B5CF6',
+    'orange': '#F97316', 'cyan': '#06B6D4', 'slate': '#64748B'
+})
+
+# Geography city type -> badge colour
+CITY_TYPE_COLORS = MappingProxyType({'capital': '#d4af37', 'major': '#0066B3', 'city': '#00AF66'})
+
+# Geography fact category -> badge colour
+FACT_CATEGORY_COLORS = MappingProxyType({'geography': '#0066B3', 'nature': '#00AF66', 'resources': '#d4af37'})
+
+
+# --- Four Birds of Ibn Arabi ---
+BIRDS = _frozen_records([
+    {
+        "name": "Eagle",
+        "arabic": "العقل الأول",
+        "english": "First Intellect",
+        "symbol": "🦅",
+        "color": "eagle",
+        "locus": "Ufa",
+        "domain": "Civic & Legal Knowledge",
+        "description": """The Eagle represents the First Intellect (al-'Aql al-Awwal) —
+        the primordial light of knowledge from which all understanding flows.
+        At Ufa, we encounter constitutional knowledge, legal rights, and civic identity.
+        The Eagle sees the whole landscape from above; it knows the law that governs.""",
+        "vocabulary": ["Башҡортостан", "халыҡ", "иркенлек", "тел", "конституция"]
+    },
+    {
+        "name": "Crow",
+        "arabic": "الجسم الكلي",
+        "english": "Universal Body",
+        "symbol": "🐦‍⬛",
+        "color": "crow",
+        "locus": "Shulgan-Tash",
+        "domain": "Ancestral Memory & Nature",
+        "description": """The Crow represents Universal Body (al-Jism al-Kulli) —
+        matter infused with spirit, darkness containing light. In the cave's depths,
+        we find manifestation: the physical traces of spiritual vision painted on stone.
+        The Crow guards what was; it remembers what others forget.""",
+        "vocabulary": ["ҡояш", "ай", "таш", "һыу", "йылға", "Ағиҙел"]
+    },
+    {
+        "name": "Anqa",
+        "arabic": "الهيولى",
+        "english": "Prime Matter",
+        "symbol": "🔥🕊️",
+        "color": "anqa",
+        "locus": "Yamantau",
+        "domain": "Potential & Transformation",
+        "description": """The Anqa represents Prime Matter (al-HayÅ«lÄ) —
+        pure potentiality, the 'name without a body.' Like the mythical phoenix,
+        it exists in the realm of possibility. At Yamantau ('Bad Mountain'),
+        danger and transformation intertwine. From difficulty comes growth.""",
+        "vocabulary": ["тау", "ел", "урман", "ҡурҡыныс", "күл", "яман", "ҙур"]
+    },
+    {
+        "name": "Ringdove",
+        "arabic": "النفس الكلية",
+        "english": "Universal Soul",
+        "symbol": "🕊️",
+        "color": "ringdove",
+        "locus": "Beloretsk & Bizhbulyak",
+        "domain": "Daily Life & Community",
+        "description": """The Ringdove represents Universal Soul (al-Nafs al-Kulliyya) —
+        the receptive, nurturing principle that brings potential into form.
+        At Beloretsk, raw ore becomes steel through patient work.
+        At Bizhbulyak, family, food, and music create the texture of daily life.""",
+        "vocabulary": ["эш", "болат", "оҫта", "бал", "ата", "әсә", "өй", "ҡурай", "ат"]
+    }
+])
+
+
+# --- Four Birds quiz ---
+QUIZ_QUESTIONS = _frozen_records([
+    {
+        "question": "Which bird represents civic knowledge and legal rights?",
+        "options": ["Crow", "Eagle", "Anqa", "Ringdove"],
+        "correct": "Eagle"
+    },
+    {
+        "question": "At which location would you find the Crow?",
+        "options": ["Ufa", "Shulgan-Tash", "Yamantau", "Beloretsk"],
+        "correct": "Shulgan-Tash"
+    },
+    {
+        "question": "Which bird represents transformation and potential?",
+        "options": ["Eagle", "Crow", "Anqa", "Ringdove"],
+        "correct": "Anqa"
+    }
+])
+
+QUIZ_ANSWERS = tuple(q["correct"] for q in QUIZ_QUESTIONS)
+
+
+# --- Media page: Bashkir TV channels ---
+TV_CHANNELS = _frozen_records([
+    {
+        "name": "БСТ (Bashkir Satellite Television)",
+        "description": "Main Bashkir language broadcaster - news, culture, entertainment",
+        "stream_url": "https://bst.tv/live",
+        "icon": "📡"
+    },
+    {
+        "name": "Ðšурай ТВ (Kuray TV)",
+        "description": "Music and cultural programs featuring traditional Bashkir arts",
+        "stream_url": "https://kuray.tv",
+        "icon": "🎵"
+    },
+    {
+        "name": "Салават Юлаев ТВ",
+        "description": "Sports channel - hockey and regional sports coverage",
+        "stream_url": "#",
+        "icon": "💬"
+    },
+    {
+        "name": "Тамыр (Tamyr)",
+        "description": "Children's programming in Bashkir language",
+        "stream_url": "#",
+        "icon": "👶"
+    }
+])
+
+# --- Media page: sample TV schedule ---
+TV_SCHEDULE_TITLE = "БСТ Tonight:"
+TV_SCHEDULE = (
+    ("18:00", "Хәбәрҙәр (News)"),
+    ("19:00", "Йырҙар (Songs)"),
+    ("20:00", "Ó˜киәт (Folk Tales)"),
+    ("21:00", "Документаль (Documentary)"),
+)
+
+# --- Media page: Real Russia feed entries ---
+FEED_ENTRIES = _frozen_records([
+    {
+        "title": "Exploring Bashkir Villages",
+        "preview": "Today we visited a traditional Bashkir village where honey is still harvested the ancient way...",
+        "date": "2 hours ago",
+        "engagement": "1.2K views"
+    },
+    {
+        "title": "Russian Language Tips",
+        "preview": "Quick lesson on common mistakes foreigners make when speaking Russian...",
+        "date": "Yesterday",
+        "engagement": "3.4K views"
+    },
+    {
+        "title": "Ural Mountains Winter",
+        "preview": "The Southern Urals are magical in winter. Here's what it's like to hike in -20Â°C...",
+        "date": "3 days ago",
+        "engagement": "5.6K views"
+    },
+    {
+        "title": "Local Food Guide: Ufa",
+        "preview": "The best places to try authentic Bashkir cuisine in the capital city...",
+        "date": "1 week ago",
+        "engagement": "8.2K views"
+    }
+])
+
+# --- Media page: sample video tiles ---
+SAMPLE_VIDEOS = _frozen_records([
+    {"title": "Bashkir Alphabet Song", "desc": "Learn the letters through music"},
+    {"title": "Ural-Batyr Animation", "desc": "The epic legend told visually"},
+    {"title": "Kuray Performance", "desc": "Traditional Bashkir flute music"}
+])
+
+# --- Media page: downloadable PDFs ---
+PDF_RESOURCES = _frozen_records([
+    {"name": "Bashkir Alphabet Chart", "size": "1.2 MB", "desc": "Complete 42-letter alphabet with examples"},
+    {"name": "Basic Phrases Guide", "size": "850 KB", "desc": "100 essential phrases for beginners"},
+    {"name": "Grammar Reference", "size": "2.4 MB", "desc": "Comprehensive Bashkir grammar guide"},
+    {"name": "OCM Cultural Categories", "size": "1.8 MB", "desc": "Outline of Cultural Materials reference"}
+])
+
+# --- Media page: downloadable audio ---
+AUDIO_RESOURCES = _frozen_records([
+    {"name": "Alphabet Pronunciation", "duration": "5:30", "desc": "All 42 letters spoken clearly"},
+    {"name": "Basic Vocabulary Pack", "duration": "15:00", "desc": "First 100 words with repetition"},
+    {"name": "Kuray Music Collection", "duration": "45:00", "desc": "Traditional flute performances"},
+    {"name": "Ural-Batyr Epic Reading", "duration": "2:30:00", "desc": "Complete epic narration"}
+])
+
+# --- Media page: downloadable texts ---
+TEXT_RESOURCES = _frozen_records([
+    {"name": "Word List (JSON)", "format": "JSON", "desc": "Complete vocabulary database"},
+    {"name": "Sentence Patterns", "format": "TXT", "desc": "Common sentence structures"},
+    {"name": "Cultural Context Notes", "format": "MD", "desc": "OCM-categorized cultural information"},
+    {"name": "Memory Palace Map", "format": "JSON", "desc": "Loci data with Ibn Arabi connections"}
+])
+
+
+# --- Alphabet page: Bashkir letters not found in Russian ---
+SPECIAL_LETTERS = frozenset({'Ó˜', 'Ө', 'Ò®', 'Ò’', 'Ò ', 'Ò¢', 'Ò˜', 'Òª', 'Òº'})
+
+
+# --- Alphabet page: quick-reference table, column -> values ---
+ALPHABET_REFERENCE = MappingProxyType({
+    "Letter": (
+        "Ó˜",
+        "Ө",
+        "Ò®",
+        "Ò’",
+        "Ò ",
+        "Ò¢",
+        "Ò˜",
+        "Òª",
+        "Òº",
+    ),
+    "IPA": (
+        "/Ã¦/",
+        "/Ã¸/",
+        "/y/",
+        "/Ê/",
+        "/q/",
+        "/Å‹/",
+        "//",
+        "/Î¸/",
+        "/h/",
+    ),
+    "Similar To": (
+        "'a' in \"cat\"",
+        "German 'Ã¶'",
+        "German 'Ã¼'",
+        "Arabic 'Øº' (gh)",
+        "Deep throat 'k'",
+        "'ng' in \"sing\"",
+        "'th' in \"this\"",
+        "'th' in \"think\"",
+        "'h' in \"house\"",
+    ),
+    "Example": (
+        "әсә (mother)",
+        "өй (house)",
+        "үҙ (self)",
+        "ғаилә (family)",
+        "ҡыҙ (girl)",
+        "таÒ£ (dawn)",
+        "ҙур (big)",
+        "ҫәс (hair)",
+        "һыу (water)",
+    ),
+})
+
+
+# --- BashkortNet page: semantic relation headings ---
+RELATION_LABELS = MappingProxyType({
+    'SYN': '🔄 Synonyms',
+    'ANT': 'â†”️ Antonyms',
+    'ISA': 'â¬†️ Is a type of',
+    'HAS_TYPE': 'â¬‡️ Types',
+    'PART_OF': '🧩 Part of',
+    'HAS_PART': '🔧 Has parts',
+    'CULT_ASSOC': '🛕️ Cultural',
+    'MYTH_LINK': '📜 Mythological'
+})
+
+
+# --- Review page: post-session reflection prompts ---
+REVIEW_REFLECTION_PROMPTS = (
+    "What word surprised you today?",
+    "Which word do you feel you truly *know* now?",
+    "What distracted you during this session? (logismoi)",
+    "Did any word connect to your personal life?",
+    "What would help you remember these words better?",
+)
+
+
+# --- Fixed HTML banners ---
+INDEPENDENCE_INTRO_HTML = """
+<div style="background: linear-gradient(135deg, #f5f5dc 0%, #ede6cc 100%);
+            padding: 25px; border-radius: 15px; margin: 20px 0;
+            border: 2px solid #8B7355; box-shadow: 0 4px 15px rgba(139,115,85,0.2);">
+    <div style="text-align: center;">
+        <span style="font-size: 3em;">📜⚖️📜</span>
+        <h3 style="color: #4a3728; margin: 15px 0;">A Declaration of Rights</h3>
+        <p style="color: #5a4738; font-style: italic;">
+            "International law supports self-determination for peoples under colonial rule."
+        </p>
+    </div>
+</div>
+"""
+
+KIERKEGAARD_CATEGORIES_HTML = """
+<div class="meditation-box">
+    <em>"The question is, under what categories one wants to contemplate
+    the entire world and would oneself live."</em>
+    <br>— Kierkegaard, Either/Or
+</div>
+"""
+
+WITTGENSTEIN_LIMIT_HTML = """
+<div class="meditation-box" style="border-color: #cc3333;">
+    <h4>🔇 The Limit of Language (Wittgenstein)</h4>
+    <p><em>"There are indeed, things that are inexpressible.
+    They show themselves. That is the mystical."</em> — Tractatus 6.522</p>
+
+    <p>The Anqa's transformation cannot be fully described.
+    It can only be <strong>undergone</strong>.
+    No words in this app will make you a Bashkir speaker.
+    Only practice, commitment, and the leap.</p>
+
+    <p style="text-align: center; font-size: 1.5em;">🔥🕊️</p>
+</div>
+"""
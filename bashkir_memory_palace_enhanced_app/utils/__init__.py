@@ -1,11 +1,15 @@
 """
 Shared Utilities for Bashkir Dictionary Applications
 =====================================================
-Common utilities including retry logic, precaching, and error handling.
+Common utilities including retry logic, precaching, media caching, pooled
+TTS requests, and error handling.
 """
 
 from .retry import retry_with_backoff, RetryConfig
 from .precache import PrecacheManager, precache_audio, precache_models
+from .media_cache import LRUMediaCache
+from .word_bitset import WordBitset
+from .tts_session import new_tts_session, stream_tts
 
 __all__ = [
     'retry_with_backoff',
@@ -13,4 +17,8 @@ __all__ = [
     'PrecacheManager',
     'precache_audio',
     'precache_models',
+    'LRUMediaCache',
+    'WordBitset',
+    'new_tts_session',
+    'stream_tts',
 ]
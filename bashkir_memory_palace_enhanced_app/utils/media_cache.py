@@ -0,0 +1,198 @@
+"""
+Disk-Backed LRU Media Cache
+===========================
+Keeps generated media (TTS audio) on disk with a total size cap.
+Least-recently-used files are evicted once the cap is exceeded, and
+per-file metadata is persisted to an ``index.json`` sidecar.
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024  # 100 MB
+FLUSH_INTERVAL = 30.0  # Seconds between index writes for read-only changes
+
+
+class LRUMediaCache:
+    """
+    Size-capped LRU cache of media files keyed by content hash.
+
+    Usage:
+        cache = LRUMediaCache("audio_cache", max_bytes=100 * 1024 * 1024)
+
+        if key in cache:
+            audio = cache[key]
+        else:
+            cache[key] = generate(...)
+
+    Metadata per entry: ``size`` (bytes), ``mtime`` (last write), ``hits``.
+    Writes save the index at once; read recency and hit counts are saved at
+    most every ``FLUSH_INTERVAL`` seconds and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        suffix: str = ".mp3",
+        index_name: str = "index.json",
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.index_path = self.cache_dir / index_name
+        self._index: "OrderedDict[str, Dict]" = OrderedDict()
+        self._total_bytes = 0
+        self._dirty = False
+        self._last_save = 0.0
+        self._lock = threading.Lock()
+        self._load_index()
+        atexit.register(self.flush)
+
+    def path_for(self, key: str) -> Path:
+        """Return the on-disk path for a cache key."""
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def _load_index(self) -> None:
+        """Load the sidecar index and reconcile it with files on disk."""
+        entries = {}
+        if self.index_path.exists():
+            try:
+                entries = json.loads(self.index_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable media cache index: {e}")
+
+        # Adopt files written before the index existed as least recent, oldest first
+        adopted = {}
+        for path in sorted(self.cache_dir.glob(f"*{self.suffix}"), key=lambda p: p.stat().st_mtime):
+            key = path.stem
+            if key not in entries:
+                stat = path.stat()
+                adopted[key] = {'size': stat.st_size, 'mtime': stat.st_mtime, 'hits': 0}
+        entries = {**adopted, **entries}
+
+        for key, meta in entries.items():
+            if self.path_for(key).exists():
+                self._index[key] = meta
+                self._total_bytes += meta.get('size', 0)
+
+        self._evict()
+        self._save_index()
+
+    def _save_index(self) -> None:
+        """Persist the index sidecar (order is LRU -> MRU)."""
+        try:
+            tmp_path = self.index_path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(self._index), encoding='utf-8')
+            tmp_path.replace(self.index_path)
+            self._dirty = False
+            self._last_save = time.monotonic()
+        except OSError as e:
+            logger.warning(f"Could not write media cache index: {e}")
+
+    def _evict(self) -> None:
+        """Remove least-recently-used files until under the size cap."""
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            key, meta = self._index.popitem(last=False)
+            self._total_bytes -= meta.get('size', 0)
+            try:
+                self.path_for(key).unlink()
+            except FileNotFoundError:
+                pass
+            logger.info(f"Evicted {key} from media cache")
+            self._dirty = True
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, key: str) -> bytes:
+        with self._lock:
+            if key not in self._index:
+                raise KeyError(key)
+            try:
+                data = self.path_for(key).read_bytes()
+            except FileNotFoundError:
+                meta = self._index.pop(key)
+                self._total_bytes -= meta.get('size', 0)
+                self._dirty = True
+                raise KeyError(key)
+
+            self._index.move_to_end(key)
+            self._index[key]['hits'] = self._index[key].get('hits', 0) + 1
+            self._dirty = True
+            if time.monotonic() - self._last_save >= FLUSH_INTERVAL:
+                self._save_index()
+            return data
+
+    def get(self, key: str, default: Optional[bytes] = None) -> Optional[bytes]:
+        """Return cached bytes for ``key``, or ``default`` on a miss."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: str, data: bytes) -> None:
+        # Write beside the target and rename, so concurrent writers and
+        # readers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{key}.", suffix=".part")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_name, self.path_for(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+        self.register(key)
+
+    def register(self, key: str) -> None:
+        """Record a file already written to ``path_for(key)``."""
+        with self._lock:
+            size = self.path_for(key).stat().st_size
+            old = self._index.pop(key, None)
+            if old:
+                self._total_bytes -= old.get('size', 0)
+
+            self._index[key] = {
+                'size': size,
+                'mtime': time.time(),
+                'hits': old.get('hits', 0) if old else 0,
+            }
+            self._total_bytes += size
+            self._evict()
+            self._save_index()
+
+    def flush(self) -> None:
+        """Write pending metadata (hit counts, recency) to the sidecar."""
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of cached files in bytes."""
+        return self._total_bytes
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        return {
+            'entries': len(self._index),
+            'total_bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+        }
@@ -55,6 +55,9 @@ class PrecacheManager:
 
         # Stop when done
         manager.stop()
+
+    A task whose key is already queued or running is skipped, so pages
+    can re-request the same items on every rerun without piling up work.
     """
 
     def __init__(self, config: Optional[PrecacheConfig] = None):
@@ -70,6 +73,7 @@ class PrecacheManager:
             'in_progress': 0,
         }
         self._lock = threading.Lock()
+        self._pending: set = set()  # Keys of queued or running tasks
 
         # Audio generation function (to be set by the application)
         self._audio_generator: Optional[Callable[[str, str], Optional[str]]] = None
@@ -143,6 +147,7 @@ class PrecacheManager:
                         success = future.result(timeout=60)
                         with self._lock:
                             self._stats['in_progress'] -= 1
+                            self._pending.discard(task.key)
                             if success:
                                 self._stats['completed'] += 1
                             else:
@@ -154,6 +159,7 @@ class PrecacheManager:
                         with self._lock:
                             self._stats['in_progress'] -= 1
                             self._stats['failed'] += 1
+                            self._pending.discard(task.key)
                         logger.error(f"Precache task failed for {task.key}: {e}")
 
             except Exception as e:
@@ -193,6 +199,15 @@ class PrecacheManager:
             logger.error(f"Error executing precache task {task.key}: {e}")
             return False
 
+    def _enqueue(self, task: PrecacheTask) -> None:
+        """Queue a task unless one with the same key is queued or running."""
+        with self._lock:
+            if task.key in self._pending:
+                return
+            self._pending.add(task.key)
+            self._stats['queued'] += 1
+        self._task_queue.put(task)
+
     def add_audio_task(
         self,
         text: str,
@@ -210,9 +225,7 @@ class PrecacheManager:
             priority=priority,
             callback=callback,
         )
-        self._task_queue.put(task)
-        with self._lock:
-            self._stats['queued'] += 1
+        self._enqueue(task)
 
     def add_model_task(
         self,
@@ -231,9 +244,7 @@ class PrecacheManager:
             priority=priority,
             callback=callback,
         )
-        self._task_queue.put(task)
-        with self._lock:
-            self._stats['queued'] += 1
+        self._enqueue(task)
 
     def add_batch_audio_tasks(
         self,
@@ -260,9 +271,11 @@ class PrecacheManager:
         """Clear all pending tasks."""
         while not self._task_queue.empty():
             try:
-                self._task_queue.get_nowait()
+                task = self._task_queue.get_nowait()
             except:
                 break
+            with self._lock:
+                self._pending.discard(task.key)
         with self._lock:
             self._stats['queued'] = 0
 
@@ -0,0 +1,72 @@
+"""
+Pooled gTTS Requests
+====================
+gTTS opens a fresh ``requests.Session`` for every request it sends, so each
+clip pays a new TCP + TLS handshake. These helpers send a gTTS object's
+prepared requests through one shared keep-alive session instead, letting
+consecutive clips (and the background precache workers) reuse connections.
+
+This relies on gTTS internals (``gTTS._prepare_requests`` and the
+response format), so requirements.txt caps gTTS below the next major
+version. If the private method is missing, ``stream_tts`` falls back to the
+public ``gTTS.stream()`` without the shared session.
+
+gTTS and requests are optional dependencies and are imported on first use.
+"""
+
+import base64
+import re
+import urllib.request
+from typing import Any, Iterator
+
+# Audio payload inside a batchexecute response line
+_AUDIO_RE = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
+
+def new_tts_session(pool_maxsize: int = 16) -> Any:
+    """
+    Create a ``requests.Session`` with a keep-alive connection pool.
+
+    ``pool_maxsize`` should cover the number of threads synthesizing at
+    once; extra threads block on the pool rather than opening connections.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=True))
+    return session
+
+
+def stream_tts(tts: Any, session: Any) -> Iterator[bytes]:
+    """
+    Yield the MP3 chunks for a ``gTTS`` object, sent over ``session``.
+
+    Mirrors ``gTTS.stream()`` except for the shared session, and raises
+    ``gTTSError`` on the same failures.
+    """
+    prepare_requests = getattr(tts, "_prepare_requests", None)
+    if prepare_requests is None:
+        yield from tts.stream()
+        return
+
+    import requests
+    from gtts.tts import gTTSError
+
+    proxies = urllib.request.getproxies()
+    for prepared in prepare_requests():
+        try:
+            response = session.send(request=prepared, proxies=proxies)
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            raise gTTSError(tts=tts, response=response) from e
+        except requests.exceptions.RequestException as e:
+            raise gTTSError(tts=tts) from e
+
+        for line in response.iter_lines(chunk_size=1024):
+            decoded_line = line.decode("utf-8")
+            if "jQ1olc" in decoded_line:
+                audio_search = _AUDIO_RE.search(decoded_line)
+                if not audio_search:
+                    raise gTTSError(tts=tts, response=response)
+                yield base64.b64decode(audio_search.group(1).encode("ascii"))
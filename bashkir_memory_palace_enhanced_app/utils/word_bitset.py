@@ -0,0 +1,90 @@
+"""
+Word Bitset
+===========
+Compact learned-word set backed by a bytearray, one bit per vocabulary entry.
+
+Words are addressed by their vocabulary id (``word_id``), so
+membership and updates are bit operations and counting is a popcount rather
+than hashing Cyrillic strings. The class keeps the subset of the ``set`` API
+the app relies on (``add``, ``discard``, ``in``, ``len``, iteration), so it
+can stand in for a set of headwords.
+"""
+
+from typing import Iterable, Iterator, Mapping, Optional, Sequence
+
+
+class WordBitset:
+    """
+    Set of vocabulary headwords stored as a bitset.
+
+    Usage:
+        positions = {"бал": 0, "һыу": 1, "тау": 2}
+        headwords = ("бал", "һыу", "тау")
+        learned = WordBitset(positions, headwords)
+        learned.add("тау")
+
+        "тау" in learned    # True
+        len(learned)        # 1
+        learned.is_learned(2)  # True
+
+    ``positions`` maps each headword to the id whose bit it uses, and
+    ``headwords`` maps ids back to headwords for iteration. The two are
+    passed separately, so ids need not be dense or match dict order. A
+    headword listed under several ids uses the bit ``positions`` gives it.
+    Headwords missing from ``positions`` are ignored on add and never
+    reported as members.
+    """
+
+    __slots__ = ('_positions', '_headwords', '_bits')
+
+    def __init__(
+        self,
+        positions: Mapping[str, int],
+        headwords: Sequence[str],
+        items: Optional[Iterable[str]] = None,
+    ):
+        self._positions = positions
+        self._headwords = headwords
+        size = max(positions.values(), default=-1) + 1
+        self._bits = bytearray((size + 7) // 8)
+        if items:
+            for item in items:
+                self.add(item)
+
+    def is_learned(self, word_id: int) -> bool:
+        """Check the bit for a vocabulary position."""
+        return bool((self._bits[word_id >> 3] >> (word_id & 7)) & 1)
+
+    def add(self, headword: str) -> None:
+        word_id = self._positions.get(headword)
+        if word_id is not None:
+            self._bits[word_id >> 3] |= 1 << (word_id & 7)
+
+    def discard(self, headword: str) -> None:
+        word_id = self._positions.get(headword)
+        if word_id is not None:
+            self._bits[word_id >> 3] &= ~(1 << (word_id & 7)) & 0xFF
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+
+    def __contains__(self, headword: str) -> bool:
+        word_id = self._positions.get(headword)
+        return word_id is not None and self.is_learned(word_id)
+
+    def __len__(self) -> int:
+        return bin(int.from_bytes(self._bits, 'little')).count('1')
+
+    def __iter__(self) -> Iterator[str]:
+        bits = self._bits
+        for byte_idx, byte in enumerate(bits):
+            while byte:
+                low = byte & -byte
+                yield self._headwords[(byte_idx << 3) + low.bit_length() - 1]
+                byte ^= low
+
+    def __bool__(self) -> bool:
+        return any(self._bits)
+
+    def __repr__(self) -> str:
+        return f"WordBitset({len(self)} of {len(self._positions)})"